@@ -0,0 +1,359 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Package Manager Benchmarks
+    \n
+    Generates synthetic projects of increasing sizes (and a fake site-packages tree), then records wall time and peak memory
+    of 'PackageManager' entry points on each of them, so scaling regressions show up as curves.
+    Everything runs offline, every measurement runs in a fresh interpreter.
+
+    #### Usage:
+        >>> python Benchmark.py
+        >>> python Benchmark.py --sizes 10,100,1000 --lines 200 --fan-out 4 --depth 6 --repeat 5 --output results.json
+"""
+
+############ AUTHOURSHIP & COPYRIGHTS ############
+__author__      = "Abdullrahman Elsayed"
+__copyright__   = "Copyright 2022, Supportive Python Modules Project"
+__credits__     = "Abdullrahman Elsayed"
+__license__     = "MIT"
+__maintainer__  = "Abdullrahman Elsayed"
+__email__       = "abdull15199@gmail.com"
+__status__      = "Production"
+##################################################
+
+import argparse, json, os, random, shutil, subprocess, sys, tempfile, time, tracemalloc
+
+# Measured entry points, in report order
+ENTRY_POINTS = ('GetInstalledPackages', 'GetImportedPackages', 'GetRequiredPackages', 'GetRequiredPackagesDeepScan', 'ExportRequirements')
+
+# Std-lib modules imported by generated files, so classification has something to filter out
+STD_MODULES = ('collections', 'functools', 'itertools', 'json', 'os', 're', 'sys', 'typing')
+
+def WriteFillerLines(Lines: int, Seed: int) -> list:
+    """
+        Generates code without imports, so files reach the requested size.
+
+        #### Args:
+            - Lines (int): Number of lines to be generated (approximately, functions are never split).
+            - Seed (int): Varies generated names and constants.
+
+        #### Returns:
+            - list: Code lines.
+    """
+
+    code_lines = []
+    block = 0
+
+    while (len(code_lines) < Lines):
+        code_lines.extend([
+            f'',
+            f'def function_{Seed}_{block}(value, factor={block + 1}):',
+            f'    """Generated function {block}."""',
+            f'    result = [item * factor for item in range(int(value))]',
+            f'    return sum(result) + len(str(value))',
+            f'',
+            f'CONSTANT_{block} = function_{Seed}_{block}({block % 7})',
+        ])
+        block += 1
+
+    return code_lines
+
+def GenerateSitePackages(SiteDir: str, Packages: int = 20, FilesPerPackage: int = 5, LinesPerFile: int = 50, Seed: int = 0) -> list:
+    """
+        Generates a fake site-packages directory: installed packages importing each other, with distributions metadata ('.dist-info').
+
+        #### Args:
+            - SiteDir (str): Directory to be generated.
+            - Packages (int, optional): Number of packages. Defaults to 20.
+            - FilesPerPackage (int, optional): Modules of every package ('__init__.py' included). Defaults to 5.
+            - LinesPerFile (int, optional): Lines of every module. Defaults to 50.
+            - Seed (int, optional): Random seed, the same seed generates the same tree. Defaults to 0.
+
+        #### Returns:
+            - list: Generated packages names.
+    """
+
+    randomizer = random.Random(Seed)
+    packages_names = [f'thirdparty_{index}' for index in range(int(Packages))]
+
+    for index, package_name in enumerate(packages_names):
+        package_dir = f'{SiteDir}/{package_name}'
+        os.makedirs(package_dir, exist_ok=True)
+
+        # Packages only depend on packages generated before them, like real distributions do
+        dependencies = sorted(randomizer.sample(packages_names[:index], k=min(index, 2)))
+        record_lines = []
+
+        for module_index in range(int(FilesPerPackage)):
+            module_name = '__init__' if (module_index == 0) else f'module_{module_index}'
+            import_lines = [f'import {randomizer.choice(STD_MODULES)}'] + [f'import {dependency}' for dependency in dependencies]
+
+            if (module_index > 0):
+                import_lines.append(f'from . import module_{randomizer.randint(1, module_index)}' if (module_index > 1) else f'from . import __init__')
+
+            with open(f'{package_dir}/{module_name}.py', 'w') as module_file:
+                module_file.write('\n'.join(import_lines + WriteFillerLines(Lines=LinesPerFile, Seed=module_index)) + '\n')
+
+            record_lines.append(f'{package_name}/{module_name}.py,,')
+
+        distribution_name = package_name.replace('_', '-')
+        dist_info_dir = f'{SiteDir}/{package_name}-1.0.{index}.dist-info'
+        os.makedirs(dist_info_dir, exist_ok=True)
+
+        with open(f'{dist_info_dir}/METADATA', 'w') as metadata_file:
+            metadata_file.write(f'Metadata-Version: 2.1\nName: {distribution_name}\nVersion: 1.0.{index}\n')
+            metadata_file.writelines([f'Requires-Dist: {dependency.replace("_", "-")}\n' for dependency in dependencies])
+
+        with open(f'{dist_info_dir}/top_level.txt', 'w') as top_level_file:
+            top_level_file.write(f'{package_name}\n')
+
+        with open(f'{dist_info_dir}/RECORD', 'w') as record_file:
+            record_file.write('\n'.join(record_lines + [f'{os.path.basename(dist_info_dir)}/METADATA,,', f'{os.path.basename(dist_info_dir)}/RECORD,,']) + '\n')
+
+    return packages_names
+
+def GenerateProject(ProjectDir: str, Files: int = 100, LinesPerFile: int = 50, FanOut: int = 3, Depth: int = 4, Cycles: float = 0.1, DynamicImports: float = 0.1, ThirdParty: list | tuple = (), Seed: int = 0) -> str:
+    """
+        Generates a synthetic project: a main script and modules importing each other in layers.
+
+        #### Args:
+            - ProjectDir (str): Directory to be generated.
+            - Files (int, optional): Number of modules (main script excluded). Defaults to 100.
+            - LinesPerFile (int, optional): Lines of every module. Defaults to 50.
+            - FanOut (int, optional): Project modules imported by every module (from the next layer). Defaults to 3.
+            - Depth (int, optional): Number of layers, i.e. length of the longest import chain from the main script. Defaults to 4.
+            - Cycles (float, optional): Probability for a module to also import a module of a previous layer (import cycle). Defaults to 0.1.
+            - DynamicImports (float, optional): Probability for a module to import a package dynamically ('importlib.import_module()' or '__import__()'). Defaults to 0.1.
+            - ThirdParty (list | tuple, optional): Installed packages names the project may import. Defaults to ().
+            - Seed (int, optional): Random seed, the same seed generates the same project. Defaults to 0.
+
+        #### Returns:
+            - str: Main script path.
+    """
+
+    randomizer = random.Random(Seed)
+    os.makedirs(ProjectDir, exist_ok=True)
+
+    files_count = max(int(Files), 1)
+    depth = max(min(int(Depth), files_count), 1)
+    layers = [[f'module_{index}' for index in range(files_count) if (index * depth // files_count == layer)] for layer in range(depth)]
+
+    for layer, layer_modules in enumerate(layers):
+        for module_name in layer_modules:
+            import_lines = [f'import {randomizer.choice(STD_MODULES)}']
+
+            if (layer + 1 < depth):
+                import_lines.extend([f'import {imported}' for imported in randomizer.sample(layers[layer + 1], k=min(int(FanOut), len(layers[layer + 1])))])
+
+            if (layer > 0) and (randomizer.random() < float(Cycles)):
+                import_lines.append(f'import {randomizer.choice(layers[randomizer.randrange(layer)])}')
+
+            if (ThirdParty):
+                import_lines.append(f'import {randomizer.choice(ThirdParty)}')
+
+            if (randomizer.random() < float(DynamicImports)):
+                dynamic_import = randomizer.choice(list(ThirdParty) or list(STD_MODULES))
+                import_lines.extend(['import importlib', f"dynamic_module = importlib.import_module('{dynamic_import}')"] if (randomizer.random() < 0.5) else [f"dynamic_module = __import__('{dynamic_import}')"])
+
+            with open(f'{ProjectDir}/{module_name}.py', 'w') as module_file:
+                module_file.write('\n'.join(import_lines + WriteFillerLines(Lines=LinesPerFile, Seed=layer)) + '\n')
+
+    main_script_path = f'{ProjectDir}/main.py'
+
+    with open(main_script_path, 'w') as main_file:
+        main_file.write('\n'.join(['from PackageManager import AutoImporter', 'import os'] + [f'import {module_name}' for module_name in layers[0]]) + '\n')
+
+    return main_script_path
+
+def RunEntryPoint(EntryPoint: str, MainScript: str, SiteDir: str, Repeat: int = 3) -> dict:
+    """
+        Measures an entry point in the running interpreter (called by 'MeasureEntryPoint()' in a fresh interpreter).
+
+        #### Args:
+            - EntryPoint (str): One of 'ENTRY_POINTS'. 'GetInstalledPackages' measures 'PackageManager' construction, which scans the environment and collects installed packages.
+            - MainScript (str): Main script of the synthetic project, used as '__main__' script.
+            - SiteDir (str): Fake site-packages directory.
+            - Repeat (int, optional): Timed runs, the fastest one is reported. Defaults to 3.
+
+        #### Returns:
+            - dict: Return keys = Seconds, PeakBytes, Runs
+    """
+
+    # Project modules and fake installed packages must be importable, as if the project was run from its directory
+    sys.path[:0] = [os.path.dirname(MainScript), SiteDir]
+    sys.modules['__main__'].__file__ = MainScript
+
+    import PackageManager as PM
+
+    def __run() -> None:
+        if (EntryPoint == 'GetInstalledPackages'):
+            PM.PackageManager(CacheDir=False)
+            return None
+
+        manager = manager_queue.pop()
+
+        if (EntryPoint == 'GetImportedPackages'):
+            manager.GetImportedPackages(MainScript, True, True, False)
+        elif (EntryPoint == 'GetRequiredPackages'):
+            manager._PackageManager__GetRequiredPackages(PackagePath=MainScript, DeepScan=False)
+        elif (EntryPoint == 'GetRequiredPackagesDeepScan'):
+            manager._PackageManager__GetRequiredPackages(PackagePath=MainScript, DeepScan=True)
+        elif (EntryPoint == 'ExportRequirements'):
+            manager.ExportRequirements(ExportTo__main__Dir=True)
+        else:
+            raise ValueError(f"Unknown entry point '{EntryPoint}'")
+
+        return None
+
+    # Instances are constructed before timing (except when construction is what is measured), a fresh one for every run
+    manager_queue = [PM.PackageManager(CacheDir=False) for _ in range(int(Repeat) + 1)] if (EntryPoint != 'GetInstalledPackages') else []
+    runs = []
+
+    for _ in range(int(Repeat)):
+        started_at = time.perf_counter()
+        __run()
+        runs.append(time.perf_counter() - started_at)
+
+    # Memory is traced in a separate run, tracing slows every allocation down
+    tracemalloc.start()
+    __run()
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return dict({'Seconds': min(runs), 'PeakBytes': peak_bytes, 'Runs': runs})
+
+def MeasureEntryPoint(EntryPoint: str, MainScript: str, SiteDir: str, Repeat: int = 3) -> dict:
+    """
+        Measures an entry point in a fresh interpreter, so imports and caches of previous measurements never leak into it.
+
+        #### Args:
+            - EntryPoint (str): One of 'ENTRY_POINTS'.
+            - MainScript (str): Main script of the synthetic project.
+            - SiteDir (str): Fake site-packages directory.
+            - Repeat (int, optional): Timed runs, the fastest one is reported. Defaults to 3.
+
+        #### Returns:
+            - dict: Return keys = Seconds, PeakBytes, Runs (or Error if the measurement failed)
+    """
+
+    result_path = f'{os.path.dirname(MainScript)}/result-{EntryPoint}.json'
+
+    # Nothing may be installed, cached, nor printed while measuring
+    environment = dict(os.environ)
+    environment.pop('PACKAGEMANAGER_CACHE_DIR', None)
+    environment.update({'PACKAGEMANAGER_MODE': 'off', 'PACKAGEMANAGER_PROGRESS': 'off', 'PYTHONDONTWRITEBYTECODE': '1'})
+
+    process = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', json.dumps([EntryPoint, MainScript, SiteDir, int(Repeat), result_path])], env=environment, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+    if (process.returncode != 0) or (not os.path.isfile(result_path)):
+        return dict({'Error': process.stderr.decode(errors='ignore').strip().splitlines()[-1:]})
+
+    with open(result_path, 'r') as result_file:
+        return json.load(result_file)
+
+def RunBenchmarks(Sizes: list, LinesPerFile: int = 50, FanOut: int = 3, Depth: int = 4, Cycles: float = 0.1, DynamicImports: float = 0.1, SitePackages: int = 20, EntryPoints: tuple = ENTRY_POINTS, Repeat: int = 3, Seed: int = 0, Verbose: bool = True) -> list:
+    """
+        Generates a project of every size, then measures every entry point on it.
+
+        #### Args:
+            - Sizes (list): Project sizes, in files.
+            - LinesPerFile, FanOut, Depth, Cycles, DynamicImports: 'GenerateProject()' options.
+            - SitePackages (int, optional): Packages of the fake site-packages tree, shared by every size. Defaults to 20.
+            - EntryPoints (tuple, optional): Measured entry points. Defaults to 'ENTRY_POINTS'.
+            - Repeat (int, optional): Timed runs of every measurement, the fastest one is reported. Defaults to 3.
+            - Seed (int, optional): Random seed of generated trees. Defaults to 0.
+            - Verbose (bool, optional): Prints every measurement as soon as it is done. Defaults to True.
+
+        #### Returns:
+            - list: Results, one dict per (size, entry point) with keys = Files, EntryPoint, Seconds, PeakBytes, Runs (or Error)
+    """
+
+    results = []
+    work_dir = tempfile.mkdtemp(prefix='PackageManagerBenchmark-')
+
+    try:
+        site_dir = f'{work_dir}/site-packages'
+        third_party = GenerateSitePackages(SiteDir=site_dir, Packages=SitePackages, LinesPerFile=LinesPerFile, Seed=Seed)
+
+        for size in Sizes:
+            main_script = GenerateProject(ProjectDir=f'{work_dir}/project-{size}', Files=size, LinesPerFile=LinesPerFile, FanOut=FanOut, Depth=Depth, Cycles=Cycles, DynamicImports=DynamicImports, ThirdParty=third_party, Seed=Seed)
+
+            for entry_point in EntryPoints:
+                result = dict({'Files': int(size), 'EntryPoint': entry_point}, **MeasureEntryPoint(EntryPoint=entry_point, MainScript=main_script, SiteDir=site_dir, Repeat=Repeat))
+                results.append(result)
+
+                if (bool(Verbose)):
+                    print(f"{entry_point:<28} {size:>7} files  " + (f"{result['Seconds'] * 1000:>10.1f} ms  {result['PeakBytes'] / 1024:>10.1f} KiB" if ('Error' not in result) else f"ERROR {result['Error']}"), flush=True)
+
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return results
+
+def PrintReport(Results: list) -> None:
+    """
+        Prints results as tables (one row per entry point, one column per size), one for time and one for peak memory.
+
+        #### Args:
+            - Results (list): Results returned by 'RunBenchmarks()'.
+
+        #### Returns:
+            None
+    """
+
+    sizes = sorted(set([result['Files'] for result in Results]))
+    entry_points = [entry_point for entry_point in ENTRY_POINTS if (entry_point in set([result['EntryPoint'] for result in Results]))]
+    results = {(result['EntryPoint'], result['Files']): result for result in Results}
+
+    for title, key, scale in (('Time (ms)', 'Seconds', 1000), ('Peak memory (KiB)', 'PeakBytes', 1 / 1024)):
+        print(f"\n{title:<28}" + ''.join([f'{size:>12}' for size in sizes]))
+
+        for entry_point in entry_points:
+            cells = [results.get((entry_point, size), dict()) for size in sizes]
+            print(f'{entry_point:<28}' + ''.join([f'{cell[key] * scale:>12.1f}' if (key in cell) else f'{"-":>12}' for cell in cells]))
+
+    return None
+
+if (__name__ == '__main__'):
+    if (len(sys.argv) == 3) and (sys.argv[1] == '--child'):
+        entry_point, main_script, site_dir, repeat, result_path = json.loads(sys.argv[2])
+
+        with open(result_path, 'w') as result_file:
+            json.dump(RunEntryPoint(EntryPoint=entry_point, MainScript=main_script, SiteDir=site_dir, Repeat=repeat), result_file)
+
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(description='Benchmarks PackageManager entry points on synthetic projects of increasing sizes.')
+    parser.add_argument('--sizes', default='10,100,500', help='Comma separated project sizes, in files. Default: 10,100,500')
+    parser.add_argument('--lines', type=int, default=50, help='Lines of every generated file. Default: 50')
+    parser.add_argument('--fan-out', type=int, default=3, help='Project modules imported by every module. Default: 3')
+    parser.add_argument('--depth', type=int, default=4, help='Layers of the project import graph. Default: 4')
+    parser.add_argument('--cycles', type=float, default=0.1, help='Probability of an import cycle per module. Default: 0.1')
+    parser.add_argument('--dynamic', type=float, default=0.1, help='Probability of a dynamic import per module. Default: 0.1')
+    parser.add_argument('--site-packages', type=int, default=20, help='Packages of the fake site-packages tree. Default: 20')
+    parser.add_argument('--entry-points', default=','.join(ENTRY_POINTS), help='Comma separated entry points to be measured. Default: all')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs of every measurement, the fastest one is reported. Default: 3')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed of generated trees. Default: 0')
+    parser.add_argument('--output', default=None, help='JSON file results are written to.')
+    arguments = parser.parse_args()
+
+    benchmark_results = RunBenchmarks(
+        Sizes=[int(size) for size in arguments.sizes.split(',') if (size.strip())],
+        LinesPerFile=arguments.lines,
+        FanOut=arguments.fan_out,
+        Depth=arguments.depth,
+        Cycles=arguments.cycles,
+        DynamicImports=arguments.dynamic,
+        SitePackages=arguments.site_packages,
+        EntryPoints=tuple([entry_point.strip() for entry_point in arguments.entry_points.split(',') if (entry_point.strip())]),
+        Repeat=arguments.repeat,
+        Seed=arguments.seed
+        )
+
+    PrintReport(Results=benchmark_results)
+
+    if (arguments.output):
+        with open(arguments.output, 'w') as output_file:
+            json.dump(dict({'Python': sys.version, 'Arguments': vars(arguments), 'Results': benchmark_results}), output_file, indent=4)
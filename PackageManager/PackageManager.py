@@ -4,6 +4,7 @@
 """###
 ISSUES TO FIX:
 - Script must re-run to be able to detect newly installed packages ==> Must re-run __main__ script within this module if new packages were installed.
+  (Not needed in lazy mode, 'PACKAGEMANAGER_MODE=lazy', where 'LazyInstaller' retries the failing import after installing its package)
 ###"""
 """
     Package Manager v2.1.5
@@ -25,7 +26,7 @@ __status__      = "Production"
 __doc__         = "This module allows you to automatically import missing libraries (modules) that are required by any script without the need to any other installation or a requirement file."
 ##################################################
 
-import ast, glob, importlib.util, importlib.metadata, os, pkgutil, subprocess, sys
+import array, ast, collections, contextlib, fnmatch, glob, hashlib, importlib.machinery, importlib.util, importlib.metadata, json, os, pkgutil, platform, re, sqlite3, subprocess, sys, threading, time
 
 def PSL(Text: str, LastLine: bool = False) -> None:
     """
@@ -40,743 +41,5885 @@ def PSL(Text: str, LastLine: bool = False) -> None:
             None
     """
     
-    if (bool(LastLine)):
+    # 'PACKAGEMANAGER_PROGRESS' environment variable: 'off' prints nothing, 'plain' prints every text on its own line without terminal escapes (e.g. for logs)
+    progress_mode = os.environ.get('PACKAGEMANAGER_PROGRESS', '').strip().lower()
+
+    if (progress_mode == 'off'):
+        pass
+    elif (progress_mode == 'plain'):
+        sys.stdout.write(Text.strip('\n') + "\n")
+    elif (bool(LastLine)):
         sys.stdout.write("\r\033[K" + Text + "\n")
     else:
         sys.stdout.write("\r\033[K" + Text)
-    
+
     return None
 
-class PackageManager:
+def GetCacheDir(CacheDir: str | bool = True) -> str | None:
     """
-        ## Main class of the module.
+        Resolves the directory used by PackageManager to persist its caches.
+
+        #### Args:
+            - CacheDir (str | bool, optional): This argument has three modes as explained below.\n
+                * Mode 1: If set to bool(False), caching is disabled and None will be returned.
+                * Mode 2: If set to bool(True), the user cache directory of the running platform will be used. (Default)
+                * Mode 3: If set to a str(path), the given directory will be used.
+
+        #### Returns:
+            - str | None: Absolute path of the (created) cache directory, or None if caching is disabled.
+    """
+
+    if (CacheDir is False) or (CacheDir is None) or (str(CacheDir) == ''):
+        return None
+
+    elif (CacheDir is True):
+        # Windows keeps per-user caches under 'LOCALAPPDATA', other platforms follow XDG base directories
+        if (sys.platform == 'win32'):
+            cache_root = os.environ.get('LOCALAPPDATA', os.path.expanduser('~/AppData/Local'))
+        else:
+            cache_root = os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))
+
+        cache_dir = os.path.join(cache_root, 'PackageManager')
+
+    else:
+        cache_dir = str(CacheDir).replace('"', '').replace("'", '')
+
+    cache_dir = os.path.abspath(os.path.expanduser(cache_dir)).replace('\\', '/')
+    os.makedirs(cache_dir, exist_ok=True)
+
+    return cache_dir
+
+class Metrics:
+    """
+        ## Wall time and counts of every phase of the analysis and installation, with exporters to JSON and Prometheus text format.\n
+        An optional hook receives every measured phase as soon as it ends (e.g. to forward it to a logging system).
 
         ### Variables:\n
-            >>> AccessiblePackages
-            >>> AnalyzedPackages
-            >>> InstalledPackages
-            >>> RequiredPackages
-            >>> STDPackages
-        
-        ### Functions:\n
-            None
-        
+            >>> COUNTERS
+            >>> Counters
+            >>> Hook
+            >>> Installs
+            >>> PHASES
+            >>> Phases
+
         ### Public Methods:\n
-            >>> AutoImportMissings(self)
-            >>> ExportRequirements(self)
-            >>> GetImportedPackages(self)
-            >>> InstallPackage(self)
-            >>> UpgradePIP(self)
-        
-        ### Private Methods:\n
-            >>> __GetInstalledPackages(self)
-            >>> __GetImportedPackages(self)
-            >>> __GetMissingPackages(self)
-            >>> __GetPackagePath(self)
-            >>> __GetRequiredPackages(self)
-            >>> __InstallPackage(self)
-            >>> __UpgradePIP(self)
+            >>> Add(self)
+            >>> Export(self)
+            >>> Increment(self)
+            >>> Measure(self)
+            >>> Merge(self)
+            >>> ToDict(self)
+            >>> ToJSON(self)
+            >>> ToPrometheus(self)
     """
 
-    def __init__(self) -> None:
+    PHASES = ('EnvironmentScan', 'SourceRead', 'Parse', 'PathResolution', 'Analysis', 'Install', 'PipUpgrade')
+    COUNTERS = ('FilesScanned', 'FilesRead', 'BytesRead', 'CacheHits', 'CacheMisses', 'PackagesSkipped', 'PackagesInstalled', 'PackagesFailed')
+
+    def __init__(self, Hook=None) -> None:
         """
-            ### Constructor gets the main script file path and store class-scope variables
+            ### Constructor initializes every phase and counter to zero.
+
+            #### Args:
+                - Hook (callable | None, optional): Called with a dict ('Phase', 'Seconds', and the phase labels, e.g. 'Package') every time a phase ends. Defaults to None.
         """
 
-        # Class Variables
-        self.__mainScript = sys.modules['__main__']
-        self.__mainScriptPath = str((self.__mainScript.__file__).replace('\\', '/'))
+        self.Hook = Hook
+        self.Phases = {phase: dict({'Count': 0, 'Seconds': 0.0}) for phase in self.PHASES}
+        self.Counters = {counter: 0 for counter in self.COUNTERS}
+        self.Installs = list()
 
-        # User Accessable Variable
-        self.STDPackages = tuple(list(sys.stdlib_module_names) + list(sys.builtin_module_names))
-        self.InstalledPackages = tuple(self.__GetInstalledPackages())
-        self.AccessiblePackages = tuple(self.STDPackages + self.InstalledPackages)
-        self.RequiredPackages = tuple()
-        self.AnalyzedPackages = set()
+        # Installations may run in several threads (see 'AutoImportMissingsAsync()')
+        self.__lock = threading.Lock()
 
-        # User Accessable Methods
-        self.InstallPackage = lambda PackageName, PackageVersion, Verbose: \
-            self.__InstallPackage(PackageName=str(PackageName), PackageVersion=str(PackageVersion), Verbose=bool(Verbose))
-        
-        self.GetImportedPackages = lambda PackagePath, IncludeDynamicImports, StrictSearch, Verbose: \
-            self.__GetImportedPackages(PackagePath=PackagePath, IncludeDynamicImports=IncludeDynamicImports, StrictSearch=StrictSearch, Verbose=Verbose)
+    @contextlib.contextmanager
+    def Measure(self, Phase: str, **Labels):
+        """
+            ### Measures wall time of the enclosed block as one occurrence of a phase.
 
-        self.UpgradePIP = lambda Verbose: self.__UpgradePIP(Verbose=bool(Verbose))
+            #### Usage:
+                >>> with metrics.Measure('Install', Package='yaml') as labels:
+                >>>     labels['ExitCode'] = install()
 
-    ### INFORMATION RETRIVERS
+            #### Args:
+                - Phase (str): Phase name (see 'PHASES').
+                - **Labels: Labels of this occurrence, also reported to the hook.
 
-    def __GetPackagePath(self, PackageName: str, IgnoreBuiltins: bool = False, Verbose: bool = False) -> str | None:
+            #### Yields:
+                - dict: Labels of this occurrence, which the block may complete.
         """
-            ### Searches and returns a package path using its name.
+
+        labels = dict(Labels)
+        started_at = time.perf_counter()
+
+        try:
+            yield labels
+        finally:
+            self.Add(Phase, time.perf_counter() - started_at, **labels)
+
+    def Add(self, Phase: str, Seconds: float, **Labels) -> None:
+        """
+            ### Records one occurrence of a phase, then reports it to the hook.
 
             #### Args:
-                - PackageName (str): Target package name.
-                - Verbose (bool, optional): Prints function progress. Defaults to False.
+                - Phase (str): Phase name (see 'PHASES').
+                - Seconds (float): Wall time of this occurrence.
+                - **Labels: Labels of this occurrence. Installations are also recorded individually with their 'Package' and 'ExitCode' labels.
 
             #### Returns:
-                - str | None: Package file path if package exist, else, None will be returned.
+                None
         """
 
-        # Print progress to stdout
-        if (bool(Verbose)): print(f"Locating package '{PackageName}'...")
-        
-        # Load module without executing it
-        module = importlib.util.find_spec(str(PackageName))
+        with self.__lock:
+            phase = self.Phases.setdefault(str(Phase), dict({'Count': 0, 'Seconds': 0.0}))
+            phase['Count'] += 1
+            phase['Seconds'] += float(Seconds)
 
-        # Check if module is found
-        if (hasattr(module, 'origin')):
-            module_path = str(module.origin)
+            if (Phase == 'Install'):
+                self.Installs.append(dict({'Package': Labels.get('Package'), 'Seconds': float(Seconds), 'ExitCode': Labels.get('ExitCode')}))
 
-            # Check if module has 'origin' has a value which is not None
-            if (str(module_path) != 'None'):
-                module_path = module_path
-            
-            # Check if module is not normally included in 'sys.path' (has 'submodule_search_locations' value)
-            # and try to read its path
-            elif (str(module_path) == 'None') \
-            and (str(module.submodule_search_locations) != 'None'):
-                # Collecting path domain
-                namespace = module.submodule_search_locations
-                # Concatenate path domain
-                module_path = str(f'{namespace._path[0]}/{namespace._name}.py')
-            
-            else:
-                module_path = None
+        if (self.Hook is not None):
+            # A failing hook must never break the analysis nor installations
+            try:
+                self.Hook(dict({'Phase': str(Phase), 'Seconds': float(Seconds)}, **Labels))
+            except Exception as error:
+                print(error)
 
+        return None
 
-        # Check if module is not found (if module == None)
-        else:
-            module_path = None
+    def Increment(self, Counter: str, Value: int = 1) -> None:
+        """
+            ### Increments a counter.
 
-        # If 'IgnoreBuiltins' is True, any built-in package will be returned as None
-        if (bool(IgnoreBuiltins)) \
-        and (module_path == 'built-in'):
-            module_path = None
+            #### Args:
+                - Counter (str): Counter name (see 'COUNTERS').
+                - Value (int, optional): Increment. Defaults to 1.
 
-        else:
-            pass
+            #### Returns:
+                None
+        """
 
-        return module_path
+        with self.__lock:
+            self.Counters[str(Counter)] = self.Counters.get(str(Counter), 0) + int(Value)
 
-    def __GetInstalledPackages(self, Verbose: bool = False) -> tuple:
+        return None
+
+    def Merge(self, Other: dict) -> None:
         """
-            ### Collects all packages (built-ins & installed) accessible by Python.
+            ### Adds totals collected elsewhere (e.g. by worker processes), without reporting them to the hook.
 
             #### Args:
-                - Verbose (bool, optional): Prints function progress. Defaults to False.
+                - Other (dict): Totals, as returned by 'ToDict()'.
 
             #### Returns:
-                - tuple: Names of all accessible packages (installed & built-ins).
+                None
         """
 
-        # Print progress to stdout
-        if (bool(Verbose)): print("Collecting Installed Packages...")
+        with self.__lock:
+            for phase_name, phase in Other.get('Phases', dict()).items():
+                own_phase = self.Phases.setdefault(phase_name, dict({'Count': 0, 'Seconds': 0.0}))
+                own_phase['Count'] += int(phase['Count'])
+                own_phase['Seconds'] += float(phase['Seconds'])
 
-        # Retriving all 'sys' accessible installed packages
-        packages = [pkg.split('.')[0] for pkg in list(sys.modules) if pkg not in self.STDPackages]
-        # print(set(packages))
-        # exit()
+            for counter, value in Other.get('Counters', dict()).items():
+                self.Counters[counter] = self.Counters.get(counter, 0) + int(value)
 
-        # Retriving other packages inaccessible by 'sys'
-        # Collect package names using '..iter_modules()'
-        # Do not use '..walk_packages()'; it is slower than '..iter_modules()' because it retrives submodules as well
-        # 'pkgutil.walk_packages()' returns objects of modules, so we need to collect 'pkg.name'
-        for pkg in pkgutil.iter_modules():
-            # Append to packages list
-            packages.append(pkg.name)
-        
-        # Ensuring collected packages do not contain built-ins or std_libs as well as setting and sorting packages
-        packages = sorted(set([pkg for pkg in packages if pkg not in self.STDPackages]))
+            self.Installs.extend(Other.get('Installs', []))
 
-        return tuple(packages)
+        return None
 
-    def __GetImportedPackages(self, PackagePath: str, IncludeDynamicImports: bool = True, StrictSearch: bool = False, Verbose: bool = False) -> tuple:
+    def ToDict(self) -> dict:
         """
-            ### Collects imported packages from python code.\n
-            #### IMPORT STATEMENTS INSIDE LOOPS CANNOT BE ACCESSED BY 'IncludeDynamicImports'
+            ### Returns a copy of collected totals.
+
+            #### Returns:
+                - dict: Return keys = Phases, Counters, Installs
+        """
+
+        with self.__lock:
+            return dict(
+                    {
+                    'Phases'    : {phase_name: dict(phase) for phase_name, phase in self.Phases.items()},
+                    'Counters'  : dict(self.Counters),
+                    'Installs'  : [dict(install) for install in self.Installs]
+                    }
+                )
+
+    def ToJSON(self) -> str:
+        """
+            ### Serializes collected totals to JSON.
+
+            #### Returns:
+                - str: JSON document (see 'ToDict()').
+        """
+
+        return json.dumps(self.ToDict(), indent=4)
+
+    def ToPrometheus(self, Prefix: str = 'packagemanager') -> str:
+        """
+            ### Serializes collected totals to Prometheus text exposition format.
 
             #### Args:
-                - PackagePath (str): Python file path to be analyzed for imports.
-                - IncludeDynamicImports (bool, optional): If enabled, packages imported dynamically while the code runs will be collected. Defaults to True.
-                - StrictSearch (bool, optional): If enabled, only nodes containing the word 'import' in their source code will be processed. Preferably keep it to default. Defaults to False.
-                - Verbose (bool, optional): Prints function progress. Defaults to False.
+                - Prefix (str, optional): Prefix of every metric name. Defaults to 'packagemanager'.
 
             #### Returns:
-                - tuple: Names of imported modules by the code provided. If no imported modules found, an empty tuple will be returned.
+                - str: Metrics, one sample per line.
         """
-        
-        if (bool(Verbose)): PSL(f"Collecting packages imported by '{os.path.basename(PackagePath)}'")
 
-        def __getPackageSource(FilePath: str) -> str:
-            """
-                Reads source code from Python file
+        def __escape(Value) -> str:
+            return str(Value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
 
-                #### Args:
-                    - PackagePath (str): Python file absoulte path
+        def __snakeCase(Name: str) -> str:
+            return re.sub(r'(?<!^)(?=[A-Z])', '_', Name).lower()
 
-                ### Raises:
-                    - FileNotFoundError: If provided path is invalid or not a file
+        totals = self.ToDict()
+        lines = []
 
-                #### Returns:
-                    - str: Target file content
-            """
-            # Check if provided parameter is a file path
-            if (os.path.isfile(FilePath)):
-                # Open and read content then return it
-                with open(file=PackagePath, mode='r', errors='ignore') as source:
-                    src_code = source.read()
-
-            # If provided parameter is not a file, is a directory,
-            # or relatively imported, try to walk the contents of it
-            else:
-                pkg_dir_name = os.path.dirname(FilePath).rstrip('/')
-                
-                if  (os.path.isdir(pkg_dir_name)) \
-                and (any([spth in pkg_dir_name for spth in sys.path])):
-                    # Open and read content of all file in directory then return it
-                    src_code = ''
-                    # Collects all .py files in the given directory
-                    dir_files = list(glob.glob(f'{pkg_dir_name}/*.py', recursive=True))
-
-                    # Reads and concatenate all content of python files in a 'dir_files'
-                    for fil in dir_files:
-                        with open(file=fil, mode='r', errors='ignore') as source:
-                            src_code += (source.read() + '\n')
-
-                # If 'FilePath' is unreachable, raise a FileNotFound Error
-                else:
-                    src_code = None
-                    print(FileNotFoundError(f'{FilePath} could not be found!'))
-            
-            return src_code
+        lines.append(f'# HELP {Prefix}_phase_seconds_total Wall time spent in every phase.')
+        lines.append(f'# TYPE {Prefix}_phase_seconds_total counter')
+        lines.extend([f'{Prefix}_phase_seconds_total{{phase="{__escape(phase_name)}"}} {phase["Seconds"]}' for phase_name, phase in totals['Phases'].items()])
 
-        def __handleImport(Node: ast.Import) -> tuple:
-            """
-                Collects packages names imported by 'import ...'
+        lines.append(f'# HELP {Prefix}_phase_calls_total Occurrences of every phase.')
+        lines.append(f'# TYPE {Prefix}_phase_calls_total counter')
+        lines.extend([f'{Prefix}_phase_calls_total{{phase="{__escape(phase_name)}"}} {phase["Count"]}' for phase_name, phase in totals['Phases'].items()])
 
-                #### Args:
-                    - Node (ast.Import): AST Import type node object
+        for counter, value in totals['Counters'].items():
+            lines.append(f'# TYPE {Prefix}_{__snakeCase(counter)}_total counter')
+            lines.append(f'{Prefix}_{__snakeCase(counter)}_total {value}')
 
-                #### Returns:
-                    - tuple: Imported packages names
-            """
+        # Installations of the same package with the same result are summed, so every series is unique
+        install_seconds = dict()
+        for install in totals['Installs']:
+            install_key = (install['Package'], install['ExitCode'])
+            install_seconds[install_key] = install_seconds.get(install_key, 0.0) + install['Seconds']
 
-            # Assure 'Node' type to process it
-            if (type(Node) == ast.Import):
-                # Collect packages names from Import Nodes
-                pkgs = [getPkgName(pkg.name) for pkg in Node.names]
-            
+        lines.append(f'# HELP {Prefix}_install_seconds_total Wall time spent installing every package.')
+        lines.append(f'# TYPE {Prefix}_install_seconds_total counter')
+        lines.extend([f'{Prefix}_install_seconds_total{{package="{__escape(package)}",exit_code="{__escape(exit_code)}"}} {seconds}' for (package, exit_code), seconds in install_seconds.items()])
+
+        return '\n'.join(lines) + '\n'
+
+    def Export(self, FilePath: str) -> None:
+        """
+            ### Writes collected totals to a file, in Prometheus text format if its extension is '.prom', else, in JSON.
+
+            #### Args:
+                - FilePath (str): Output file path.
+
+            #### Returns:
+                None
+        """
+
+        with open(file=FilePath, mode='w') as metrics_file:
+            metrics_file.write(self.ToPrometheus() if (str(FilePath).endswith('.prom')) else self.ToJSON())
+
+        return None
+
+class ImportCache:
+    """
+        ## Persistent cache of packages imported by python files.\n
+        Maps a package path and its source files fingerprint (path, size, and either mtime or content hash)
+        to the imports extracted from it, so unchanged files are never parsed twice across runs.
+
+        ### Variables:\n
+            >>> CachePath
+            >>> HashContent
+            >>> Hits
+            >>> Misses
+
+        ### Public Methods:\n
+            >>> Fingerprint(self)
+            >>> Get(self)
+            >>> Put(self)
+            >>> Stats(self)
+
+        ### Private Methods:\n
+            >>> __Open(self)
+    """
+
+    def __init__(self, CacheDir: str, HashContent: bool = False) -> None:
+        """
+            ### Constructor opens (or creates) the cache database inside 'CacheDir'. A corrupted database is discarded and created again.
+
+            #### Args:
+                - CacheDir (str): Directory where the cache database is stored.
+                - HashContent (bool, optional): If enabled, files content hash replaces their modification time in the fingerprint, so files touched without changes still hit the cache. Defaults to False.
+
+            #### Raises:
+                - OSError, sqlite3.Error: If the cache database cannot be opened nor created.
+        """
+
+        self.CachePath = f'{CacheDir}/ImportCache.sqlite3'
+        self.HashContent = bool(HashContent)
+        self.Hits = 0
+        self.Misses = 0
+
+        # Cache may be shared between threads of the same process, so access is serialized
+        self.__lock = threading.Lock()
+        self.__connection = None
+
+        try:
+            self.__Open()
+
+        except sqlite3.DatabaseError:
+            if (self.__connection is not None):
+                self.__connection.close()
+
+            # Cached imports can always be extracted again, so a corrupted database is only removed
+            for cache_file in (self.CachePath, f'{self.CachePath}-wal', f'{self.CachePath}-shm'):
+                if (os.path.isfile(cache_file)):
+                    os.remove(cache_file)
+
+            self.__Open()
+
+    def __Open(self) -> None:
+        """
+            ### Connects to the cache database, creating its table if needed.
+
+            #### Returns:
+                None
+        """
+
+        self.__connection = sqlite3.connect(self.CachePath, timeout=30, check_same_thread=False)
+        # WAL journal allows concurrent readers while another process writes
+        self.__connection.execute('PRAGMA journal_mode=WAL')
+        self.__connection.execute('PRAGMA synchronous=NORMAL')
+        self.__connection.execute(
+            'CREATE TABLE IF NOT EXISTS imports ('
+            'path TEXT NOT NULL, options TEXT NOT NULL, fingerprint TEXT NOT NULL, imports TEXT NOT NULL, '
+            'PRIMARY KEY (path, options))'
+        )
+        self.__connection.commit()
+
+        return None
+
+    def Fingerprint(self, SourceFiles: list) -> str | None:
+        """
+            ### Computes the fingerprint of a group of source files.
+
+            #### Args:
+                - SourceFiles (list): Paths of files to be fingerprinted.
+
+            #### Returns:
+                - str | None: JSON fingerprint of the files, or None if any of them is unreachable.
+        """
+
+        fingerprint = []
+
+        for fil in sorted(SourceFiles):
+            try:
+                file_stat = os.stat(fil)
+            except OSError:
+                return None
+
+            file_print = [str(fil), int(file_stat.st_size)]
+
+            # Content hash replaces modification time, so touched files still match
+            if (self.HashContent):
+                with open(file=fil, mode='rb') as source:
+                    file_print.append(hashlib.blake2b(source.read(), digest_size=16).hexdigest())
             else:
-                # Return (None) if this is not an Import Node
-                pkgs = [None]
-            
-            return tuple(pkgs)
+                file_print.append(int(file_stat.st_mtime_ns))
 
-        def __handleImportFrom(Node: ast.ImportFrom) -> tuple:
-            """
-                Collects packages names imported by 'from ... import ...'
+            fingerprint.append(file_print)
 
-                #### Args:
-                    Node (ast.ImportFrom): AST ImportFrom type node object
+        return json.dumps(fingerprint)
 
-                #### Returns:
-                    tuple: Imported packages names
-            """
-            
-            # Assure 'Node' type to process it
-            if (type(Node) == ast.ImportFrom):
-                # Collect packages names from From...Import Nodes
-                module_name = Node.module
-
-                # Check if module level, whether it is a parent directory or not 'e.g. from . import pkg ==> level 1' | 'e.g. from module import pkg ==> level 0'
-                # MUST CHECK (__name__ not in module_name) == True to avoid issues with relative imports of the package
-                ## although this will not bring PackageManager name in packages list but it could be added manually later if need .
-                if (int(Node.level) == 0) \
-                and (__name__ not in module_name):
-                    pkg = [getPkgName(module_name)]
-                else:
-                    # If module is a parent directory, skip (pass as None)
-                    pkg = [None]
+    def Get(self, PackagePath: str, Fingerprint: str, Options: str) -> tuple | None:
+        """
+            ### Retrieves cached imports of a package if its source files did not change.
+
+            #### Args:
+                - PackagePath (str): Analyzed package path.
+                - Fingerprint (str): Current fingerprint of package source files, as returned by 'Fingerprint()'.
+                - Options (str): Extraction options the imports depend on.
+
+            #### Returns:
+                - tuple | None: Cached imports, or None on a cache miss.
+        """
+
+        with self.__lock:
+            row = self.__connection.execute(
+                'SELECT fingerprint, imports FROM imports WHERE path = ? AND options = ?',
+                (str(PackagePath), str(Options))
+            ).fetchone()
+
+            if (row is not None) and (row[0] == Fingerprint):
+                self.Hits += 1
+                return tuple(json.loads(row[1]))
 
             else:
-                # Return (None) if this is not an ImportFrom Node
-                pkg = [None]
-            
-            return tuple(pkg)
+                self.Misses += 1
+                return None
+
+    def Put(self, PackagePath: str, Fingerprint: str, Options: str, Imports: tuple) -> None:
+        """
+            ### Stores imports extracted from a package.
+
+            #### Args:
+                - PackagePath (str): Analyzed package path.
+                - Fingerprint (str): Fingerprint of package source files taken before they were read.
+                - Options (str): Extraction options the imports depend on.
+                - Imports (tuple): Imports extracted from the package.
+
+            #### Returns:
+                None
+        """
+
+        with self.__lock:
+            self.__connection.execute(
+                'INSERT OR REPLACE INTO imports (path, options, fingerprint, imports) VALUES (?, ?, ?, ?)',
+                (str(PackagePath), str(Options), str(Fingerprint), json.dumps(list(Imports)))
+            )
+            self.__connection.commit()
+
+        return None
+
+    def Stats(self) -> dict:
+        """
+            ### Returns cache usage counters.
+
+            #### Returns:
+                - dict: Return keys = Hits, Misses, HitRatio
+        """
+
+        lookups = self.Hits + self.Misses
+
+        return dict(
+                {
+                "Hits"      : self.Hits,
+                "Misses"    : self.Misses,
+                "HitRatio"  : (self.Hits / lookups) if (lookups) else 0.0
+                }
+            )
+
+class EnvironmentSnapshot:
+    """
+        ## Indexed map of every module and package reachable from 'sys.path' entries.\n
+        Each entry is listed once and its modules are kept as a name -> (kind, location) map.
+        Listings can be persisted across runs, every entry is then re-listed only if its modification time changed.
+
+        ### Variables:\n
+            >>> CachePath
+            >>> Entries
+            >>> Modules
+            >>> Names
+            >>> RescannedEntries
+
+        ### Public Methods:\n
+            >>> Fingerprint(self)
+            >>> Refresh(self)
+            >>> Resolve(self)
+            >>> ScanEntry(self)
+    """
+
+    # Longest suffixes first, so 'module.cpython-311-x86_64-linux-gnu.so' is not matched by '.so'
+    MODULE_SUFFIXES = tuple(sorted(
+        [(suffix, 'source') for suffix in importlib.machinery.SOURCE_SUFFIXES] +
+        [(suffix, 'extension') for suffix in importlib.machinery.EXTENSION_SUFFIXES] +
+        [(suffix, 'bytecode') for suffix in importlib.machinery.BYTECODE_SUFFIXES],
+        key=lambda suffix: len(suffix[0]), reverse=True
+    ))
+
+    def __init__(self, CacheDir: str | None = None, Paths: list | None = None) -> None:
+        """
+            ### Constructor lists (or reloads) every entry of 'Paths'.
+
+            #### Args:
+                - CacheDir (str | None, optional): Directory where listings are persisted. If None, nothing is persisted. Defaults to None.
+                - Paths (list | None, optional): Entries to be listed. Defaults to None, which lists 'sys.path'.
+        """
+
+        self.CachePath = f'{CacheDir}/EnvironmentSnapshot.json' if (CacheDir) else None
+        self.Entries = dict()
+        self.Modules = dict()
+        self.Names = frozenset()
+        self.RescannedEntries = 0
+
+        self.__paths = Paths
+        # Listings of package directories, collected on demand while resolving submodules
+        self.__dirListings = dict()
+
+        # Loading listings of a previous run, an unreadable snapshot is simply rebuilt
+        if (self.CachePath is not None) and (os.path.isfile(self.CachePath)):
+            try:
+                with open(file=self.CachePath, mode='r') as snapshot:
+                    snapshot_data = json.load(snapshot)
+
+                if (snapshot_data.get('Version') == __version__) \
+                and (snapshot_data.get('Interpreter') == sys.executable):
+                    self.Entries = dict(snapshot_data['Entries'])
+
+            except (OSError, ValueError, KeyError):
+                self.Entries = dict()
+
+        self.Refresh()
+
+    @staticmethod
+    def GetEntryModificationTime(EntryPath: str) -> int | None:
+        """
+            ### Returns modification time of a path entry, which changes whenever a module is added to or removed from it.
+
+            #### Args:
+                - EntryPath (str): Path entry.
+
+            #### Returns:
+                - int | None: Modification time in nanoseconds, or None if the entry does not exist.
+        """
+
+        try:
+            return int(os.stat(EntryPath).st_mtime_ns)
+        except OSError:
+            return None
+
+    def ScanEntry(self, EntryPath: str) -> dict:
+        """
+            ### Lists modules and packages provided by a single path entry.\n
+            Follows 'pkgutil.iter_modules()' rules: directories are packages only if they hold an '__init__' module,
+            other directories are kept as 'namespace' portions.
+
+            #### Args:
+                - EntryPath (str): Path entry (directory or zip archive).
+
+            #### Returns:
+                - dict: Module name -> [kind, location]. Kinds are 'package', 'namespace', 'source', 'extension' and 'bytecode'.
+        """
+
+        modules = dict()
+
+        # Zip archives and other non-directory entries are left to their own importers
+        if (not os.path.isdir(EntryPath)):
+            if (os.path.exists(EntryPath)):
+                for module in pkgutil.iter_modules([EntryPath]):
+                    modules[module.name] = ['package' if (module.ispkg) else 'source', f'{EntryPath}/{module.name}']
+
+            return modules
+
+        try:
+            dir_entries = sorted(os.scandir(EntryPath), key=lambda entry: entry.name)
+        except OSError:
+            return modules
+
+        for entry in dir_entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+
+            if (is_dir):
+                # Directories with dots in their names (e.g. 'pkg-1.0.dist-info') can never be imported
+                if ('.' in entry.name) or (entry.name in modules) or (entry.name == '__pycache__'):
+                    continue
+
+                entry_path = entry.path.replace('\\', '/')
+                init_files = [f'{entry_path}/__init__{suffix}' for suffix, _ in self.MODULE_SUFFIXES]
+
+                if (any([os.path.isfile(init_file) for init_file in init_files])):
+                    modules[entry.name] = ['package', entry_path]
+                else:
+                    modules[entry.name] = ['namespace', entry_path]
+
+            else:
+                for suffix, kind in self.MODULE_SUFFIXES:
+                    if (entry.name.endswith(suffix)):
+                        module_name = entry.name[:-len(suffix)]
+
+                        # Regular packages and source files take precedence over other modules of the same name
+                        if (module_name) and (module_name != '__init__') \
+                        and ((module_name not in modules) or (modules[module_name][0] == 'namespace')):
+                            modules[module_name] = [kind, entry.path.replace('\\', '/')]
+
+                        break
+
+        return modules
+
+    def Refresh(self) -> bool:
+        """
+            ### Re-lists entries whose modification time changed since they were listed, then rebuilds the index.
+
+            #### Returns:
+                - bool: True if any entry was re-listed, else, False.
+        """
+
+        paths = list(sys.path) if (self.__paths is None) else list(self.__paths)
+        entries = dict()
+        rescanned = False
+
+        for entry_path in paths:
+            entry_key = os.path.abspath(entry_path or '.').replace('\\', '/')
+
+            if (entry_key in entries):
+                continue
+
+            mtime = self.GetEntryModificationTime(EntryPath=entry_key)
+            entry = self.Entries.get(entry_key)
+
+            if (entry is None) or (entry['MTime'] != mtime):
+                entry = dict({'MTime': mtime, 'Modules': self.ScanEntry(EntryPath=entry_key) if (mtime is not None) else dict()})
+                self.RescannedEntries += 1
+                rescanned = True
+
+            entries[entry_key] = entry
+
+        self.Entries = entries
+
+        # First entry providing a module wins, the same way the import system resolves it,
+        # while namespace portions are only used if no entry provides a regular module of the same name
+        modules = dict()
+        for entry in self.Entries.values():
+            for name, (kind, location) in entry['Modules'].items():
+                if (name not in modules) or ((modules[name][0] == 'namespace') and (kind != 'namespace')):
+                    modules[name] = [kind, location]
+
+        self.Modules = modules
+        self.__dirListings = dict()
+        self.Names = frozenset([name for name, (kind, _) in self.Modules.items() if (kind != 'namespace')])
+
+        if (rescanned) and (self.CachePath is not None):
+            self.__Save()
+
+        return rescanned
+
+    def Resolve(self, ModuleName: str) -> tuple | None:
+        """
+            ### Resolves a module the way the import system would, without importing anything (not even parents of dotted names).
+
+            #### Args:
+                - ModuleName (str): Module name, dotted names are resolved through their parents 'submodule_search_locations'.
+
+            #### Returns:
+                - tuple | None: (Kind, Origin, SubmoduleSearchLocations), or None if the module cannot be found in listed entries.\n
+                    * Kind: 'built-in', 'frozen', 'package', 'namespace', 'source', 'extension' or 'bytecode'.
+                    * Origin: Module file path, 'built-in', 'frozen', or None for namespace packages.
+                    * SubmoduleSearchLocations: Directories of packages and namespace packages, else, None.
+        """
+
+        module_name = str(ModuleName)
+
+        # Already imported modules are answered by their own spec, exactly as 'importlib.util.find_spec()' does
+        module = sys.modules.get(module_name)
+        module_spec = getattr(module, '__spec__', None) if (module is not None) else None
+
+        if (module_spec is not None):
+            locations = list(module_spec.submodule_search_locations) if (module_spec.submodule_search_locations is not None) else None
+            kind = 'namespace' if (module_spec.origin is None) and (locations is not None) else ('package' if (locations is not None) else 'source')
+            return (kind, module_spec.origin, locations)
+
+        if (module_name in sys.builtin_module_names):
+            return ('built-in', 'built-in', None)
+
+        # Checking frozen modules does not import them
+        if ('.' not in module_name) and (importlib.machinery.FrozenImporter.find_spec(module_name) is not None):
+            return ('frozen', 'frozen', None)
+
+        # Top-level modules are answered by the index, submodules by listing their parents locations
+        if ('.' not in module_name):
+            module_info = self.Modules.get(module_name)
+            namespace_locations = [entry['Modules'][module_name][1] for entry in self.Entries.values()
+                                   if (entry['Modules'].get(module_name, [None])[0] == 'namespace')]
+
+        else:
+            parent_name, _, child_name = module_name.rpartition('.')
+            parent_info = self.Resolve(ModuleName=parent_name)
+
+            if (parent_info is None) or (parent_info[2] is None):
+                return None
+
+            module_info = None
+            namespace_locations = []
+
+            for location in parent_info[2]:
+                location_key = str(location).replace('\\', '/')
+
+                if (location_key not in self.__dirListings):
+                    self.__dirListings[location_key] = self.ScanEntry(EntryPath=location_key)
+
+                child_info = self.__dirListings[location_key].get(child_name)
+
+                if (child_info is None):
+                    continue
+                elif (child_info[0] == 'namespace'):
+                    namespace_locations.append(child_info[1])
+                elif (module_info is None):
+                    module_info = child_info
+
+        if (module_info is not None) and (module_info[0] == 'package'):
+            # Package origin is its '__init__' module, looked up in the same order the path finder does
+            for suffixes in (importlib.machinery.EXTENSION_SUFFIXES, importlib.machinery.SOURCE_SUFFIXES, importlib.machinery.BYTECODE_SUFFIXES):
+                for suffix in suffixes:
+                    if (os.path.isfile(f'{module_info[1]}/__init__{suffix}')):
+                        return ('package', f'{module_info[1]}/__init__{suffix}', [module_info[1]])
+
+            return None
+
+        elif (module_info is not None) and (module_info[0] != 'namespace'):
+            return (module_info[0], module_info[1], None)
+
+        elif (namespace_locations):
+            return ('namespace', None, namespace_locations)
+
+        else:
+            return None
+
+    def Fingerprint(self) -> str:
+        """
+            ### Fingerprints the environment of the snapshot without listing anything: path entries and their modification times.
+
+            #### Returns:
+                - str: Hex digest changing whenever a module is added to or removed from any path entry.
+        """
+
+        return self.GetPathsFingerprint(Paths=list(self.Entries))
+
+    @staticmethod
+    def GetPathsFingerprint(Paths: list | None = None) -> str:
+        """
+            ### Fingerprints path entries without listing them, nor building a snapshot.
+
+            #### Args:
+                - Paths (list | None, optional): Path entries. Defaults to None, which fingerprints 'sys.path'.
+
+            #### Returns:
+                - str: Hex digest changing whenever a module is added to or removed from any path entry.
+        """
+
+        entries = dict()
+
+        for entry_path in (list(sys.path) if (Paths is None) else list(Paths)):
+            entry_key = os.path.abspath(entry_path or '.').replace('\\', '/')
+
+            if (entry_key not in entries):
+                entries[entry_key] = EnvironmentSnapshot.GetEntryModificationTime(EntryPath=entry_key)
+
+        return hashlib.blake2b(json.dumps([sys.executable, list(entries.items())]).encode(), digest_size=16).hexdigest()
+
+    def __Save(self) -> None:
+        """
+            ### Persists listings atomically, so concurrent processes never read a partial snapshot.
+
+            #### Returns:
+                None
+        """
+
+        temp_path = f'{self.CachePath}.{os.getpid()}.tmp'
+
+        try:
+            with open(file=temp_path, mode='w') as snapshot:
+                json.dump(dict({'Version': __version__, 'Interpreter': sys.executable, 'Entries': self.Entries}), snapshot)
+
+            os.replace(temp_path, self.CachePath)
+
+        except OSError as error:
+            print(error)
+
+        return None
+
+def ParseVersion(Version: str) -> tuple | None:
+    """
+        ### Parses a PEP 440 version into a key ordering versions the way pip does (e.g. '1.0.dev1' < '1.0a1' < '1.0' < '1.0.post1').
+
+        #### Args:
+            - Version (str): Version string (e.g. '2.31.0', '1!2.0rc1').
+
+        #### Returns:
+            - tuple | None: Comparable version key, or None if 'Version' is not a valid version. Local labels ('+local') are ignored.
+    """
+
+    version_match = re.fullmatch(
+        r'v?(?:(\d+)!)?(\d+(?:\.\d+)*)'
+        r'(?:[-_.]?(a|b|c|rc|alpha|beta|pre|preview)[-_.]?(\d*))?'
+        r'(?:-(\d+)|[-_.]?(post|rev|r)[-_.]?(\d*))?'
+        r'(?:[-_.]?(dev)[-_.]?(\d*))?'
+        r'(?:\+[a-z0-9]+(?:[-_.][a-z0-9]+)*)?',
+        str(Version).strip().lower()
+        )
+
+    if (version_match is None):
+        return None
+
+    epoch, release, pre_label, pre_number, post_implicit, post_label, post_number, dev_label, dev_number = version_match.groups()
+
+    # Trailing zeros are not significant ('1.0' == '1')
+    release_key = [int(part) for part in release.split('.')]
+    while (len(release_key) > 1) and (release_key[-1] == 0):
+        release_key.pop()
+
+    # Developmental releases of a final release come before its pre-releases, which come before the final release
+    if (pre_label is not None):
+        pre_key = (1, dict({'a': 0, 'alpha': 0, 'b': 1, 'beta': 1}).get(pre_label, 2), int(pre_number or 0))
+    elif (dev_label is not None) and (post_implicit is None) and (post_label is None):
+        pre_key = (0,)
+    else:
+        pre_key = (2,)
+
+    if (post_implicit is not None):
+        post_key = (1, int(post_implicit))
+    elif (post_label is not None):
+        post_key = (1, int(post_number or 0))
+    else:
+        post_key = (0,)
+
+    dev_key = (0, int(dev_number or 0)) if (dev_label is not None) else (1,)
+
+    return (int(epoch or 0), tuple(release_key), pre_key, post_key, dev_key)
+
+def GetMarkerEnvironment() -> dict:
+    """
+        ### Gets values of environment markers (PEP 508) for the running interpreter.
+
+        #### Returns:
+            - dict: Markers values, keyed by marker name (e.g. 'python_version', 'sys_platform').
+    """
+
+    implementation_version = sys.implementation.version
+    implementation_version = f'{implementation_version.major}.{implementation_version.minor}.{implementation_version.micro}' \
+        + (f'{implementation_version.releaselevel[0]}{implementation_version.serial}' if (implementation_version.releaselevel != 'final') else '')
+
+    return dict(
+            {
+            'implementation_name'               : sys.implementation.name,
+            'implementation_version'            : implementation_version,
+            'os_name'                           : os.name,
+            'platform_machine'                  : platform.machine(),
+            'platform_python_implementation'    : platform.python_implementation(),
+            'platform_release'                  : platform.release(),
+            'platform_system'                   : platform.system(),
+            'platform_version'                  : platform.version(),
+            'python_full_version'               : platform.python_version(),
+            'python_version'                    : '.'.join(platform.python_version_tuple()[:2]),
+            'sys_platform'                      : sys.platform
+            }
+        )
+
+def EvaluateMarker(Marker: str, Environment: dict | None = None, Extras: tuple | list | set = ()) -> bool:
+    """
+        ### Evaluates an environment marker (PEP 508) of a requirement (e.g. 'python_version < "3.11" and extra == "socks"').
+
+        #### Args:
+            - Marker (str): Environment marker.
+            - Environment (dict | None, optional): Markers values. Defaults to None, which uses values of the running interpreter ('GetMarkerEnvironment').
+            - Extras (tuple | list | set, optional): Requested extras, 'extra' markers are only satisfied by them. Defaults to ().
+
+        #### Returns:
+            - bool: True if the requirement applies to the environment.
+
+        #### Raises:
+            - ValueError: If 'Marker' is not a valid marker.
+    """
+
+    environment = GetMarkerEnvironment() if (Environment is None) else Environment
+    extras = set([DistributionIndex.NormalizeName(extra) for extra in Extras])
+    tokens = re.findall(r'''\s*('[^']*'|"[^"]*"|\(|\)|===|==|!=|~=|<=|>=|<|>|not\s+in\b|[A-Za-z_][A-Za-z0-9_.]*)''', str(Marker))
+
+    if (''.join(tokens).replace(' ', '') != re.sub(r'\s+', '', str(Marker))):
+        raise ValueError(f"Invalid marker '{Marker}'")
+
+    tokens = [re.sub(r'\s+', ' ', token.strip()) for token in tokens]
+    position = 0
+
+    def __getValue(Token: str) -> tuple:
+        # Returns (value, is_variable) of a marker operand
+        if (Token[:1] in ('"', "'")):
+            return (Token[1:-1], False)
+        elif (Token == 'extra'):
+            return (None, True)
+        elif (Token in environment):
+            return (environment[Token], True)
+        else:
+            raise ValueError(f"Unknown marker variable '{Token}'")
+
+    def __compare(Left: str, Operator: str, Right: str) -> bool:
+        if (Operator == 'in'):
+            return Left in Right
+        elif (Operator == 'not in'):
+            return Left not in Right
+        elif (Operator == '==='):
+            return Left == Right
+
+        left_version, right_version = ParseVersion(Left), ParseVersion(Right)
+
+        # Operands are compared as versions if both are valid versions, else, only as strings
+        if (left_version is None) or (right_version is None):
+            if (Operator == '=='):
+                return Left == Right
+            elif (Operator == '!='):
+                return Left != Right
+            return False
+
+        if (Operator == '~='):
+            # Compatible release: at least 'Right', within the same series (e.g. '~= 2.2' means '>= 2.2, == 2.*')
+            series = Right.split('.')[:-1]
+            return (left_version >= right_version) and (Left.split('.')[:len(series)] == series)
+
+        return dict(
+                {
+                '==': left_version == right_version,
+                '!=': left_version != right_version,
+                '<=': left_version <= right_version,
+                '>=': left_version >= right_version,
+                '<' : left_version < right_version,
+                '>' : left_version > right_version
+                }
+            )[Operator]
+
+    def __parseComparison() -> bool:
+        nonlocal position
+
+        if (tokens[position] == '('):
+            position += 1
+            result = __parseOr()
+            if (position >= len(tokens)) or (tokens[position] != ')'):
+                raise ValueError(f"Invalid marker '{Marker}'")
+            position += 1
+            return result
+
+        (left_value, left_variable), operator, (right_value, right_variable) = __getValue(tokens[position]), tokens[position + 1], __getValue(tokens[position + 2])
+        position += 3
+
+        if (operator not in ('===', '==', '!=', '~=', '<=', '>=', '<', '>', 'in', 'not in')):
+            raise ValueError(f"Invalid marker '{Marker}'")
+
+        # 'extra' is satisfied by any requested extra
+        if (left_variable and left_value is None) or (right_variable and right_value is None):
+            compared_value = DistributionIndex.NormalizeName(right_value if (left_value is None) else left_value)
+            return any([__compare(extra, operator, compared_value) if (left_value is None) else __compare(compared_value, operator, extra) for extra in extras])
+
+        return __compare(left_value, operator, right_value)
+
+    def __parseAnd() -> bool:
+        nonlocal position
+        result = __parseComparison()
+        while (position < len(tokens)) and (tokens[position] == 'and'):
+            position += 1
+            result = __parseComparison() and result
+        return result
+
+    def __parseOr() -> bool:
+        nonlocal position
+        result = __parseAnd()
+        while (position < len(tokens)) and (tokens[position] == 'or'):
+            position += 1
+            result = __parseAnd() or result
+        return result
+
+    try:
+        result = __parseOr()
+    except IndexError:
+        raise ValueError(f"Invalid marker '{Marker}'")
+
+    if (position != len(tokens)):
+        raise ValueError(f"Invalid marker '{Marker}'")
+
+    return result
+
+def IsVersionSatisfied(Version: str, Specifier: str) -> bool:
+    """
+        ### Checks a version against a version specifier (PEP 440), e.g. '>=1.21.1,<3' or '==2.*'.
+
+        #### Args:
+            - Version (str): Version to be checked.
+            - Specifier (str): Comma separated version clauses. An empty specifier is satisfied by any version.
+
+        #### Returns:
+            - bool: True if 'Version' satisfies every clause of 'Specifier'.
+
+        #### Raises:
+            - ValueError: If 'Specifier' is not a valid specifier.
+    """
+
+    version_key = ParseVersion(Version)
+
+    for clause in [clause.strip() for clause in str(Specifier).split(',') if (clause.strip())]:
+        clause_match = re.fullmatch(r'(===|==|!=|~=|<=|>=|<|>)\s*(\S+)', clause)
+
+        if (clause_match is None):
+            raise ValueError(f"Invalid specifier '{Specifier}'")
+
+        operator, clause_version = clause_match.groups()
+
+        # Arbitrary equality compares strings, every other operator requires valid versions
+        if (operator == '==='):
+            satisfied = str(Version).strip().lower() == clause_version.lower()
+
+        elif (version_key is None):
+            satisfied = False
+
+        # Prefix matching (e.g. '==2.*') compares release segments only
+        elif (operator in ('==', '!=')) and (clause_version.endswith('.*')):
+            prefix_key = ParseVersion(clause_version[:-2])
+
+            if (prefix_key is None):
+                raise ValueError(f"Invalid specifier '{Specifier}'")
+
+            prefix = [int(part) for part in re.match(r'v?(?:\d+!)?(\d+(?:\.\d+)*)', clause_version.lower()).group(1).split('.')]
+            release = list(version_key[1]) + [0] * len(prefix)
+            satisfied = ((version_key[0] == prefix_key[0]) and (release[:len(prefix)] == prefix)) == (operator == '==')
+
+        else:
+            clause_key = ParseVersion(clause_version)
+
+            if (clause_key is None):
+                raise ValueError(f"Invalid specifier '{Specifier}'")
+
+            if (operator == '~='):
+                # Compatible release: at least 'clause_version', within the same series (e.g. '~= 2.2' means '>= 2.2, == 2.*')
+                series = [int(part) for part in re.match(r'v?(?:\d+!)?(\d+(?:\.\d+)*)', clause_version.lower()).group(1).split('.')][:-1]
+                release = list(version_key[1]) + [0] * len(series)
+                satisfied = (version_key >= clause_key) and (version_key[0] == clause_key[0]) and (release[:len(series)] == series)
+
+            # Exclusive comparisons with a final release exclude its pre-releases ('<3' rejects '3.0rc1') and post-releases ('>2.0' rejects '2.0.post1')
+            elif (operator in ('<', '>')) and (version_key[:2] == clause_key[:2]) and (clause_key[2:] == ((2,), (0,), (1,))) \
+            and (((operator == '<') and ((version_key[2][0] < 2) or (version_key[4][0] == 0))) or ((operator == '>') and (version_key[3][0] == 1))):
+                satisfied = False
+
+            else:
+                satisfied = dict(
+                        {
+                        '==': version_key == clause_key,
+                        '!=': version_key != clause_key,
+                        '<=': version_key <= clause_key,
+                        '>=': version_key >= clause_key,
+                        '<' : version_key < clause_key,
+                        '>' : version_key > clause_key
+                        }
+                    )[operator]
+
+        if (not satisfied):
+            return False
+
+    return True
+
+def ParseRequirement(Requirement: str) -> dict:
+    """
+        ### Parses a requirement specifier (PEP 508), as listed by 'Requires-Dist' metadata (e.g. 'urllib3[socks] (<3,>=1.21.1) ; extra == "socks"').\n
+        Direct references ('name @ url ; marker') are supported, the marker of a direct reference must be separated from the URL by whitespace, as URLs may contain ';'.
+
+        #### Args:
+            - Requirement (str): Requirement specifier.
+
+        #### Returns:
+            - dict: Return keys = Name, Extras, Specifier, URL, Marker ('Specifier' is empty for direct references, 'URL' is None if the requirement is not a direct reference, 'Marker' is None if the requirement is unconditional)
+
+        #### Raises:
+            - ValueError: If 'Requirement' is not a valid requirement.
+    """
+
+    requirement_match = re.match(r'\s*([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[([^\]]*)\])?\s*', str(Requirement))
+
+    if (requirement_match is None):
+        raise ValueError(f"Invalid requirement '{Requirement}'")
+
+    requirement, url = str(Requirement)[requirement_match.end():], None
+
+    if (requirement.startswith('@')):
+        # Direct reference, the URL ends at the first whitespace
+        url_match = re.fullmatch(r'@\s*(\S+)(?:\s+;(.*)|\s*)', requirement, flags=re.DOTALL)
+
+        if (url_match is None):
+            raise ValueError(f"Invalid requirement '{Requirement}'")
+
+        url, specifier, marker = url_match.group(1), '', url_match.group(2) or ''
+
+    else:
+        specifier, _, marker = requirement.partition(';')
+
+    return dict(
+            {
+            'Name'      : requirement_match.group(1),
+            'Extras'    : tuple([extra.strip() for extra in (requirement_match.group(2) or '').split(',') if (extra.strip())]),
+            'Specifier' : specifier.strip().strip('()').strip(),
+            'URL'       : url,
+            'Marker'    : marker.strip() or None
+            }
+        )
+
+class DistributionIndex:
+    """
+        ## Map of import names to installed distributions, built in a single pass over distributions metadata.\n
+        Import names are read from 'top_level.txt', or derived from 'RECORD' for distributions not shipping it.
+        The index can be persisted, it is then rebuilt only if the environment fingerprint changed.
+
+        ### Variables:\n
+            >>> CachePath
+            >>> Distributions
+            >>> ImportNames
+            >>> KNOWN_DISTRIBUTIONS
+
+        ### Public Methods:\n
+            >>> GetDependencies(self)
+            >>> GetDependencyClosure(self)
+            >>> GetDistribution(self)
+            >>> GetInstallName(self)
+            >>> NormalizeName()
+    """
+
+    # Distributions of common packages whose import name differs from their distribution name, used to install packages which are not installed yet
+    KNOWN_DISTRIBUTIONS = dict(
+            {
+            "attr"          : "attrs",
+            "Bio"           : "biopython",
+            "bs4"           : "beautifulsoup4",
+            "Crypto"        : "pycryptodome",
+            "cv2"           : "opencv-python",
+            "dateutil"      : "python-dateutil",
+            "docx"          : "python-docx",
+            "dotenv"        : "python-dotenv",
+            "fitz"          : "PyMuPDF",
+            "git"           : "GitPython",
+            "grpc"          : "grpcio",
+            "jwt"           : "PyJWT",
+            "magic"         : "python-magic",
+            "MySQLdb"       : "mysqlclient",
+            "nacl"          : "PyNaCl",
+            "OpenSSL"       : "pyOpenSSL",
+            "PIL"           : "Pillow",
+            "pptx"          : "python-pptx",
+            "serial"        : "pyserial",
+            "skimage"       : "scikit-image",
+            "sklearn"       : "scikit-learn",
+            "slugify"       : "python-slugify",
+            "socks"         : "PySocks",
+            "win32api"      : "pywin32",
+            "wx"            : "wxPython",
+            "yaml"          : "PyYAML",
+            "zmq"           : "pyzmq"
+            }
+        )
+
+    def __init__(self, CacheDir: str | None = None) -> None:
+        """
+            ### Constructor builds (or reloads) the index of installed distributions.
+
+            #### Args:
+                - CacheDir (str | None, optional): Directory where the index is persisted. If None, nothing is persisted. Defaults to None.
+        """
+
+        self.CachePath = f'{CacheDir}/DistributionIndex.json' if (CacheDir) else None
+        self.Distributions = dict()
+        self.ImportNames = dict()
+
+        # Dependencies of every (distribution, extras) pair already evaluated, shared by all dependency walks of the instance
+        self.__dependencies = dict()
+        self.__markerEnvironment = None
+
+        environment_fingerprint = EnvironmentSnapshot.GetPathsFingerprint()
+
+        # Loading the index of a previous run, an unreadable or outdated index is simply rebuilt
+        if (self.CachePath is not None) and (os.path.isfile(self.CachePath)):
+            try:
+                with open(file=self.CachePath, mode='r') as index:
+                    index_data = json.load(index)
+
+                if (index_data.get('Version') == __version__) \
+                and (index_data.get('Environment') == environment_fingerprint):
+                    self.Distributions = dict(index_data['Distributions'])
+                    self.ImportNames = dict(index_data['ImportNames'])
+
+            except (OSError, ValueError, KeyError):
+                self.Distributions = dict()
+                self.ImportNames = dict()
+
+        if (not self.Distributions):
+            self.__Build()
+            self.__Save(EnvironmentFingerprint=environment_fingerprint)
+
+    @staticmethod
+    def NormalizeName(DistributionName: str) -> str:
+        """
+            ### Normalizes a distribution name, so differently spelled names of the same distribution match (e.g. 'PyYAML' and 'pyyaml').
+
+            #### Args:
+                - DistributionName (str): Distribution name.
+
+            #### Returns:
+                - str: Normalized name.
+        """
+
+        return re.sub(r'[-_.]+', '-', str(DistributionName)).lower()
+
+    def GetDistribution(self, ImportName: str) -> dict | None:
+        """
+            ### Finds the installed distribution providing an import name.
+
+            #### Args:
+                - ImportName (str): Imported package name (e.g. 'yaml').
+
+            #### Returns:
+                - dict | None: Distribution 'Name', 'Version' and 'Requires', or None if no installed distribution provides it.
+        """
+
+        distribution_keys = self.ImportNames.get(str(ImportName).split('.')[0]) or [self.NormalizeName(ImportName)]
+
+        for distribution_key in distribution_keys:
+            if (distribution_key in self.Distributions):
+                return self.Distributions[distribution_key]
+
+        return None
+
+    def GetDependencies(self, DistributionName: str, Extras: tuple | list = ()) -> tuple:
+        """
+            ### Lists distributions directly required by an installed distribution, evaluating 'Requires-Dist' markers for the running interpreter.\n
+            Results are memoized, so every distribution is evaluated once however many walks reach it.
+
+            #### Args:
+                - DistributionName (str): Distribution name.
+                - Extras (tuple | list, optional): Requested extras of the distribution. Defaults to ().
+
+            #### Returns:
+                - tuple: (NormalizedName, Extras) of every required distribution. Empty if the distribution is not installed.
+        """
+
+        dependency_key = (self.NormalizeName(DistributionName), tuple(sorted(set([self.NormalizeName(extra) for extra in Extras]))))
+
+        if (dependency_key not in self.__dependencies):
+            if (self.__markerEnvironment is None):
+                self.__markerEnvironment = GetMarkerEnvironment()
+
+            distribution = self.Distributions.get(dependency_key[0])
+            dependencies = []
+
+            for requirement in (distribution['Requires'] if (distribution is not None) else []):
+                try:
+                    parsed_requirement = ParseRequirement(Requirement=requirement)
+
+                    if (parsed_requirement['Marker'] is None) \
+                    or (EvaluateMarker(Marker=parsed_requirement['Marker'], Environment=self.__markerEnvironment, Extras=dependency_key[1])):
+                        dependency = (self.NormalizeName(parsed_requirement['Name']), tuple(sorted(set([self.NormalizeName(extra) for extra in parsed_requirement['Extras']]))))
+
+                        if (dependency not in dependencies):
+                            dependencies.append(dependency)
+
+                except ValueError as error:
+                    print(f"Could not evaluate requirement '{requirement}' of '{DistributionName}': {error}")
+
+            self.__dependencies[dependency_key] = tuple(dependencies)
+
+        return self.__dependencies[dependency_key]
+
+    def GetDependencyClosure(self, DistributionNames: list) -> tuple:
+        """
+            ### Walks dependencies of installed distributions transitively.
+
+            #### Args:
+                - DistributionNames (list): Names of the root distributions (e.g. distributions detected in a project).
+
+            #### Returns:
+                - tuple: (Distributions, Missing). 'Distributions' lists installed distributions required by the roots (roots included), sorted by normalized name.
+                'Missing' lists names of required distributions that are not installed.
+        """
+
+        pending = collections.deque([(self.NormalizeName(name), tuple()) for name in DistributionNames])
+        visited = set()
+        required = set()
+        missing = set()
+
+        while (pending):
+            node = pending.popleft()
+
+            if (node in visited):
+                continue
+
+            visited.add(node)
+
+            if (node[0] not in self.Distributions):
+                missing.add(node[0])
+                continue
+
+            required.add(node[0])
+            pending.extend(self.GetDependencies(DistributionName=node[0], Extras=node[1]))
+
+        return (tuple([self.Distributions[key] for key in sorted(required)]), tuple(sorted(missing)))
+
+    def GetInstallName(self, ImportName: str) -> str:
+        """
+            ### Resolves the distribution name pip must install to provide an import name.
+
+            #### Args:
+                - ImportName (str): Imported package name (e.g. 'cv2').
+
+            #### Returns:
+                - str: Installed or known distribution name (e.g. 'opencv-python'), else, the import name itself.
+        """
+
+        distribution = self.GetDistribution(ImportName=ImportName)
+
+        if (distribution is not None):
+            return distribution['Name']
+
+        return self.KNOWN_DISTRIBUTIONS.get(str(ImportName).split('.')[0], str(ImportName))
+
+    def __Build(self) -> None:
+        """
+            ### Reads metadata of every installed distribution once.
+
+            #### Returns:
+                None
+        """
+
+        for distribution in importlib.metadata.distributions():
+            try:
+                # Metadata is parsed on every access, it is read once per distribution
+                metadata = distribution.metadata
+                distribution_name = metadata['Name']
+
+                if (not distribution_name):
+                    continue
+
+                distribution_key = self.NormalizeName(distribution_name)
+
+                # The first distribution found on 'sys.path' shadows the others, same as the import system does
+                if (distribution_key in self.Distributions):
+                    continue
+
+                self.Distributions[distribution_key] = dict({'Name': distribution_name, 'Version': metadata['Version'], 'Requires': list(metadata.get_all('Requires-Dist') or [])})
+
+                for import_name in self.__GetImportNames(Distribution=distribution):
+                    self.ImportNames.setdefault(import_name, []).append(distribution_key)
+
+            except (OSError, ValueError) as error:
+                print(error)
+
+        return None
+
+    def __GetImportNames(self, Distribution: importlib.metadata.Distribution) -> set:
+        """
+            ### Lists top-level import names provided by a distribution.
+
+            #### Args:
+                - Distribution (importlib.metadata.Distribution): Installed distribution.
+
+            #### Returns:
+                - set: Import names.
+        """
+
+        top_level = Distribution.read_text('top_level.txt')
+
+        if (top_level):
+            import_names = set([line.strip().split('/')[0] for line in top_level.splitlines()])
+
+        else:
+            import_names = set()
+
+            for distribution_file in (Distribution.files or []):
+                file_parts = distribution_file.parts
+
+                # Metadata directories and files installed outside the distribution root (e.g. scripts) are not importable
+                if (len(file_parts) == 0) \
+                or (file_parts[0] in ('..', '__pycache__')) \
+                or (file_parts[0].endswith(('.dist-info', '.egg-info', '.data'))):
+                    continue
+
+                # Package directory, or a top-level module file (e.g. 'six.py', 'module.cpython-311-x86_64-linux-gnu.so')
+                if (len(file_parts) > 1):
+                    import_names.add(file_parts[0])
+                else:
+                    for suffix, _ in EnvironmentSnapshot.MODULE_SUFFIXES:
+                        if (file_parts[0].endswith(suffix)):
+                            import_names.add(file_parts[0][:-len(suffix)].split('.')[0])
+                            break
+
+        return set([import_name for import_name in import_names if (import_name.isidentifier())])
+
+    def __Save(self, EnvironmentFingerprint: str) -> None:
+        """
+            ### Persists the index atomically, so concurrent processes never read a partial index.
+
+            #### Args:
+                - EnvironmentFingerprint (str): Environment fingerprint the index was built for.
+
+            #### Returns:
+                None
+        """
+
+        if (self.CachePath is None):
+            return None
+
+        temp_path = f'{self.CachePath}.{os.getpid()}.tmp'
+
+        try:
+            with open(file=temp_path, mode='w') as index:
+                json.dump(dict({'Version': __version__, 'Environment': EnvironmentFingerprint, 'Distributions': self.Distributions, 'ImportNames': self.ImportNames}), index)
+
+            os.replace(temp_path, self.CachePath)
+
+        except OSError as error:
+            print(error)
+
+        return None
+
+class RequirementsLock:
+    """
+        ## Requirements file exported by 'ExportRequirements()' or 'ExportLockfile()', recording the project sources it was derived from.\n
+        Its header holds a digest of these sources, so the file can stand in for source analysis for as long as they do not change.
+
+        ### Variables:\n
+            >>> FilePath
+            >>> ProjectDir
+            >>> Requirements
+            >>> SourceFiles
+            >>> SourcesDigest
+
+        ### Public Methods:\n
+            >>> GetSourcesDigest()
+            >>> GetUnsatisfiedRequirements(self)
+            >>> IsFresh(self)
+            >>> Write(self)
+    """
+
+    def __init__(self, FilePath: str, ProjectDir: str) -> None:
+        """
+            ### Constructor reads the requirements file if it exists.
+
+            #### Args:
+                - FilePath (str): Requirements file path.
+                - ProjectDir (str): Project directory, source files are recorded relative to it.
+        """
+
+        self.FilePath = str(FilePath).replace('\\', '/')
+        self.ProjectDir = str(ProjectDir).replace('\\', '/')
+        self.Requirements = list()
+        self.SourceFiles = list()
+        self.SourcesDigest = None
+
+        if (os.path.isfile(self.FilePath)):
+            try:
+                with open(file=self.FilePath, mode='r') as requirements_file:
+                    for line in requirements_file.read().splitlines():
+                        if (line.startswith('# Sources: ')):
+                            self.SourcesDigest = line[len('# Sources: '):].strip()
+                        elif (line.startswith('# Files: ')):
+                            self.SourceFiles = list(json.loads(line[len('# Files: '):]))
+                        # Comments start with '#' at the beginning of a line or after whitespace, URLs may contain '#'
+                        elif (re.sub(r'(^|\s)#.*', '', line).strip()):
+                            self.Requirements.append(re.sub(r'(^|\s)#.*', '', line).strip())
+
+            except (OSError, ValueError) as error:
+                print(error)
+                self.SourcesDigest = None
+
+    @staticmethod
+    def GetSourcesDigest(ProjectDir: str, SourceFiles: list) -> str | None:
+        """
+            ### Hashes paths and contents of source files, so the digest survives checkouts and copies (unlike modification times).
+
+            #### Args:
+                - ProjectDir (str): Project directory.
+                - SourceFiles (list): Source files paths, relative to 'ProjectDir'.
+
+            #### Returns:
+                - str | None: Hex digest, or None if any file is unreadable.
+        """
+
+        digest = hashlib.blake2b(digest_size=16)
+
+        for source_file in sorted(SourceFiles):
+            try:
+                with open(file=f'{ProjectDir}/{source_file}', mode='rb') as source:
+                    digest.update(f'{source_file}\0'.encode() + hashlib.blake2b(source.read(), digest_size=16).digest())
+            except OSError:
+                return None
+
+        return digest.hexdigest()
+
+    def IsFresh(self) -> bool:
+        """
+            ### Checks that recorded sources did not change since the file was exported.
+
+            #### Returns:
+                - bool: True if the file records its sources and their digest still matches.
+        """
+
+        return (self.SourcesDigest is not None) \
+            and (len(self.SourceFiles) > 0) \
+            and (self.GetSourcesDigest(ProjectDir=self.ProjectDir, SourceFiles=self.SourceFiles) == self.SourcesDigest)
+
+    def GetUnsatisfiedRequirements(self, Distributions: DistributionIndex) -> tuple:
+        """
+            ### Checks every requirement against installed distributions, in a single pass over the distribution index.
+
+            #### Args:
+                - Distributions (DistributionIndex): Index of installed distributions.
+
+            #### Returns:
+                - tuple: Requirements not satisfied by the environment (missing, mismatching, or invalid). Empty if all requirements are satisfied.
+        """
+
+        unsatisfied_requirements = []
+
+        for requirement in self.Requirements:
+            try:
+                parsed_requirement = ParseRequirement(Requirement=requirement)
+
+                # This module is running, so it is always satisfied
+                if (parsed_requirement['Name'] == __name__) \
+                or ((parsed_requirement['Marker'] is not None) and (not EvaluateMarker(Marker=parsed_requirement['Marker']))):
+                    continue
+
+                distribution = Distributions.Distributions.get(Distributions.NormalizeName(parsed_requirement['Name']))
+
+                # The version installed from a direct reference is unknown beforehand, only its presence is checked
+                if (distribution is None) \
+                or ((parsed_requirement['URL'] is None) and (not IsVersionSatisfied(Version=distribution['Version'], Specifier=parsed_requirement['Specifier']))):
+                    unsatisfied_requirements.append(requirement)
+
+            except ValueError:
+                unsatisfied_requirements.append(requirement)
+
+        return tuple(unsatisfied_requirements)
+
+    def Write(self, Requirements: list, SourceFiles: list) -> None:
+        """
+            ### Writes requirements, headed by the project sources they were derived from.
+
+            #### Args:
+                - Requirements (list): Requirement specifiers (e.g. 'name==version').
+                - SourceFiles (list): Scanned source files paths. Files outside the project directory (e.g. installed packages) are not recorded.
+
+            #### Returns:
+                None
+        """
+
+        project_files = set()
+
+        for source_file in SourceFiles:
+            try:
+                relative_path = os.path.relpath(source_file, self.ProjectDir).replace('\\', '/')
+            except ValueError:
+                # Windows paths on another drive
+                continue
+
+            if (not relative_path.startswith('../')):
+                project_files.add(relative_path)
+
+        self.Requirements = list(Requirements)
+        self.SourceFiles = sorted(project_files)
+        self.SourcesDigest = self.GetSourcesDigest(ProjectDir=self.ProjectDir, SourceFiles=self.SourceFiles)
+
+        with open(file=self.FilePath, mode='w') as requirements_file:
+            if (self.SourcesDigest is not None):
+                requirements_file.write(f'# Sources: {self.SourcesDigest}\n')
+                requirements_file.write(f'# Files: {json.dumps(self.SourceFiles)}\n')
+
+            for requirement in self.Requirements:
+                requirements_file.write(requirement + '\n')
+
+        return None
+
+class StartupStamp:
+    """
+        ## Records the state of the last successful 'AutoImportMissings()' run of a script.\n
+        The stamp holds the fingerprint of every scanned source file, the interpreter, and the environment fingerprint,
+        so later runs can tell nothing changed by a handful of 'os.stat()' calls, without parsing or listing anything.
+
+        ### Variables:\n
+            >>> StampPath
+
+        ### Public Methods:\n
+            >>> GetCacheSetting()
+            >>> IsFresh(self)
+            >>> IsMainScriptFresh()
+            >>> Read(self)
+            >>> Write(self)
+    """
+
+    def __init__(self, CacheDir: str, ScriptPath: str, Options: str = '') -> None:
+        """
+            ### Constructor locates the stamp of a script run with specific options.
+
+            #### Args:
+                - CacheDir (str): Directory where stamps are stored.
+                - ScriptPath (str): Path of the scanned script.
+                - Options (str, optional): Scan options the stamp depends on. Defaults to ''.
+        """
+
+        stamp_key = hashlib.blake2b(f'{ScriptPath}|{Options}'.encode(), digest_size=16).hexdigest()
+        self.StampPath = f'{CacheDir}/Stamp-{stamp_key}.json'
+
+    @staticmethod
+    def GetInterpreter() -> list:
+        """
+            ### Identifies the running interpreter.
+
+            #### Returns:
+                - list: Interpreter executable, version and prefix.
+        """
+
+        return [sys.executable, sys.version, sys.prefix]
+
+    @staticmethod
+    def GetSourcesFingerprint(SourceFiles: list) -> str | None:
+        """
+            ### Hashes size and modification time of source files.
+
+            #### Args:
+                - SourceFiles (list): Source files paths.
+
+            #### Returns:
+                - str | None: Hex digest, or None if any file is unreachable.
+        """
+
+        sources = []
+
+        for fil in sorted(SourceFiles):
+            try:
+                file_stat = os.stat(fil)
+            except OSError:
+                return None
+
+            sources.append([fil, file_stat.st_size, file_stat.st_mtime_ns])
+
+        return hashlib.blake2b(json.dumps(sources).encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def GetOptions(IncludeDynamicImports: bool, DeepScan: bool, ImportContexts: tuple | list | None = None, Extractor: str = 'AST') -> str:
+        """
+            ### Serializes scan options the stamp depends on.
+
+            #### Args:
+                - IncludeDynamicImports (bool): 'AutoImportMissings()' option.
+                - DeepScan (bool): 'AutoImportMissings()' option.
+                - ImportContexts (tuple | list | None, optional): 'AutoImportMissings()' option. Defaults to None.
+                - Extractor (str, optional): 'AutoImportMissings()' option. Defaults to 'AST'.
+
+            #### Returns:
+                - str: Options string.
+        """
+
+        stamp_options = f'IncludeDynamicImports={bool(IncludeDynamicImports)}|DeepScan={bool(DeepScan)}'
+
+        if (ImportContexts is not None):
+            stamp_options += f'|ImportContexts={",".join(sorted(ImportContexts))}'
+
+        if (Extractor != 'AST'):
+            stamp_options += f'|Extractor={Extractor}'
+
+        return stamp_options
+
+    @staticmethod
+    def IsRescanForced() -> bool:
+        """
+            ### Checks 'PACKAGEMANAGER_FORCE_RESCAN' environment variable, which disables the startup fast path.
+
+            #### Returns:
+                - bool: True if a rescan is forced, else, False.
+        """
+
+        return (os.environ.get('PACKAGEMANAGER_FORCE_RESCAN', '').strip().lower() not in ('', '0', 'false', 'no'))
+
+    @staticmethod
+    def GetCacheSetting(Default: bool = True) -> str | bool:
+        """
+            ### Reads 'PACKAGEMANAGER_CACHE_DIR' environment variable, the same way for 'AutoImporter' and 'PackageManager()'.\n
+            'AutoImporter' caches in the user cache directory unless told otherwise, so its startup fast path works out of the box.
+
+            #### Args:
+                - Default (bool, optional): Setting if the variable is not set, True (user cache directory) for 'AutoImporter', False (disabled) for 'PackageManager()'. Defaults to True.
+
+            #### Returns:
+                - str | bool: 'Default' if it is not set, False if caching is disabled ('0', 'false', 'no'), True for the user cache directory ('1', 'true', 'yes'), or a cache directory path.
+        """
+
+        setting = os.environ.get('PACKAGEMANAGER_CACHE_DIR', '').strip()
+
+        if (setting == ''):
+            return bool(Default)
+        elif (setting.lower() in ('1', 'true', 'yes')):
+            return True
+        elif (setting.lower() in ('0', 'false', 'no')):
+            return False
+        else:
+            return setting
+
+    @staticmethod
+    def IsMainScriptFresh(IncludeDynamicImports: bool = True, DeepScan: bool = True) -> bool:
+        """
+            ### Startup fast path of 'AutoImporter': checks the stamp of '__main__' script without constructing 'PackageManager'.\n
+            Stamps are stored in the cache directory of 'AutoImporter' (see 'GetCacheSetting()').
+
+            #### Args:
+                - IncludeDynamicImports (bool, optional): 'AutoImportMissings()' option. Defaults to True.
+                - DeepScan (bool, optional): 'AutoImportMissings()' option. Defaults to True.
+
+            #### Returns:
+                - bool: True if the last successful run is still valid, else, False.
+        """
+
+        main_script_path = getattr(sys.modules['__main__'], '__file__', None)
+        cache_setting = StartupStamp.GetCacheSetting()
+
+        if (cache_setting is False) \
+        or (main_script_path is None) \
+        or (StartupStamp.IsRescanForced()):
+            return False
+
+        try:
+            cache_dir = GetCacheDir(CacheDir=cache_setting)
+        except OSError:
+            return False
+
+        startup_stamp = StartupStamp(CacheDir=cache_dir, ScriptPath=str(main_script_path.replace('\\', '/')), Options=StartupStamp.GetOptions(IncludeDynamicImports=IncludeDynamicImports, DeepScan=DeepScan))
+
+        return startup_stamp.IsFresh()
+
+    def IsFresh(self) -> bool:
+        """
+            ### Checks whether sources, interpreter and environment did not change since the stamp was written.
+
+            #### Returns:
+                - bool: True if nothing changed, else, False (also if the stamp does not exist).
+        """
+
+        return (self.Read() is not None)
+
+    def Read(self) -> dict | None:
+        """
+            ### Reads the stamp if sources, interpreter and environment did not change since it was written.
+
+            #### Returns:
+                - dict | None: Stamp data, or None if anything changed (also if the stamp does not exist).
+        """
+
+        try:
+            with open(file=self.StampPath, mode='r') as stamp:
+                stamp_data = json.load(stamp)
+        except (OSError, ValueError):
+            return None
+
+        if (stamp_data.get('Version') == __version__) \
+        and (stamp_data.get('Interpreter') == self.GetInterpreter()) \
+        and (stamp_data.get('Environment') == EnvironmentSnapshot.GetPathsFingerprint()) \
+        and (stamp_data.get('Sources') == self.GetSourcesFingerprint(SourceFiles=stamp_data.get('SourceFiles', []))):
+            return stamp_data
+
+        return None
+
+    def Write(self, SourceFiles: list, Result: dict | None = None) -> None:
+        """
+            ### Records current sources, interpreter and environment state.
+
+            #### Args:
+                - SourceFiles (list): Source files scanned by the run.
+                - Result (dict | None, optional): JSON serializable outcome of the run, stored along the stamp. Defaults to None.
+
+            #### Returns:
+                None
+        """
+
+        stamp_data = dict(
+                {
+                "Version"       : __version__,
+                "Interpreter"   : self.GetInterpreter(),
+                "Environment"   : EnvironmentSnapshot.GetPathsFingerprint(),
+                "SourceFiles"   : sorted(SourceFiles),
+                "Sources"       : self.GetSourcesFingerprint(SourceFiles=SourceFiles),
+                "WrittenAt"     : time.time(),
+                "Result"        : Result
+                }
+            )
+
+        # Written atomically, so concurrent processes never read a partial stamp
+        temp_path = f'{self.StampPath}.{os.getpid()}.tmp'
+
+        try:
+            with open(file=temp_path, mode='w') as stamp:
+                json.dump(stamp_data, stamp)
+
+            os.replace(temp_path, self.StampPath)
+
+        except OSError as error:
+            print(error)
+
+        return None
+
+class SingleFlightLock:
+    """
+        ## Cross-process lock electing a single process to run 'AutoImportMissings()' of a script.\n
+        Other processes block until the leader releases the lock, then reuse the result it published
+        (validated like a 'StartupStamp') instead of scanning and installing the same packages again.
+
+        ### Variables:\n
+            >>> LockPath
+            >>> Published
+
+        ### Public Methods:\n
+            >>> Acquire(self)
+            >>> GetPublishedResult(self)
+            >>> GetSetting()
+            >>> Publish(self)
+            >>> Release(self)
+    """
+
+    def __init__(self, LockDir: str, ScriptPath: str, Options: str = '') -> None:
+        """
+            ### Constructor locates the lock and the published result of a script run with specific options.
+
+            #### Args:
+                - LockDir (str): Directory shared by all coordinating processes.
+                - ScriptPath (str): Path of the scanned script.
+                - Options (str, optional): Scan options the result depends on. Defaults to ''.
+        """
+
+        lock_key = hashlib.blake2b(f'{ScriptPath}|{Options}'.encode(), digest_size=16).hexdigest()
+        self.LockPath = f'{LockDir}/SingleFlight-{lock_key}.lock'
+        self.Published = StartupStamp(CacheDir=LockDir, ScriptPath=ScriptPath, Options=f'{Options}|SingleFlight')
+
+        self.__lockFile = None
+
+    @staticmethod
+    def GetSetting() -> str | bool:
+        """
+            ### Reads 'PACKAGEMANAGER_SINGLE_FLIGHT' environment variable, which enables single-flight mode for 'AutoImporter'.
+
+            #### Returns:
+                - str | bool: False if disabled, True to lock in the cache directory, or a lock directory path.
+        """
+
+        setting = os.environ.get('PACKAGEMANAGER_SINGLE_FLIGHT', '').strip()
+
+        if (setting.lower() in ('', '0', 'false', 'no')):
+            return False
+        elif (setting.lower() in ('1', 'true', 'yes')):
+            return True
+        else:
+            return setting
+
+    def Acquire(self, Timeout: float = 300) -> bool:
+        """
+            ### Blocks until the lock is acquired or the timeout expires.
+
+            #### Args:
+                - Timeout (float, optional): Maximum seconds to wait. Defaults to 300.
+
+            #### Returns:
+                - bool: True if the lock was acquired, else, False.
+        """
+
+        if (sys.platform == 'win32'):
+            import msvcrt
+        else:
+            import fcntl
+
+        lock_file = open(file=self.LockPath, mode='a+b')
+        deadline = time.monotonic() + float(Timeout)
+
+        while True:
+            try:
+                if (sys.platform == 'win32'):
+                    lock_file.seek(0)
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+                self.__lockFile = lock_file
+                return True
+
+            except OSError:
+                if (time.monotonic() >= deadline):
+                    lock_file.close()
+                    return False
+
+                time.sleep(0.05)
+
+    def Release(self) -> None:
+        """
+            ### Releases the lock, letting waiting processes proceed.
+
+            #### Returns:
+                None
+        """
+
+        if (self.__lockFile is None):
+            return None
+
+        try:
+            if (sys.platform == 'win32'):
+                import msvcrt
+                self.__lockFile.seek(0)
+                msvcrt.locking(self.__lockFile.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self.__lockFile.fileno(), fcntl.LOCK_UN)
+        finally:
+            self.__lockFile.close()
+            self.__lockFile = None
+
+        return None
+
+    def Publish(self, SourceFiles: list, MissingPackages: tuple, FailedPackages: set) -> None:
+        """
+            ### Publishes the result of the leader's run for waiting processes.
+
+            #### Args:
+                - SourceFiles (list): Source files scanned by the run.
+                - MissingPackages (tuple): Packages found missing by the run.
+                - FailedPackages (set): Packages that could not be installed.
+
+            #### Returns:
+                None
+        """
+
+        return self.Published.Write(SourceFiles=SourceFiles, Result={"MissingPackages": list(MissingPackages or ()), "FailedPackages": sorted(FailedPackages)})
+
+    def GetPublishedResult(self, NotBefore: float, ReuseSuccessful: bool = True) -> dict | None:
+        """
+            ### Reads the published result if sources, interpreter and environment did not change since it was published.\n
+            Results published before 'NotBefore' (i.e. by an earlier flight) are only reused if 'ReuseSuccessful' is enabled and no package failed,
+            so failed installations are retried by later runs.
+
+            #### Args:
+                - NotBefore (float): Time ('time.time()') the caller started waiting for the lock.
+                - ReuseSuccessful (bool, optional): Reuses successful results of earlier flights. Defaults to True.
+
+            #### Returns:
+                - dict | None: 'MissingPackages', 'FailedPackages' and 'SourceFiles' of the run, or None if it must be run again.
+        """
+
+        published_data = self.Published.Read()
+
+        if (published_data is None) or (published_data.get('Result') is None):
+            return None
+
+        if (published_data.get('WrittenAt', 0) < NotBefore) \
+        and ((not bool(ReuseSuccessful)) or (len(published_data['Result'].get('FailedPackages', [])) > 0)):
+            return None
+
+        return dict(published_data['Result'], SourceFiles=published_data['SourceFiles'])
+
+class ScanPolicy:
+    """
+        Scope and budgets of a 'DeepScan'.\n
+        Scope decides which packages are scanned for their own imports (first-party only, maximum depth, include and exclude name patterns),\
+        budgets stop the traversal gracefully once the scan cost reaches a limit (files, bytes, wall-clock seconds).\
+        Packages out of scope or over budget are still reported as required, only their own imports are not collected.\
+        Every skipped package is recorded with the reason it was skipped.
+
+        ### Variables:\n
+            >>> Bytes
+            >>> Deadline
+            >>> Exclude
+            >>> Files
+            >>> FirstPartyOnly
+            >>> Include
+            >>> MaxBytes
+            >>> MaxDepth
+            >>> MaxFiles
+            >>> ProjectDir
+            >>> Skipped
+            >>> StoppedBy
+
+        ### Public Methods:\n
+            >>> Charge(self)
+            >>> FromEnvironment(cls)
+            >>> GetSkipReason(self)
+            >>> IsStopped(self)
+            >>> Skip(self)
+            >>> Start(self)
+            >>> ToDict(self)
+
+        ### Private Methods:\n
+            >>> __IsFirstParty(self)
+    """
+
+    def __init__(self, FirstPartyOnly: bool = False, ProjectDir: str | None = None, MaxDepth: int | None = None, Include: tuple | list | None = None, Exclude: tuple | list | None = None, MaxFiles: int | None = None, MaxBytes: int | None = None, Deadline: float | None = None) -> None:
+        """
+            ### Constructor stores the scope and budgets of the scan, nothing is limited by default.
+
+            #### Args:
+                - FirstPartyOnly (bool, optional): Only packages under 'ProjectDir' are scanned, installed packages are not (pip already knows their dependencies). Defaults to False.
+                - ProjectDir (str | None, optional): Project directory of 'FirstPartyOnly'. Defaults to None, which uses '__main__' script directory.
+                - MaxDepth (int | None, optional): Maximum import depth scanned, packages imported by the scanned script have depth 1. Defaults to None.
+                - Include (tuple | list | None, optional): Only packages matching any of these patterns (e.g. 'myproject*') are scanned. Defaults to None.
+                - Exclude (tuple | list | None, optional): Packages matching any of these patterns (e.g. 'numpy*') are not scanned. Defaults to None.
+                - MaxFiles (int | None, optional): Maximum number of files scanned. Defaults to None.
+                - MaxBytes (int | None, optional): Maximum size of files scanned, in bytes. Defaults to None.
+                - Deadline (float | None, optional): Maximum wall-clock seconds of the scan. Defaults to None.
+        """
+
+        self.FirstPartyOnly = bool(FirstPartyOnly)
+        self.ProjectDir = ProjectDir
+        self.MaxDepth = MaxDepth
+        self.Include = tuple(Include or ())
+        self.Exclude = tuple(Exclude or ())
+        self.MaxFiles = MaxFiles
+        self.MaxBytes = MaxBytes
+        self.Deadline = Deadline
+
+        self.Start()
+
+    @classmethod
+    def FromEnvironment(cls, Text: str | None = None):
+        """
+            ### Reads a scan policy from 'PACKAGEMANAGER_SCAN_POLICY' environment variable,\
+            formatted as comma separated options, e.g. 'FirstPartyOnly=1,MaxDepth=3,Exclude=numpy*|scipy*,Deadline=2'.
+
+            #### Args:
+                - Text (str | None, optional): Policy text to be parsed instead of the environment variable. Defaults to None.
+
+            #### Returns:
+                - ScanPolicy | None: Scan policy, or None if no policy is set.
+
+            #### Raises:
+                - ValueError: If an option is unknown or its value is invalid.
+        """
+
+        policy_text = os.environ.get('PACKAGEMANAGER_SCAN_POLICY', '') if (Text is None) else str(Text)
+        policy_options = dict()
+
+        for option in [option.strip() for option in policy_text.split(',') if (option.strip())]:
+            option_name, _, option_value = option.partition('=')
+            option_name, option_value = option_name.strip(), option_value.strip()
+
+            if (option_name == 'FirstPartyOnly'):
+                policy_options[option_name] = option_value.lower() in ('', '1', 'true', 'yes', 'on')
+            elif (option_name == 'ProjectDir'):
+                policy_options[option_name] = option_value
+            elif (option_name in ('Include', 'Exclude')):
+                policy_options[option_name] = tuple([pattern for pattern in option_value.split('|') if (pattern)])
+            elif (option_name in ('MaxDepth', 'MaxFiles', 'MaxBytes')):
+                policy_options[option_name] = int(option_value)
+            elif (option_name == 'Deadline'):
+                policy_options[option_name] = float(option_value)
+            else:
+                raise ValueError(f"Unknown scan policy option '{option_name}'")
+
+        return cls(**policy_options) if (policy_options) else None
+
+    def Start(self, ProjectDir: str | None = None) -> None:
+        """
+            ### Resets spent budgets and skipped packages, called when a scan starts.
+
+            #### Args:
+                - ProjectDir (str | None, optional): Project directory used by 'FirstPartyOnly' if 'ProjectDir' variable is not set. Defaults to None.
+
+            #### Returns:
+                None
+        """
+
+        self.Files = 0
+        self.Bytes = 0
+        self.Skipped = list()
+        self.StoppedBy = None
+
+        self.__startedAt = time.monotonic()
+        self.__projectDir = os.path.abspath(self.ProjectDir or ProjectDir) if (self.ProjectDir or ProjectDir) else None
+
+        return None
+
+    def GetSkipReason(self, PackageName: str, PackagePath: str | None = None, Depth: int = 1) -> str | None:
+        """
+            ### Checks whether a package is out of scope, or budgets are already spent.
+
+            #### Args:
+                - PackageName (str): Package name.
+                - PackagePath (str | None, optional): Package file path, needed by 'FirstPartyOnly'. Defaults to None.
+                - Depth (int, optional): Import depth of the package. Defaults to 1.
+
+            #### Returns:
+                - str | None: Reason ('Deadline', 'MaxFiles', 'MaxBytes', 'MaxDepth', 'Include', 'Exclude' or 'FirstPartyOnly') or None if the package can be scanned.
+        """
+
+        if (self.IsStopped()):
+            return self.StoppedBy
+
+        if (self.MaxDepth is not None) and (int(Depth) > int(self.MaxDepth)):
+            return 'MaxDepth'
+
+        package_names = (str(PackageName), str(PackageName).split('.')[0])
+
+        if (self.Include) \
+        and (not any([fnmatch.fnmatchcase(name, pattern) for name in package_names for pattern in self.Include])):
+            return 'Include'
+
+        if (any([fnmatch.fnmatchcase(name, pattern) for name in package_names for pattern in self.Exclude])):
+            return 'Exclude'
+
+        if (self.FirstPartyOnly) and (not self.__IsFirstParty(PackagePath=PackagePath)):
+            return 'FirstPartyOnly'
+
+        return None
+
+    def IsStopped(self) -> bool:
+        """
+            ### Checks whether the scan must stop, because budgets are spent or the deadline passed.
+
+            #### Returns:
+                - bool: True if no package must be scanned anymore ('StoppedBy' holds the reason).
+        """
+
+        if (self.StoppedBy is None) \
+        and (self.Deadline is not None) \
+        and (time.monotonic() - self.__startedAt >= float(self.Deadline)):
+            self.StoppedBy = 'Deadline'
+
+        return (self.StoppedBy is not None)
+
+    def Charge(self, SourceFiles: list | None) -> str | None:
+        """
+            ### Charges files of a package to the budgets, unless they would exceed them.\
+            A package exceeding the budgets stops the scan, no other package is scanned afterwards. Files sizes are only read if 'MaxBytes' is set.
+
+            #### Args:
+                - SourceFiles (list | None): Package source files, as returned by 'GetPackageFiles()'.
+
+            #### Returns:
+                - str | None: Exceeded budget ('MaxFiles' or 'MaxBytes'), or None if files were charged.
+        """
+
+        files_count = len(SourceFiles or [])
+        files_bytes = 0
+
+        if (self.MaxBytes is not None):
+            for source_file in (SourceFiles or []):
+                try:
+                    files_bytes += os.path.getsize(source_file)
+                except OSError:
+                    continue
+
+        if (self.MaxFiles is not None) and (self.Files + files_count > int(self.MaxFiles)):
+            self.StoppedBy = 'MaxFiles'
+        elif (self.MaxBytes is not None) and (self.Bytes + files_bytes > int(self.MaxBytes)):
+            self.StoppedBy = 'MaxBytes'
+        else:
+            self.Files += files_count
+            self.Bytes += files_bytes
+
+        return self.StoppedBy
+
+    def Skip(self, PackageName: str, Reason: str, Depth: int = 1) -> None:
+        """
+            ### Records a skipped package.
+
+            #### Args:
+                - PackageName (str): Package name.
+                - Reason (str): Reason returned by 'GetSkipReason()' or 'Charge()'.
+                - Depth (int, optional): Import depth of the package. Defaults to 1.
+
+            #### Returns:
+                None
+        """
+
+        self.Skipped.append(dict({'Package': str(PackageName), 'Reason': str(Reason), 'Depth': int(Depth)}))
+
+        return None
+
+    def ToDict(self) -> dict:
+        """
+            ### Returns a report of the last scan.
+
+            #### Returns:
+                - dict: Return keys = StoppedBy, Files, Bytes, Seconds, Skipped
+        """
+
+        return dict({'StoppedBy': self.StoppedBy, 'Files': self.Files, 'Bytes': self.Bytes, 'Seconds': time.monotonic() - self.__startedAt, 'Skipped': list(self.Skipped)})
+
+    def __IsFirstParty(self, PackagePath: str | None) -> bool:
+        """
+            ### Checks whether a package lies under the project directory.
+
+            #### Args:
+                - PackagePath (str | None): Package file path.
+
+            #### Returns:
+                - bool: True if the package is part of the project.
+        """
+
+        if (PackagePath is None) or (self.__projectDir is None):
+            return False
+
+        try:
+            return os.path.commonpath([self.__projectDir, os.path.abspath(PackagePath)]) == self.__projectDir
+        except ValueError:
+            return False
+
+class ImportGraph:
+    """
+        ## Import graph built by the scan: which package (or script) imports which.\n
+        Nodes are interned, each name gets an integer id once, and edges are kept as adjacency arrays of ids,
+        so large graphs stay compact in memory and on disk. Reverse edges are derived on demand.
+
+        ### Variables:\n
+            >>> Nodes
+            >>> Paths
+            >>> Root
+            >>> SourceFiles
+
+        ### Public Methods:\n
+            >>> AddImports(self)
+            >>> GetCachePath()
+            >>> GetDependencies(self)
+            >>> GetDependents(self)
+            >>> GetImportedNames(self)
+            >>> GetNodeId(self)
+            >>> GetStronglyConnectedComponents(self)
+            >>> GetWhyPath(self)
+            >>> Load(cls)
+            >>> Save(self)
+
+        ### Private Methods:\n
+            >>> __GetReverseEdges(self)
+            >>> __GetTargetIds(self)
+            >>> __Walk(self)
+    """
+
+    def __init__(self, Root: str = '__main__', RootPath: str | None = None) -> None:
+        """
+            ### Constructor creates a graph holding its root node only.
+
+            #### Args:
+                - Root (str, optional): Root node name, the scanned script. Defaults to '__main__'.
+                - RootPath (str | None, optional): Scanned script path. Defaults to None.
+        """
+
+        self.Root = str(Root)
+        self.Nodes = list()
+        self.Paths = list()
+        self.SourceFiles = list()
+
+        self.__nodeIds = dict()
+        self.__edges = list()
+        self.__reverseEdges = None
+
+        self.GetNodeId(Name=self.Root, Path=RootPath)
+
+    @staticmethod
+    def GetCachePath(CacheDir: str, ScriptPath: str, Options: str = '') -> str:
+        """
+            ### Locates the saved graph of a script scanned with specific options.
+
+            #### Args:
+                - CacheDir (str): Directory where graphs are saved.
+                - ScriptPath (str): Path of the scanned script.
+                - Options (str, optional): Scan options the graph depends on. Defaults to ''.
+
+            #### Returns:
+                - str: Graph file path.
+        """
+
+        graph_key = hashlib.blake2b(f'{ScriptPath}|{Options}'.encode(), digest_size=16).hexdigest()
+
+        return f'{CacheDir}/ImportGraph-{graph_key}.json'
+
+    def GetNodeId(self, Name: str, Path: str | None = None) -> int:
+        """
+            ### Returns the id of a node, adding it if it does not exist yet.
+
+            #### Args:
+                - Name (str): Node (package) name.
+                - Path (str | None, optional): Node file path, recorded if not known yet. Defaults to None.
+
+            #### Returns:
+                - int: Node id.
+        """
+
+        node_id = self.__nodeIds.get(Name)
+
+        if (node_id is None):
+            node_id = len(self.Nodes)
+            self.__nodeIds[sys.intern(str(Name))] = node_id
+            self.Nodes.append(sys.intern(str(Name)))
+            self.Paths.append(Path)
+            self.__edges.append(array.array('i'))
+            self.__reverseEdges = None
+
+        elif (Path is not None) and (self.Paths[node_id] is None):
+            self.Paths[node_id] = Path
+
+        return node_id
+
+    def AddImports(self, Name: str, Imports: tuple | list, Path: str | None = None) -> None:
+        """
+            ### Adds edges from a package to every package it imports.
+
+            #### Args:
+                - Name (str): Importing package name.
+                - Imports (tuple | list): Imported packages names.
+                - Path (str | None, optional): Importing package file path. Defaults to None.
+
+            #### Returns:
+                None
+        """
+
+        node_id = self.GetNodeId(Name=Name, Path=Path)
+        node_edges = set(self.__edges[node_id])
+
+        for imported in Imports:
+            imported_id = self.GetNodeId(Name=imported)
+
+            if (imported_id not in node_edges):
+                node_edges.add(imported_id)
+                self.__edges[node_id].append(imported_id)
+
+        self.__reverseEdges = None
+
+        return None
+
+    def GetImportedNames(self) -> tuple:
+        """
+            ### Returns every imported package, i.e. every node except the root.
+
+            #### Returns:
+                - tuple: Packages names.
+        """
+
+        return tuple([name for name in self.Nodes if (name != self.Root)])
+
+    def GetDependencies(self, Name: str, Transitive: bool = False) -> tuple:
+        """
+            ### Returns packages imported by a package (forward dependencies).
+
+            #### Args:
+                - Name (str): Package name, its submodules are included (e.g. 'yaml' includes 'yaml.loader').
+                - Transitive (bool, optional): Includes imports of imports. Defaults to False.
+
+            #### Returns:
+                - tuple: Sorted packages names.
+        """
+
+        return self.__Walk(StartIds=self.__GetTargetIds(Name=Name), Edges=self.__edges, Transitive=Transitive)
+
+    def GetDependents(self, Name: str, Transitive: bool = False) -> tuple:
+        """
+            ### Returns packages importing a package (reverse dependencies).
+
+            #### Args:
+                - Name (str): Package name, its submodules are included (e.g. 'yaml' includes 'yaml.loader').
+                - Transitive (bool, optional): Includes importers of importers. Defaults to False.
+
+            #### Returns:
+                - tuple: Sorted packages names.
+        """
+
+        return self.__Walk(StartIds=self.__GetTargetIds(Name=Name), Edges=self.__GetReverseEdges(), Transitive=Transitive)
+
+    def GetWhyPath(self, Name: str) -> list:
+        """
+            ### Explains why a package is required: the shortest import chain from the root to it.
+
+            #### Args:
+                - Name (str): Package name, its submodules are included (e.g. 'yaml' is reached by importing 'yaml.loader').
+
+            #### Returns:
+                - list: Chain of dicts (keys = Package, Path) starting with the root, or an empty list if the package is not reachable.
+        """
+
+        target_ids = set(self.__GetTargetIds(Name=Name))
+        parents = dict({0: None})
+        frontier = collections.deque([0])
+
+        while (frontier):
+            node_id = frontier.popleft()
+
+            if (node_id in target_ids):
+                chain = []
+
+                while (node_id is not None):
+                    chain.append(dict({'Package': self.Nodes[node_id], 'Path': self.Paths[node_id]}))
+                    node_id = parents[node_id]
+
+                return chain[::-1]
+
+            for imported_id in self.__edges[node_id]:
+                if (imported_id not in parents):
+                    parents[imported_id] = node_id
+                    frontier.append(imported_id)
+
+        return []
+
+    def GetStronglyConnectedComponents(self) -> list:
+        """
+            ### Finds import cycles: strongly connected components of the graph (Tarjan's algorithm, without recursion).
+
+            #### Returns:
+                - list: Components of more than one package (or a package importing itself), each as a sorted tuple of names, largest first.
+        """
+
+        indexes, low_links = dict(), dict()
+        stack, on_stack = [], set()
+        components = []
+        next_index = 0
+
+        for start_id in range(len(self.Nodes)):
+            if (start_id in indexes):
+                continue
+
+            indexes[start_id] = low_links[start_id] = next_index
+            next_index += 1
+            stack.append(start_id)
+            on_stack.add(start_id)
+            work_stack = [(start_id, iter(self.__edges[start_id]))]
+
+            while (work_stack):
+                node_id, edges = work_stack[-1]
+                pushed_child = False
+
+                for imported_id in edges:
+                    if (imported_id not in indexes):
+                        indexes[imported_id] = low_links[imported_id] = next_index
+                        next_index += 1
+                        stack.append(imported_id)
+                        on_stack.add(imported_id)
+                        work_stack.append((imported_id, iter(self.__edges[imported_id])))
+                        pushed_child = True
+                        break
+
+                    elif (imported_id in on_stack):
+                        low_links[node_id] = min(low_links[node_id], indexes[imported_id])
+
+                if (pushed_child):
+                    continue
+
+                work_stack.pop()
+
+                if (work_stack):
+                    parent_id = work_stack[-1][0]
+                    low_links[parent_id] = min(low_links[parent_id], low_links[node_id])
+
+                # 'node_id' is the root of a component, which is popped from the stack
+                if (low_links[node_id] == indexes[node_id]):
+                    component = []
+
+                    while True:
+                        member_id = stack.pop()
+                        on_stack.discard(member_id)
+                        component.append(member_id)
+
+                        if (member_id == node_id):
+                            break
+
+                    if (len(component) > 1) or (node_id in self.__edges[node_id]):
+                        components.append(tuple(sorted([self.Nodes[member_id] for member_id in component])))
+
+        return sorted(components, key=lambda component: (-len(component), component))
+
+    def Save(self, FilePath: str, SourceFiles: list | None = None, Options: str = '') -> None:
+        """
+            ### Saves the graph, along with the state of sources, interpreter and environment it was built from.\
+            Edges are stored as a single array of targets and an array of offsets (compressed sparse rows).
+
+            #### Args:
+                - FilePath (str): Graph file path.
+                - SourceFiles (list | None, optional): Source files scanned to build the graph. Defaults to None.
+                - Options (str, optional): Scan options the graph depends on. Defaults to ''.
+
+            #### Returns:
+                None
+        """
+
+        self.SourceFiles = sorted(SourceFiles or [])
+        edges_offsets = [0]
+
+        for node_edges in self.__edges:
+            edges_offsets.append(edges_offsets[-1] + len(node_edges))
+
+        graph_data = dict(
+                {
+                "Version"       : __version__,
+                "Options"       : str(Options),
+                "Interpreter"   : StartupStamp.GetInterpreter(),
+                "Environment"   : EnvironmentSnapshot.GetPathsFingerprint(),
+                "SourceFiles"   : self.SourceFiles,
+                "Sources"       : StartupStamp.GetSourcesFingerprint(SourceFiles=self.SourceFiles),
+                "Root"          : self.Root,
+                "Nodes"         : self.Nodes,
+                "Paths"         : self.Paths,
+                "Offsets"       : edges_offsets,
+                "Targets"       : [imported_id for node_edges in self.__edges for imported_id in node_edges]
+                }
+            )
+
+        # Written atomically, so concurrent processes never read a partial graph
+        temp_path = f'{FilePath}.{os.getpid()}.tmp'
+
+        try:
+            with open(file=temp_path, mode='w') as graph_file:
+                json.dump(graph_data, graph_file)
+
+            os.replace(temp_path, FilePath)
+
+        except OSError as error:
+            print(error)
+
+        return None
+
+    @classmethod
+    def Load(cls, FilePath: str, Options: str = '', Validate: bool = True):
+        """
+            ### Loads a saved graph.
+
+            #### Args:
+                - FilePath (str): Graph file path.
+                - Options (str, optional): Scan options the graph must have been built with. Defaults to ''.
+                - Validate (bool, optional): If enabled, the graph is only loaded if sources, interpreter and environment did not change since it was saved. Defaults to True.
+
+            #### Returns:
+                - ImportGraph | None: Loaded graph, or None if it does not exist, or it is stale.
+        """
+
+        try:
+            with open(file=FilePath, mode='r') as graph_file:
+                graph_data = json.load(graph_file)
+        except (OSError, ValueError):
+            return None
+
+        if (graph_data.get('Version') != __version__) \
+        or (graph_data.get('Options') != str(Options)):
+            return None
+
+        if (bool(Validate)) \
+        and ((graph_data.get('Interpreter') != StartupStamp.GetInterpreter()) \
+        or (graph_data.get('Environment') != EnvironmentSnapshot.GetPathsFingerprint()) \
+        or (graph_data.get('Sources') != StartupStamp.GetSourcesFingerprint(SourceFiles=graph_data.get('SourceFiles', [])))):
+            return None
+
+        graph = cls(Root=graph_data['Root'])
+        graph.SourceFiles = list(graph_data['SourceFiles'])
+
+        for node_name, node_path in zip(graph_data['Nodes'], graph_data['Paths']):
+            graph.GetNodeId(Name=node_name, Path=node_path)
+
+        edges_offsets, edges_targets = graph_data['Offsets'], graph_data['Targets']
+
+        for node_id in range(len(graph.Nodes)):
+            graph.__edges[node_id] = array.array('i', edges_targets[edges_offsets[node_id]:edges_offsets[node_id + 1]])
+
+        return graph
+
+    def __GetTargetIds(self, Name: str) -> list:
+        """
+            ### Returns ids of a package and its submodules.
+
+            #### Args:
+                - Name (str): Package name.
+
+            #### Returns:
+                - list: Nodes ids.
+        """
+
+        return [node_id for node_id, node_name in enumerate(self.Nodes) if (node_name == Name) or (node_name.startswith(f'{Name}.'))]
+
+    def __GetReverseEdges(self) -> list:
+        """
+            ### Returns reverse adjacency arrays, derived once from forward edges until the graph changes.
+
+            #### Returns:
+                - list: Importers ids of every node.
+        """
+
+        if (self.__reverseEdges is None):
+            reverse_edges = [array.array('i') for _ in self.Nodes]
+
+            for node_id, node_edges in enumerate(self.__edges):
+                for imported_id in node_edges:
+                    reverse_edges[imported_id].append(node_id)
+
+            self.__reverseEdges = reverse_edges
+
+        return self.__reverseEdges
+
+    def __Walk(self, StartIds: list, Edges: list, Transitive: bool = False) -> tuple:
+        """
+            ### Collects nodes adjacent to start nodes, or reachable from them.
+
+            #### Args:
+                - StartIds (list): Start nodes ids.
+                - Edges (list): Forward or reverse adjacency arrays.
+                - Transitive (bool, optional): Follows edges transitively. Defaults to False.
+
+            #### Returns:
+                - tuple: Sorted nodes names, start nodes excluded.
+        """
+
+        reached_ids = set()
+        frontier = collections.deque(StartIds)
+
+        while (frontier):
+            node_id = frontier.popleft()
+
+            for adjacent_id in Edges[node_id]:
+                if (adjacent_id not in reached_ids):
+                    reached_ids.add(adjacent_id)
+
+                    if (bool(Transitive)):
+                        frontier.append(adjacent_id)
+
+        return tuple(sorted([self.Nodes[node_id] for node_id in (reached_ids - set(StartIds))]))
+
+def IsProjectModule(ModuleName: str, ProjectDir: str, ModulePath: str | None = None) -> bool:
+    """
+        Tells whether a module belongs to a project rather than being installed, wherever its files are.\n
+        A module resolved from the project directory itself (first 'sys.path' entry when its script runs) belongs to the project,
+        so does a module located under the project directory outside of any site directory (e.g. 'src' layouts).
+        Packages installed in a virtual environment inside the project (e.g. '.venv/lib/site-packages') do not.
+
+        #### Args:
+            - ModuleName (str): Module name, only its top-level package is resolved.
+            - ProjectDir (str): Project directory, the entry script directory.
+            - ModulePath (str | None, optional): Module file path if it was resolved already. Defaults to None.
+
+        #### Returns:
+            - bool: True if the module belongs to the project.
+    """
+
+    project_dir = os.path.abspath(str(ProjectDir))
+    top_level_name = str(ModuleName).split('.')[0]
+
+    try:
+        module_spec = importlib.machinery.PathFinder.find_spec(top_level_name, [project_dir])
+    except (ImportError, ValueError):
+        module_spec = None
+
+    if (module_spec is not None) and (module_spec.origin is not None):
+        return True
+
+    # A plain directory is a namespace package, only imported from the project if no regular package of the same name is installed
+    if (module_spec is not None):
+        try:
+            installed_spec = importlib.machinery.PathFinder.find_spec(top_level_name, [entry for entry in sys.path if (os.path.abspath(entry or '.') != project_dir)])
+        except (ImportError, ValueError):
+            installed_spec = None
+
+        return (installed_spec is None) or (installed_spec.origin is None)
+
+    if (ModulePath is None):
+        return False
+
+    module_path = os.path.abspath(str(ModulePath))
+
+    try:
+        if (os.path.commonpath([project_dir, module_path]) != project_dir):
+            return False
+    except ValueError:
+        return False
+
+    return not bool(set(['site-packages', 'dist-packages']).intersection(os.path.relpath(module_path, project_dir).replace('\\', '/').split('/')))
+
+def IterPackageFiles(PackagePath: str):
+    """
+        Walks Python files of a package tree, subpackages included, without listing the whole tree upfront.
+
+        #### Args:
+            - PackagePath (str): Python module file, package '__init__.py' file, or package directory (any path inside it) absoulte path
+
+        #### Yields:
+            - str: Python files paths, files of a directory before its subpackages.
+    """
+
+    # A plain module is a tree of its own
+    if (os.path.isfile(PackagePath)) \
+    and (not os.path.basename(PackagePath).startswith('__init__.')):
+        yield PackagePath
+        return
+
+    pending_dirs = collections.deque([os.path.dirname(PackagePath).rstrip('/')])
+
+    while (pending_dirs):
+        pkg_dir = pending_dirs.popleft()
+
+        try:
+            dir_entries = sorted(os.scandir(pkg_dir), key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        for entry in dir_entries:
+            if (entry.name.endswith('.py')) and (entry.is_file()):
+                yield f'{pkg_dir}/{entry.name}'
+
+            # Only importable directories can hold subpackages, symbolic links are not followed to avoid cycles
+            elif (entry.name.isidentifier()) \
+            and (entry.name != '__pycache__') \
+            and (entry.is_dir(follow_symlinks=False)):
+                pending_dirs.append(f'{pkg_dir}/{entry.name}')
+
+def GetPackageFiles(PackagePath: str, Recursive: bool = False) -> list | None:
+    """
+        Lists Python files holding the source code of a package.
+
+        #### Args:
+            - PackagePath (str): Python file or package directory absoulte path
+            - Recursive (bool, optional): Lists the whole package tree, subpackages included, instead of the package files only. Defaults to False.
+
+        ### Raises:
+            - FileNotFoundError: If provided path is invalid or not a file
+
+        #### Returns:
+            - list | None: Target source files, or None if the path is unreachable
+    """
+    # Check if provided parameter is a file path
+    if (os.path.isfile(PackagePath)) and (not bool(Recursive)):
+        pkg_files = [PackagePath]
+
+    elif (os.path.isfile(PackagePath)):
+        pkg_files = list(IterPackageFiles(PackagePath=PackagePath))
+
+    # If provided parameter is not a file, is a directory,
+    # or relatively imported, try to walk the contents of it
+    else:
+        pkg_dir_name = os.path.dirname(PackagePath).rstrip('/')
+
+        if  (os.path.isdir(pkg_dir_name)) \
+        and (any([spth in pkg_dir_name for spth in sys.path])):
+            # Collects all .py files in the given directory
+            pkg_files = list(IterPackageFiles(PackagePath=PackagePath)) if (bool(Recursive)) else list(glob.glob(f'{pkg_dir_name}/*.py', recursive=True))
+
+        # If 'PackagePath' is unreachable, raise a FileNotFound Error
+        else:
+            pkg_files = None
+            print(FileNotFoundError(f'{PackagePath} could not be found!'))
+
+    return pkg_files
+
+class ImportCollector(ast.NodeVisitor):
+    """
+        ## Single-pass extractor of every import in a module, classified by the context it runs in.\n
+        Only statements are visited (expressions are walked only when looking for dynamic imports), so the whole tree
+        is covered at roughly the cost of a top-level loop.
+
+        Contexts, from weakest to strongest (an import nested in several contexts gets the strongest one):\n
+            * TopLevel: Imported when the module is imported (including class bodies, loops, and 'with' blocks).
+            * Lazy: Imported inside a function, only when it is called.
+            * Optional: Imported inside 'try' guarded by 'except ImportError' (or 'ModuleNotFoundError', 'Exception', bare 'except').
+            * TypeChecking: Imported inside 'if TYPE_CHECKING:', never at runtime.
+
+        ### Variables:\n
+            >>> CONTEXTS
+            >>> DynamicImports
+            >>> Imports
+
+        ### Public Methods:\n
+            >>> GetImports(self)
+    """
+
+    CONTEXTS = ('TopLevel', 'Lazy', 'Optional', 'TypeChecking')
+
+    def __init__(self, IncludeDynamicImports: bool = True) -> None:
+        """
+            ### Constructor prepares empty containers, call 'visit()' with a parsed module to collect its imports.
+
+            #### Args:
+                - IncludeDynamicImports (bool, optional): If enabled, '__import__()' and 'import_module()' calls with constant names are collected. Defaults to True.
+        """
+
+        self.Imports = {context: set() for context in self.CONTEXTS}
+        self.DynamicImports = {context: set() for context in self.CONTEXTS}
+
+        self.__includeDynamicImports = bool(IncludeDynamicImports)
+        self.__context = 'TopLevel'
+
+    def GetImports(self, Contexts: tuple | list = CONTEXTS, IncludeDynamicImports: bool = True) -> tuple:
+        """
+            ### Merges collected top-level package names of selected contexts.
+
+            #### Args:
+                - Contexts (tuple | list, optional): Contexts to be included. Defaults to all contexts.
+                - IncludeDynamicImports (bool, optional): Includes dynamic imports of selected contexts. Defaults to True.
+
+            #### Returns:
+                - tuple: Sorted packages names.
+        """
+
+        imports = set()
+
+        for context in Contexts:
+            imports.update(self.Imports[context])
+
+            if (bool(IncludeDynamicImports)):
+                imports.update(self.DynamicImports[context])
+
+        return tuple(sorted(imports))
+
+    def __VisitInContext(self, Context: str, Nodes: list) -> None:
+        """
+            ### Visits nodes in a context, keeping the outer context if it is stronger.
+
+            #### Args:
+                - Context (str): One of 'CONTEXTS'.
+                - Nodes (list): Nodes to be visited.
+
+            #### Returns:
+                None
+        """
+
+        # Nested contexts keep the strongest one (e.g. a lazy import inside 'if TYPE_CHECKING:' is still type-checking only)
+        outer_context = self.__context
+
+        if (self.CONTEXTS.index(Context) > self.CONTEXTS.index(outer_context)):
+            self.__context = Context
+
+        for node in Nodes:
+            self.visit(node)
+
+        self.__context = outer_context
+
+        return None
+
+    def __CollectDynamicImports(self, Node: ast.AST) -> None:
+        """
+            ### Collects constant names passed to '__import__()' and 'import_module()' calls within an expression.
+
+            #### Args:
+                - Node (ast.AST): Expression node to be walked.
+
+            #### Returns:
+                None
+        """
+
+        for sub_node in ast.walk(Node):
+            if (type(sub_node) != ast.Call):
+                continue
+
+            # Directly called (__import__(...), import_module(...)) or called as attribute (importlib.import_module(...))
+            func_name = getattr(sub_node.func, 'id', None) or getattr(sub_node.func, 'attr', None)
+
+            if (func_name not in ('__import__', 'import_module')):
+                continue
+
+            module_names = sub_node.args[:1] + [keyword.value for keyword in sub_node.keywords if (keyword.arg == 'name')]
+
+            for module_name in module_names:
+                if (type(module_name) == ast.Constant) \
+                and (type(module_name.value) == str) \
+                and (not module_name.value.startswith('.')):
+                    self.DynamicImports[self.__context].add(module_name.value.split('.')[0])
+
+        return None
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """
+            ### Visits child statements, and walks child expressions only if dynamic imports are collected.
+        """
+
+        for _, value in ast.iter_fields(node):
+            for child in (value if (type(value) == list) else [value]):
+                if (isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case))):
+                    self.visit(child)
+                elif (self.__includeDynamicImports) and (isinstance(child, ast.expr)):
+                    self.__CollectDynamicImports(Node=child)
+
+        return None
+
+    def visit_Import(self, node: ast.Import) -> None:
+        """
+            ### Collects packages names imported by 'import ...'
+        """
+
+        self.Imports[self.__context].update([alias.name.split('.')[0] for alias in node.names])
+
+        return None
+
+    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:
+        """
+            ### Collects packages names imported by 'from ... import ...'
+        """
+
+        # Relative imports belong to the analyzed package itself, same as top-level extraction
+        if (int(node.level) == 0) \
+        and (__name__ not in node.module):
+            self.Imports[self.__context].add(node.module.split('.')[0])
+
+        return None
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        """
+            ### Visits function body as 'Lazy' context.
+        """
+
+        # Decorators and defaults run when the function is defined, its body only when it is called
+        if (self.__includeDynamicImports):
+            for child in (node.decorator_list + node.args.defaults + [default for default in node.args.kw_defaults if (default is not None)]):
+                self.__CollectDynamicImports(Node=child)
+
+        self.__VisitInContext(Context='Lazy', Nodes=node.body)
+
+        return None
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_If(self, node: ast.If) -> None:
+        """
+            ### Visits 'if TYPE_CHECKING:' body as 'TypeChecking' context.
+        """
+
+        if (getattr(node.test, 'id', None) == 'TYPE_CHECKING') \
+        or (getattr(node.test, 'attr', None) == 'TYPE_CHECKING'):
+            self.__VisitInContext(Context='TypeChecking', Nodes=node.body)
+            self.__VisitInContext(Context=self.__context, Nodes=node.orelse)
+        else:
+            self.generic_visit(node)
+
+        return None
+
+    def visit_Try(self, node: ast.Try) -> None:
+        """
+            ### Visits 'try' body as 'Optional' context if its handlers catch failed imports.
+        """
+
+        # 'try' body is optional only if a handler catches failed imports, handlers, 'else' and 'finally' run as usual
+        handled_errors = set()
+
+        for handler in node.handlers:
+            if (handler.type is None):
+                handled_errors.add('Exception')
+            else:
+                handled_errors.update([getattr(error, 'id', None) or getattr(error, 'attr', None) for error in (handler.type.elts if (type(handler.type) == ast.Tuple) else [handler.type])])
+
+        if (handled_errors.intersection(('ImportError', 'ModuleNotFoundError', 'Exception', 'BaseException'))):
+            self.__VisitInContext(Context='Optional', Nodes=node.body)
+        else:
+            self.__VisitInContext(Context=self.__context, Nodes=node.body)
+
+        self.__VisitInContext(Context=self.__context, Nodes=node.handlers + node.orelse + node.finalbody)
+
+        return None
+
+    visit_TryStar = visit_Try
+
+def ReadPackageImports(PackagePath: str, SourceFiles: list | None, IncludeDynamicImports: bool = True, StrictSearch: bool = False, ImportContexts: tuple | list | None = None, Extractor: str = 'AST', Stats: Metrics | None = None) -> tuple:
+    """
+        Collects imported packages from python source files.\n
+        Every file is read and parsed independently, files that cannot be analyzed are reported and skipped.
+        Module-level so it can be dispatched to worker processes by parallel deep scans.
+
+        #### Args:
+            - PackagePath (str): Python file path to be analyzed for imports.
+            - SourceFiles (list | None): Python files holding the package source code, as returned by 'GetPackageFiles()'.
+            - IncludeDynamicImports (bool, optional): If enabled, packages imported dynamically while the code runs will be collected. Defaults to True.
+            - StrictSearch (bool, optional): If enabled, only nodes containing the word 'import' in their source code will be processed, and files without it are not parsed at all. Defaults to False.
+            - ImportContexts (tuple | list | None, optional): If set, the whole tree is analyzed by 'ImportCollector' and only imports of these contexts are collected ('StrictSearch' is not needed then). If None, only top-level nodes are analyzed. Defaults to None.
+            - Extractor (str, optional): 'AST' or 'Bytecode', see 'IterPackageImports()'. Defaults to 'AST'.
+            - Stats (Metrics | None, optional): Collects reading and parsing times. Defaults to None.
+
+        #### Returns:
+            - tuple: Names of imported modules by the code provided. If no imported modules found, an empty tuple will be returned.
+    """
+
+    imports = set()
+
+    for source_file, file_imports, error in IterPackageImports(PackagePath=PackagePath, SourceFiles=(SourceFiles or []), IncludeDynamicImports=IncludeDynamicImports, StrictSearch=StrictSearch, ImportContexts=ImportContexts, Extractor=Extractor, Stats=Stats):
+        if (error is not None):
+            print(f"Could not analyze '{source_file}': {error}")
+        else:
+            imports.update(file_imports)
+
+    return tuple(sorted(imports))
+
+def MeasurePackageImports(PackagePath: str, SourceFiles: list | None, IncludeDynamicImports: bool = True, StrictSearch: bool = False, ImportContexts: tuple | list | None = None, Extractor: str = 'AST') -> tuple:
+    """
+        Same as 'ReadPackageImports()', also returning reading and parsing times.\n
+        Module-level so it can be dispatched to worker processes by parallel deep scans, whose times are then merged by the parent process.
+
+        #### Returns:
+            - tuple: (Imports, Totals). 'Totals' as returned by 'Metrics.ToDict()'.
+    """
+
+    stats = Metrics()
+    imports = ReadPackageImports(PackagePath=PackagePath, SourceFiles=SourceFiles, IncludeDynamicImports=IncludeDynamicImports, StrictSearch=StrictSearch, ImportContexts=ImportContexts, Extractor=Extractor, Stats=stats)
+
+    return (imports, stats.ToDict())
+
+def IterPackageImports(PackagePath: str, SourceFiles: list | None = None, IncludeDynamicImports: bool = True, StrictSearch: bool = False, ImportContexts: tuple | list | None = None, Extractor: str = 'AST', Stats: Metrics | None = None):
+    """
+        Collects imported packages of every python source file of a package, one file at a time.\n
+        Files are read and parsed independently (memory is bounded by the largest file), and a file that cannot be read
+        or parsed is reported by its result instead of aborting the scan.
+
+        #### Args:
+            - PackagePath (str): Python module file, package '__init__.py' file, or package directory path.
+            - SourceFiles (list | None, optional): Files to be analyzed. Defaults to None, which walks the whole package tree with 'IterPackageFiles()'.
+            - IncludeDynamicImports (bool, optional): If enabled, packages imported dynamically while the code runs will be collected. Defaults to True.
+            - StrictSearch (bool, optional): 'ReadSourceImports()' option. Defaults to False.
+            - ImportContexts (tuple | list | None, optional): 'ReadSourceImports()' option. Defaults to None.
+            - Extractor (str, optional): 'AST' parses source code, 'Bytecode' reads cached bytecode with 'ReadBytecodeImports()' if 'ImportContexts' includes 'TopLevel', 'Optional' and 'TypeChecking' (e.g. 'ImportCollector.CONTEXTS'), and parses source code otherwise or if no valid bytecode exists. Defaults to 'AST'.
+            - Stats (Metrics | None, optional): Collects reading ('SourceRead') and parsing ('Parse') times, files and bytes read. Defaults to None.
+
+        #### Raises:
+            - ValueError: If 'Extractor' is unknown.
+
+        #### Yields:
+            - tuple: (FilePath, Imports, Error) of every file. 'Error' is None if the file was analyzed, else, 'Imports' is empty.
+    """
+
+    if (Extractor not in ('AST', 'Bytecode')):
+        raise ValueError(f"Unknown extractor '{Extractor}', expected 'AST' or 'Bytecode'!")
+
+    for source_file in (SourceFiles if (SourceFiles is not None) else IterPackageFiles(PackagePath=PackagePath)):
+        try:
+            file_imports = None
+
+            if (Extractor == 'Bytecode'):
+                with (Stats.Measure('Parse') if (Stats is not None) else contextlib.nullcontext()):
+                    file_imports = ReadBytecodeImports(FilePath=source_file, IncludeDynamicImports=IncludeDynamicImports, ImportContexts=ImportContexts)
+
+            if (file_imports is None):
+                with (Stats.Measure('SourceRead') if (Stats is not None) else contextlib.nullcontext()):
+                    with open(file=source_file, mode='r', errors='ignore') as source:
+                        source_code = source.read()
+                        source_size = os.fstat(source.fileno()).st_size
+
+                if (Stats is not None):
+                    Stats.Increment('FilesRead')
+                    Stats.Increment('BytesRead', source_size)
+
+                with (Stats.Measure('Parse') if (Stats is not None) else contextlib.nullcontext()):
+                    file_imports = ReadSourceImports(SourceCode=source_code, FilePath=source_file, IncludeDynamicImports=IncludeDynamicImports, StrictSearch=StrictSearch, ImportContexts=ImportContexts)
+
+        # Any failure (unreadable file, syntax error, null bytes, unexpected nodes) only affects this file
+        except Exception as error:
+            yield (source_file, tuple(), error)
+
+        else:
+            yield (source_file, tuple(file_imports), None)
+
+def ReadBytecodeImports(FilePath: str, IncludeDynamicImports: bool = True, ImportContexts: tuple | list | None = None) -> tuple | None:
+    """
+        Collects imported packages from the cached bytecode ('__pycache__/*.pyc') of a python source file, without parsing its source code.\n
+        The bytecode is only used if its header matches the source file (modification time and size, or source hash for hash-based files).
+        'IMPORT_NAME' instructions of the module code object and class bodies are collected (imports run on import),
+        and of functions too if 'Lazy' context is requested.
+
+        #### Args:
+            - FilePath (str): Python source file path.
+            - IncludeDynamicImports (bool, optional): If enabled, None is returned for files calling '__import__()' or 'import_module()', which bytecode cannot resolve. Defaults to True.
+            - ImportContexts (tuple | list | None, optional): Import contexts to be collected. Bytecode cannot tell 'Optional' nor 'TypeChecking' imports from 'TopLevel' ones,
+                so None is returned if only some of them are requested. Bytecode cannot tell top-level statements from nested ones either,
+                so None is returned by default too (source code extraction reads top-level statements only). Defaults to None.
+
+        #### Returns:
+            - tuple | None: Names of imported modules, or None if no valid bytecode exists (or it cannot honor the options) and source code must be parsed instead.
+    """
+
+    # Imported on demand, only bytecode extraction needs them and they would slow down every startup
+    import marshal, opcode
+
+    # Imports nested in top-level 'try', 'if' and 'class' blocks are only collected by contexts, they must not be reported by default
+    if (ImportContexts is None) \
+    or (not set(['TopLevel', 'Optional', 'TypeChecking']).issubset(ImportContexts)):
+        return None
+
+    try:
+        bytecode_path = importlib.util.cache_from_source(FilePath)
+
+        with open(file=bytecode_path, mode='rb') as bytecode_file:
+            bytecode = bytecode_file.read()
+
+        # Header: magic number, flags, then either source modification time and size, or source hash
+        if (bytecode[:4] != importlib.util.MAGIC_NUMBER) or (len(bytecode) < 16):
+            return None
+
+        if (int.from_bytes(bytecode[4:8], 'little') & 0b1):
+            with open(file=FilePath, mode='rb') as source_file:
+                if (importlib.util.source_hash(source_file.read()) != bytecode[8:16]):
+                    return None
+
+        else:
+            source_stat = os.stat(FilePath)
+
+            if (int.from_bytes(bytecode[8:12], 'little') != (int(source_stat.st_mtime) & 0xFFFFFFFF)) \
+            or (int.from_bytes(bytecode[12:16], 'little') != (source_stat.st_size & 0xFFFFFFFF)):
+                return None
+
+        module_code = marshal.loads(memoryview(bytecode)[16:])
+
+    except (OSError, ValueError, EOFError, TypeError, NotImplementedError):
+        return None
+
+    IMPORT_NAME, LOAD_CONST, EXTENDED_ARG = opcode.opmap['IMPORT_NAME'], opcode.opmap['LOAD_CONST'], opcode.opmap['EXTENDED_ARG']
+    CO_OPTIMIZED = 0x0001
+
+    include_functions = ('Lazy' in ImportContexts)
+    imports = set()
+    pending_codes = [module_code]
+
+    while (pending_codes):
+        code = pending_codes.pop()
+
+        if (bool(IncludeDynamicImports)) \
+        and (('__import__' in code.co_names) or ('import_module' in code.co_names)):
+            return None
+
+        # Nested code objects: class bodies run on import, functions (including lambdas and comprehensions) only when called
+        pending_codes.extend([const for const in code.co_consts if (type(const) == type(code)) and ((include_functions) or (not (const.co_flags & CO_OPTIMIZED)))])
+
+        raw_code = code.co_code
+        operations = raw_code[::2]
+        ind = operations.find(IMPORT_NAME)
+
+        while (ind != -1):
+            # Reading arguments of an instruction and its preceding ones ('LOAD_CONST level', 'LOAD_CONST fromlist', 'IMPORT_NAME name')
+            arguments = []
+            arg_ind = ind
+
+            for _ in range(3):
+                argument, shift, prev_ind = raw_code[(2 * arg_ind) + 1], 8, arg_ind - 1
+
+                while (prev_ind >= 0) and (operations[prev_ind] == EXTENDED_ARG):
+                    argument |= (raw_code[(2 * prev_ind) + 1] << shift)
+                    shift, prev_ind = shift + 8, prev_ind - 1
+
+                arguments.append((operations[arg_ind], argument))
+                arg_ind = prev_ind
+
+                if (arg_ind < 0):
+                    break
+
+            # Unexpected instructions layout (e.g. another interpreter version), source code must be parsed instead
+            if (len(arguments) < 3) \
+            or (arguments[1][0] != LOAD_CONST) \
+            or (arguments[2][0] != LOAD_CONST):
+                return None
+
+            module_name, from_list, level = code.co_names[arguments[0][1]], code.co_consts[arguments[1][1]], code.co_consts[arguments[2][1]]
+
+            # Relative imports belong to the analyzed package itself, same as source code extraction
+            if (level == 0) \
+            and ((from_list is None) or (__name__ not in module_name)):
+                imports.add(module_name.split('.')[0])
+
+            ind = operations.find(IMPORT_NAME, ind + 1)
+
+    return tuple(sorted(imports))
+
+def ReadSourceImports(SourceCode: str, FilePath: str = '<unknown>', IncludeDynamicImports: bool = True, StrictSearch: bool = False, ImportContexts: tuple | list | None = None) -> tuple:
+    """
+        Collects imported packages from python source code of a single file.
+
+        #### Args:
+            - SourceCode (str): Python source code to be analyzed for imports.
+            - FilePath (str, optional): File the source code was read from, used in syntax errors. Defaults to '<unknown>'.
+            - IncludeDynamicImports (bool, optional): If enabled, packages imported dynamically while the code runs will be collected. Defaults to True.
+            - StrictSearch (bool, optional): If enabled, only nodes containing the word 'import' in their source code will be processed, and sources without it are not parsed at all. Defaults to False.
+            - ImportContexts (tuple | list | None, optional): If set, the whole tree is analyzed by 'ImportCollector' and only imports of these contexts are collected ('StrictSearch' is not needed then). If None, only top-level nodes are analyzed. Defaults to None.
+
+        ### Raises:
+            - SyntaxError: If source code cannot be parsed.
+
+        #### Returns:
+            - tuple: Names of imported modules by the code provided. If no imported modules found, an empty tuple will be returned.
+    """
+
+    def __indexImportLines(SourceCode: str) -> tuple:
+        """
+            Indexes lines containing the word 'import' in a single pass over the source code
+
+            #### Args:
+                - SourceCode (str): Source code, with newlines normalized to '\\n' (as read in text mode)
+
+            #### Returns:
+                - tuple: (Lines, ImportLinesCount), where 'ImportLinesCount[n]' is the number of lines containing 'import' among the first 'n' lines
+        """
+
+        lines = SourceCode.split('\n')
+        import_lines_count = [0]
+
+        for line in lines:
+            import_lines_count.append(import_lines_count[-1] + ('import' in line))
+
+        return (lines, import_lines_count)
+
+    def __nodeContainsImport(Node: ast.stmt, Lines: list, ImportLinesCount: list) -> bool:
+        """
+            Checks whether the source code of a node contains the word 'import', same as 'ast.get_source_segment()' does,\
+            without re-splitting the source code for every node
+
+            #### Args:
+                - Node (ast.stmt): AST statement node object
+                - Lines (list): Source code lines, as returned by '__indexImportLines()'
+                - ImportLinesCount (list): Import lines index, as returned by '__indexImportLines()'
+
+            #### Returns:
+                - bool: True if the node source code contains 'import', else, False
+        """
+
+        first_line, last_line = (Node.lineno - 1), (Node.end_lineno - 1)
+
+        # Most nodes span no line containing 'import' at all, and are rejected without looking at their source code
+        if (ImportLinesCount[last_line + 1] == ImportLinesCount[first_line]):
+            return False
+
+        # Column offsets are UTF-8 byte offsets, only boundary lines are partially covered by the node
+        if (first_line == last_line):
+            return ('import' in Lines[first_line].encode()[Node.col_offset:Node.end_col_offset].decode())
+
+        return ('import' in Lines[first_line].encode()[Node.col_offset:].decode()) \
+            or (ImportLinesCount[last_line] > ImportLinesCount[first_line + 1]) \
+            or ('import' in Lines[last_line].encode()[:Node.end_col_offset].decode())
+
+    def __handleImport(Node: ast.Import) -> tuple:
+        """
+            Collects packages names imported by 'import ...'
+
+            #### Args:
+                - Node (ast.Import): AST Import type node object
+
+            #### Returns:
+                - tuple: Imported packages names
+        """
+
+        # Assure 'Node' type to process it
+        if (type(Node) == ast.Import):
+            # Collect packages names from Import Nodes
+            pkgs = [getPkgName(pkg.name) for pkg in Node.names]
+        
+        else:
+            # Return (None) if this is not an Import Node
+            pkgs = [None]
+        
+        return tuple(pkgs)
+
+    def __handleImportFrom(Node: ast.ImportFrom) -> tuple:
+        """
+            Collects packages names imported by 'from ... import ...'
+
+            #### Args:
+                Node (ast.ImportFrom): AST ImportFrom type node object
+
+            #### Returns:
+                tuple: Imported packages names
+        """
+        
+        # Assure 'Node' type to process it
+        if (type(Node) == ast.ImportFrom):
+            # Collect packages names from From...Import Nodes
+            module_name = Node.module
+
+            # Check if module level, whether it is a parent directory or not 'e.g. from . import pkg ==> level 1' | 'e.g. from module import pkg ==> level 0'
+            # MUST CHECK (__name__ not in module_name) == True to avoid issues with relative imports of the package
+            ## although this will not bring PackageManager name in packages list but it could be added manually later if need .
+            if (int(Node.level) == 0) \
+            and (__name__ not in module_name):
+                pkg = [getPkgName(module_name)]
+            else:
+                # If module is a parent directory, skip (pass as None)
+                pkg = [None]
+
+        else:
+            # Return (None) if this is not an ImportFrom Node
+            pkg = [None]
+        
+        return tuple(pkg)
+
+    def __handleAssign(Node: ast.Assign) -> tuple:
+        """
+            Collects packages names imported dynamically by assignment 'e.g. variable = __import__(module)'
+
+            #### Args:
+                - Node (ast.Assign): AST Assign type node object
+
+            #### Returns:
+                - tuple: Imported packages names
+        """
+
+        # Assure 'Node' type to process it
+        if (type(Node) == ast.Assign):
+            # Creating empty set to collect packages throughout the process
+            pkgs = set()
+            # Picking only functions assigned to a variable
+            if (hasattr(Node.value, 'func')):
+                # Shorthanding 'Node.value.func'
+                Node_func = Node.value.func
+                
+                # First if statement select directly called dynamic imports (e.g. import_module(module) or __import__(module))
+                # Second if statement select class.method called dynamic imports (e.g. importlib.import_module(module))
+                if ((hasattr(Node_func, 'id')) and (Node_func.id in ['__import__', 'import_module'])) \
+                or ((hasattr(Node_func, 'value')) and (getattr(Node_func.value, 'id', None) in ['importlib'])):
+                    
+                    # Looping over import function arguments to collect modules passed as arguments
+                    # This loop applies to positined argument assignment (e.g. __import__(module))
+                    for arg in Node.value.args:
+                        # Collecting argument value in the packages container, names only known at runtime are skipped
+                        if (type(arg) == ast.Constant) and (type(arg.value) == str):
+                            pkgs.add(getPkgName(arg.value))
+                    
+                    # This loop applies to referenced argument assignment (e.g. __import__(name=module))
+                    for keyword in Node.value.keywords:
+                        # Check if reference argument name == name (applies to '__import__' and 'importlib.import_module')
+                        if (keyword.arg == 'name') \
+                        and (type(keyword.value) == ast.Constant) and (type(keyword.value.value) == str):
+                            # Collecting argument value in the packages container
+                            pkgs.add(getPkgName(keyword.value.value))
+                
+                else:
+                    pass
+            
+            else:
+                pass
+        
+        else:
+            # Return (None) if this is not an Assign Node
+            pkgs = [None]
+
+        return tuple(pkgs)
+            
+    def __handleExpr(Node: ast.Expr) -> tuple:
+        """
+            Collects packages names imported dynamically by direct expression 'e.g. __import__(module)'
+
+            #### Args:
+                - Node (ast.Expr): AST Expr type node object
+
+            #### Returns:
+                - tuple: Imported packages names
+        """
+        
+        # Assure 'Node' type to process it
+        # The second part of the if statment is used to ensure it catches only called functions not comments
+        # The third part of the if statment ensures that the called import has valid argument value
+        if (type(Node) == ast.Expr) \
+        and (type(Node.value) == ast.Call) \
+        and ((Node.value.args) or (Node.value.keywords)):
+            # Creating empty set to collect packages throughout the process
+            pkgs = set()
+
+            # This loop applies to positined argument assignment (e.g. __import__(module))
+            for arg in Node.value.args:
+                # Picking only directly called functions (|__import__) not functions assigned to variables
+                if (type(arg) == ast.Constant) \
+                and (hasattr(arg, 'value')):
+                    # Adding module name to set container
+                    pkgs.add(arg.value)
+            
+            # Applies to referenced argument assignment (e.g. __import__(name=module))
+            for keyword in Node.value.keywords:
+                # Ensuring types appropriate for desired import calls (__import__(), importlib.import_module())
+                if (type(keyword.value) == ast.Constant) \
+                and (hasattr(keyword, 'value')):
+                    # Adding module name to set container
+                    pkgs.add(keyword.value.value)
+
+        else:
+            # Return (None) if this is not an Expr Node or the expression is not a function
+            pkgs = [None]
+
+        return tuple(pkgs)
+
+    #region FuncBody
+
+    source_code = str(SourceCode)
+
+    # Imports of any kind (including '__import__()' and 'import_module()') need the word 'import',
+    # so files without it are skipped before parsing whenever only such nodes are processed
+    if ((bool(StrictSearch)) or (ImportContexts is not None)) \
+    and ('import' not in source_code):
+        return tuple()
+
+    # Parsed code into ast nodes
+    parsed_code = ast.parse(source_code, filename=FilePath)
+
+    # Full-tree extraction classifies imports by context instead of only inspecting top-level nodes
+    if (ImportContexts is not None):
+        # Expressions are only walked for dynamic imports if the source could contain any
+        import_collector = ImportCollector(IncludeDynamicImports=(bool(IncludeDynamicImports)) and (('__import__' in source_code) or ('import_module' in source_code)))
+        import_collector.visit(parsed_code)
+
+        return import_collector.GetImports(Contexts=ImportContexts, IncludeDynamicImports=IncludeDynamicImports)
+
+    # Shorthanding slicing dot-separated imports (e.g. import os.path)
+    # and if pkg is somehow pass as None, return it as it is.
+    # To be used in above functions
+    getPkgName = lambda pkg: pkg.split('.')[0]
+
+    # Two empty containers to collect initial and dynamic imports
+    initial_imports = set()
+    dynamic_imports = set()
+
+    # If 'StrictSearch' is enabled, only nodes containing the word 'import' in their source code will be processed
+    # Lines are indexed once, so the filter is linear in the source code size
+    if (bool(StrictSearch)):
+        source_lines, import_lines_count = __indexImportLines(SourceCode=source_code)
+        code_nodes = [node for node in parsed_code.body if __nodeContainsImport(Node=node, Lines=source_lines, ImportLinesCount=import_lines_count)]
+    else:
+        code_nodes = parsed_code.body
+
+    # Looping over code nodes
+    for node in code_nodes:
+        # The following if statments selects only Import, ImportFrom, Assign, and Expression nodes
+        # from the provided code and process each node speacially.
+        if   (type(node) == ast.Import):      initial_imports.update(__handleImport(Node=node))
+        elif (type(node) == ast.ImportFrom):  initial_imports.update(__handleImportFrom(Node=node))
+        elif (type(node) == ast.Assign):      dynamic_imports.update(__handleAssign(Node=node))
+        elif (type(node) == ast.Expr):        dynamic_imports.update(__handleExpr(Node=node))
+        # 'else' here is set to pass to ignore every other node type
+        else: pass
+    
+    # If 'IncludeDynamicImports' is enabled, packages imported dynamically while the code runs will be collected.
+    # This includes packages imported by '__import__()' and 'importlib.import_module()'.
+    # IMPORTS STATEMENTS INSIDE LOOPS WILL NOT BE PROCESSED
+    if (bool(IncludeDynamicImports)):
+        imports = set().union(initial_imports, dynamic_imports)
+    else:
+        imports = initial_imports
+
+    # Check if imports has content. if yes, sort them, if no, set imports to None to indicate No Imports
+    if (imports):
+        # Neglecting every 'None' element
+        imports = [pkg for pkg in imports if str(pkg) != 'None']
+        # Sorting the imports list
+        imports = list(sorted(imports))
+    else:
+        imports = tuple()
+
+    #endregion
+
+    return tuple(imports)
+
+# Run by 'MeasureImportCost()' in a fresh interpreter ('-X importtime'): imports one package, then prints its RSS delta as JSON on stdout
+# ('__import__' is used since 'importlib.import_module' is not reported by '-X importtime')
+IMPORT_COST_PROBE = '''
+import json, os, sys
+
+def rss():
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+
+    try:
+        import resource
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if (sys.platform == 'darwin') else (max_rss * 1024)
+    except ImportError:
+        return None
+
+rss_before = rss()
+import_error = None
+
+try:
+    __import__(sys.argv[1])
+except BaseException as error:
+    import_error = f'{type(error).__name__}: {error}'
+
+rss_after = rss()
+print(json.dumps({'RSS': (rss_after - rss_before) if (None not in (rss_before, rss_after)) else None, 'Error': import_error}))
+'''
+
+def MeasureImportCost(PackageName: str, Timeout: float = 120) -> dict:
+    """
+        Measures what importing a package costs at startup, in an isolated interpreter so nothing is imported already.\n
+        Times are read from '-X importtime' report: self time of the package, and cumulative time of everything it imported.
+
+        #### Args:
+            - PackageName (str): Package to be imported.
+            - Timeout (float, optional): Maximum seconds the import may take. Defaults to 120.
+
+        #### Returns:
+            - dict: Return keys = Package, Self, Cumulative (seconds), Modules (count of modules imported), RSS (resident memory delta in bytes, None if unknown), Heaviest (direct imports with their cumulative seconds, heaviest first), Error (None if imported).
+                If the package could not be imported, its metrics are None (Modules is 0, Heaviest is empty), since they measure a failed import.
+    """
+
+    import_cost = dict({'Package': str(PackageName), 'Self': None, 'Cumulative': None, 'Modules': 0, 'RSS': None, 'Heaviest': [], 'Error': None})
+
+    # Nothing may be installed while the package is imported
+    try:
+        probe = subprocess.run([sys.executable, '-X', 'importtime', '-c', IMPORT_COST_PROBE, str(PackageName)], env=dict(os.environ, PACKAGEMANAGER_MODE='off'), capture_output=True, text=True, timeout=Timeout)
+    except subprocess.TimeoutExpired:
+        import_cost['Error'] = f'Import took more than {Timeout} seconds'
+        return import_cost
+
+    try:
+        import_cost.update(json.loads(probe.stdout.strip().splitlines()[-1]))
+    except (IndexError, ValueError):
+        import_cost['Error'] = (probe.stderr.strip().splitlines() or ['Unknown error'])[-1]
+
+    # Report lines are 'import time: <self us> | <cumulative us> | <indentation><module>', modules are reported after their imports
+    timings = []
+
+    for report_line in probe.stderr.splitlines():
+        report_fields = report_line.split('|')
+
+        if (not report_line.startswith('import time:')) or (len(report_fields) != 3) or (not report_fields[1].strip().isdigit()):
+            continue
+
+        module_field = report_fields[2][1:]
+        timings.append((len(module_field) - len(module_field.lstrip(' ')), module_field.strip(), int(report_fields[0].split(':')[1]), int(report_fields[1])))
+
+    for line_index in range(len(timings) - 1, -1, -1):
+        level, module_name, self_time, cumulative_time = timings[line_index]
+
+        if (module_name != str(PackageName)):
+            continue
+
+        import_cost['Self'], import_cost['Cumulative'] = self_time / 1e6, cumulative_time / 1e6
+        imported_modules = []
+
+        # Imports of the package are the lines right before it, more indented
+        for child_index in range(line_index - 1, -1, -1):
+            if (timings[child_index][0] <= level):
+                break
+
+            imported_modules.append(timings[child_index])
+
+        import_cost['Modules'] = len(imported_modules) + 1
+        import_cost['Heaviest'] = [[child[1], child[3] / 1e6] for child in sorted([child for child in imported_modules if (child[0] == level + 2)], key=lambda child: -child[3])[:5]]
+        break
+
+    # Packages imported while the interpreter starts (e.g. by '.pth' files) are never reported
+    if (import_cost['Cumulative'] is None) and (import_cost['Error'] is None):
+        import_cost['Error'] = 'Imported before measuring, while the interpreter started'
+
+    # Timings and memory of a failed import do not tell what the package costs
+    if (import_cost['Error'] is not None):
+        import_cost.update({'Self': None, 'Cumulative': None, 'Modules': 0, 'RSS': None, 'Heaviest': []})
+
+    return import_cost
+
+class PackageManager:
+    """
+        ## Main class of the module.
+
+        ### Variables:\n
+            >>> AccessiblePackages
+            >>> AnalyzedPackages
+            >>> Distributions
+            >>> Environment
+            >>> Executor
+            >>> ImportCache
+            >>> ImportGraph
+            >>> InstalledPackages
+            >>> RequiredPackages
+            >>> ScannedFiles
+            >>> ScanPolicy
+            >>> Stats
+            >>> STDPackages
+            >>> Wheelhouse
+        
+        ### Functions:\n
+            None
+        
+        ### Public Methods:\n
+            >>> AutoImportMissings(self)
+            >>> AutoImportMissingsAsync(self)
+            >>> BuildWheelhouse(self)
+            >>> ExportLockfile(self)
+            >>> ExportRequirements(self)
+            >>> GetImportedPackages(self)
+            >>> GetPackagePath(self)
+            >>> GetRequiredPackages(self)
+            >>> InstallMissingPackage(self)
+            >>> InstallPackage(self)
+            >>> InstallPackages(self)
+            >>> IsMissingPackage(self)
+            >>> IterImportedPackages(self)
+            >>> ProfileImports(self)
+            >>> UpgradePIP(self)
+            >>> Watch(self)
+        
+        ### Private Methods:\n
+            >>> __GetDistributions(self)
+            >>> __GetImportCacheOptions(self)
+            >>> __GetInstallResult(self)
+            >>> __GetInstalledPackages(self)
+            >>> __GetImportedPackages(self)
+            >>> __GetMissingPackages(self)
+            >>> __GetPackagePath(self)
+            >>> __GetPipIndexOptions(self)
+            >>> __GetPipInstallCommand(self)
+            >>> __GetProjectDistributions(self)
+            >>> __GetRequiredPackages(self)
+            >>> __InstallPackage(self)
+            >>> __InstallMissingPackage(self)
+            >>> __InstallPackages(self)
+            >>> __IsInstalled(self)
+            >>> __IsMissingPackage(self)
+            >>> __IterDeepScan(self)
+            >>> __LookupImportCache(self)
+            >>> __StoreImportCache(self)
+            >>> __UpgradePIP(self)
+    """
+
+    def __init__(self, CacheDir: str | bool | None = None, CacheHashContent: bool = False, Wheelhouse: str | None = None, StatsHook=None, ScanPolicy: ScanPolicy | None = None) -> None:
+        """
+            ### Constructor gets the main script file path and store class-scope variables
+
+            #### Args:
+                - CacheDir (str | bool | None, optional): Directory of the persistent import cache. bool(True) uses the user cache directory, bool(False) disables caching. Defaults to None, which reads 'PACKAGEMANAGER_CACHE_DIR' environment variable (see 'StartupStamp.GetCacheSetting()', caching is disabled if it is not set).
+                - CacheHashContent (bool, optional): If enabled, cached files are validated against their content hash and size instead of their modification time, so touched files still hit the cache. Defaults to False.
+                - Wheelhouse (str | None, optional): Directory of prebuilt wheels (see 'BuildWheelhouse()'). If set, packages are installed from it only, without accessing any package index. Defaults to None, which reads 'PACKAGEMANAGER_WHEELHOUSE' environment variable (packages are installed from the default index if it is not set).
+                - StatsHook (callable | None, optional): Called with every measured phase as soon as it ends (see 'Metrics'). Defaults to None.
+                - ScanPolicy (ScanPolicy | None, optional): Scope and budgets of every 'DeepScan' (see 'ScanPolicy'), it holds the report of the last scan afterwards. Defaults to None (everything is scanned).
+        """
+
+        # Class Variables
+        self.__mainScript = sys.modules['__main__']
+        self.__mainScriptPath = str((self.__mainScript.__file__).replace('\\', '/'))
+
+        # Wall time and counts of every phase, collected from the very beginning
+        self.Stats = Metrics(Hook=StatsHook)
+        environment_scan_started = time.perf_counter()
+
+        # Persistent import cache is only enabled if a cache directory is provided
+        if (CacheDir is None):
+            CacheDir = StartupStamp.GetCacheSetting(Default=False)
+
+        # An unusable cache must never prevent scanning, it only makes it slower
+        try:
+            self.__cacheDir = GetCacheDir(CacheDir=CacheDir)
+        except OSError as error:
+            print(error)
+            self.__cacheDir = None
+
+        try:
+            self.ImportCache = ImportCache(CacheDir=self.__cacheDir, HashContent=CacheHashContent) if (self.__cacheDir) else None
+        except (OSError, sqlite3.Error) as error:
+            print(error)
+            self.ImportCache = None
+
+        # Listings of 'sys.path' entries, persisted alongside the import cache and re-listed only if their content changed
+        self.Environment = EnvironmentSnapshot(CacheDir=self.__cacheDir)
+
+        # Index of installed distributions by import name, built on first use (see '__GetDistributions')
+        self.Distributions = None
+
+        # Import graph of the last scan (see 'ImportGraph')
+        self.ImportGraph = None
+
+        # Worker processes shared by every parallel 'DeepScan' of the instance, if None, each scan starts (and stops) its own pool
+        self.Executor = None
+
+        # Time of the last pip upgrade attempt, only kept in memory if caching is disabled (see '__UpgradePIP')
+        self.__pipUpgradeAttemptedAt = None
+
+        # Offline installations from a local directory of wheels
+        if (Wheelhouse is None):
+            Wheelhouse = os.environ.get('PACKAGEMANAGER_WHEELHOUSE') or None
+
+        self.Wheelhouse = os.path.abspath(str(Wheelhouse)).replace('\\', '/') if (Wheelhouse is not None) else None
+
+        # Scope and budgets of 'DeepScan'
+        self.ScanPolicy = ScanPolicy
+
+        # User Accessable Variable
+        self.STDPackages = tuple(list(sys.stdlib_module_names) + list(sys.builtin_module_names))
+        self.InstalledPackages = tuple(self.__GetInstalledPackages())
+        self.AccessiblePackages = tuple(self.STDPackages + self.InstalledPackages)
+        self.Stats.Add('EnvironmentScan', time.perf_counter() - environment_scan_started, RescannedEntries=self.Environment.RescannedEntries)
+        self.RequiredPackages = tuple()
+        self.AnalyzedPackages = set()
+        self.ScannedFiles = set()
+
+        # Hashed lookups of the variables above, used for every classification (tuples are kept for compatibility)
+        self.__stdPackagesLookup = frozenset(self.STDPackages)
+        self.__accessiblePackagesLookup = frozenset(self.AccessiblePackages)
+
+        # User Accessable Methods
+        self.InstallPackage = lambda PackageName, PackageVersion, Verbose: \
+            self.__InstallPackage(PackageName=str(PackageName), PackageVersion=str(PackageVersion), Verbose=bool(Verbose))
+
+        self.InstallMissingPackage = lambda PackageName, Verbose=False: \
+            self.__InstallMissingPackage(PackageName=str(PackageName), Verbose=bool(Verbose))
+
+        self.GetRequiredPackages = lambda PackagePath, IncludeDynamicImports=True, IncludePrivatePackages=False, DeepScan=False, ImportContexts=None, Extractor='AST', Jobs=1, Verbose=False: \
+            self.__GetRequiredPackages(PackagePath=str(PackagePath).replace('\\', '/'), IncludeDynamicImports=bool(IncludeDynamicImports), IncludePrivatePackages=bool(IncludePrivatePackages), DeepScan=bool(DeepScan), ImportContexts=ImportContexts, Extractor=Extractor, Jobs=int(Jobs), Verbose=bool(Verbose))
+
+        self.IsMissingPackage = lambda PackageName, IncludePrivatePackages=False: \
+            self.__IsMissingPackage(PackageName=str(PackageName), IncludePrivatePackages=bool(IncludePrivatePackages))
+
+        self.GetPackagePath = lambda PackageName, IgnoreBuiltins=False, Verbose=False: \
+            self.__GetPackagePath(PackageName=str(PackageName), IgnoreBuiltins=bool(IgnoreBuiltins), Verbose=bool(Verbose))
+        
+        self.GetImportedPackages = lambda PackagePath, IncludeDynamicImports, StrictSearch, Verbose, ImportContexts=None, Extractor='AST': \
+            self.__GetImportedPackages(PackagePath=PackagePath, IncludeDynamicImports=IncludeDynamicImports, StrictSearch=StrictSearch, ImportContexts=ImportContexts, Extractor=Extractor, Verbose=Verbose)
+
+        self.InstallPackages = lambda PackagesNames, Verbose: \
+            self.__InstallPackages(PackagesNames=tuple(PackagesNames), Verbose=bool(Verbose))
+
+        self.UpgradePIP = lambda Verbose: self.__UpgradePIP(Verbose=bool(Verbose))
+
+    ### INFORMATION RETRIVERS
+
+    def __GetDistributions(self) -> DistributionIndex:
+        """
+            ### Returns the index of installed distributions, building it on first use.
+
+            #### Returns:
+                - DistributionIndex: Index of installed distributions by import name.
+        """
+
+        if (self.Distributions is None):
+            self.Distributions = DistributionIndex(CacheDir=self.__cacheDir)
+
+        return self.Distributions
+
+    def __GetPackagePath(self, PackageName: str, IgnoreBuiltins: bool = False, Verbose: bool = False) -> str | None:
+        """
+            ### Searches and returns a package path using its name.
+
+            #### Args:
+                - PackageName (str): Target package name.
+                - Verbose (bool, optional): Prints function progress. Defaults to False.
+
+            #### Returns:
+                - str | None: Package file path if package exist, else, None will be returned.
+        """
+
+        # Print progress to stdout
+        if (bool(Verbose)): print(f"Locating package '{PackageName}'...")
+
+        path_resolution_started = time.perf_counter()
+        
+        # Locate module from the environment snapshot index, without importing it (nor its parents)
+        module = self.Environment.Resolve(ModuleName=str(PackageName))
+
+        # Top-level modules unknown to the index may still be provided by custom finders (e.g. editable installs),
+        # asking them does not import anything since there is no parent package to import
+        if (module is None) and ('.' not in str(PackageName)):
+            try:
+                module_spec = importlib.util.find_spec(str(PackageName))
+            except (ImportError, ValueError):
+                module_spec = None
+
+            if (module_spec is not None):
+                module = (None, module_spec.origin, list(module_spec.submodule_search_locations) if (module_spec.submodule_search_locations is not None) else None)
+
+        # Check if module is found
+        if (module is not None):
+            _, module_origin, module_locations = module
+
+            # Check if module has 'origin' has a value which is not None
+            if (str(module_origin) != 'None'):
+                module_path = str(module_origin)
+            
+            # Check if module is not normally included in 'sys.path' (namespace packages have 'submodule_search_locations' only)
+            # and try to read its path
+            elif (module_locations):
+                # Concatenate path domain
+                module_path = str(f'{module_locations[0]}/{PackageName}.py')
+            
+            else:
+                module_path = None
+
+
+        # Check if module is not found (if module == None)
+        else:
+            module_path = None
+
+        # If 'IgnoreBuiltins' is True, any built-in package will be returned as None
+        if (bool(IgnoreBuiltins)) \
+        and (module_path == 'built-in'):
+            module_path = None
+
+        else:
+            pass
+
+        self.Stats.Add('PathResolution', time.perf_counter() - path_resolution_started)
+
+        return module_path
+
+    def __GetInstalledPackages(self, Verbose: bool = False) -> tuple:
+        """
+            ### Collects all packages (built-ins & installed) accessible by Python.
+
+            #### Args:
+                - Verbose (bool, optional): Prints function progress. Defaults to False.
+
+            #### Returns:
+                - tuple: Names of all accessible packages (installed & built-ins).
+        """
+
+        # Print progress to stdout
+        if (bool(Verbose)): print("Collecting Installed Packages...")
+
+        std_packages = frozenset(self.STDPackages)
+
+        # Retriving all 'sys' accessible installed packages
+        packages = [pkg.split('.')[0] for pkg in list(sys.modules) if pkg not in std_packages]
+
+        # Retriving other packages inaccessible by 'sys'
+        # Package names are collected from the environment snapshot, which lists every 'sys.path' entry
+        # the same way 'pkgutil.iter_modules()' does, but only re-lists entries that changed since the last run
+        packages.extend(self.Environment.Names)
+        
+        # Ensuring collected packages do not contain built-ins or std_libs as well as setting and sorting packages
+        packages = sorted(set([pkg for pkg in packages if pkg not in std_packages]))
+
+        return tuple(packages)
+
+    def __GetImportedPackages(self, PackagePath: str, IncludeDynamicImports: bool = True, StrictSearch: bool = False, ImportContexts: tuple | list | None = None, Extractor: str = 'AST', Verbose: bool = False) -> tuple:
+        """
+            ### Collects imported packages from python code.\n
+            #### IMPORT STATEMENTS INSIDE LOOPS CANNOT BE ACCESSED BY 'IncludeDynamicImports'
+
+            #### Args:
+                - PackagePath (str): Python file path to be analyzed for imports.
+                - IncludeDynamicImports (bool, optional): If enabled, packages imported dynamically while the code runs will be collected. Defaults to True.
+                - StrictSearch (bool, optional): If enabled, only nodes containing the word 'import' in their source code will be processed. Preferably keep it to default. Defaults to False.
+                - ImportContexts (tuple | list | None, optional): Import contexts to be collected from the whole tree (see 'ImportCollector.CONTEXTS'). If None, only top-level imports are collected. Defaults to None.
+                - Extractor (str, optional): 'AST' parses source code, 'Bytecode' reads cached bytecode ('__pycache__') if 'ImportContexts' includes 'TopLevel', 'Optional' and 'TypeChecking' (e.g. 'ImportCollector.CONTEXTS'), and parses source code otherwise or if no valid bytecode exists. Defaults to 'AST'.
+                - Verbose (bool, optional): Prints function progress. Defaults to False.
+
+            #### Returns:
+                - tuple: Names of imported modules by the code provided. If no imported modules found, an empty tuple will be returned.
+        """
+        
+        if (bool(Verbose)): PSL(f"Collecting packages imported by '{os.path.basename(PackagePath)}'")
+
+        # Locating source files of target package
+        package_files = GetPackageFiles(PackagePath=PackagePath)
+        self.ScannedFiles.update(package_files or [])
+        self.Stats.Increment('FilesScanned', len(package_files or []))
+
+        # Reusing imports collected by a previous run if package files did not change since then
+        cache_fingerprint, cached_imports = self.__LookupImportCache(PackagePath=PackagePath, SourceFiles=package_files, IncludeDynamicImports=IncludeDynamicImports, StrictSearch=StrictSearch, ImportContexts=ImportContexts, Extractor=Extractor)
+
+        if (cached_imports is not None):
+            return tuple(cached_imports)
+
+        imports = ReadPackageImports(PackagePath=PackagePath, SourceFiles=package_files, IncludeDynamicImports=IncludeDynamicImports, StrictSearch=StrictSearch, ImportContexts=ImportContexts, Extractor=Extractor, Stats=self.Stats)
+
+        # Storing collected imports, keyed by the fingerprint taken before files were read
+        self.__StoreImportCache(PackagePath=PackagePath, Fingerprint=cache_fingerprint, IncludeDynamicImports=IncludeDynamicImports, StrictSearch=StrictSearch, ImportContexts=ImportContexts, Extractor=Extractor, Imports=imports)
+
+        return tuple(imports)
+
+    def __LookupImportCache(self, PackagePath: str, SourceFiles: list | None, IncludeDynamicImports: bool = True, StrictSearch: bool = False, ImportContexts: tuple | list | None = None, Extractor: str = 'AST') -> tuple:
+        """
+            ### Looks up imports of a package in the persistent import cache.
+
+            #### Args:
+                - PackagePath (str): Python file path to be analyzed for imports.
+                - SourceFiles (list | None): Package source files, as returned by 'GetPackageFiles()'.
+                - IncludeDynamicImports (bool, optional): Extraction option the cached imports depend on. Defaults to True.
+                - StrictSearch (bool, optional): Extraction option the cached imports depend on. Defaults to False.
+                - ImportContexts (tuple | list | None, optional): Extraction option the cached imports depend on. Defaults to None.
+                - Extractor (str, optional): Extraction option the cached imports depend on. Defaults to 'AST'.
+
+            #### Returns:
+                - tuple: (Fingerprint, Imports). 'Fingerprint' is None if caching is disabled, 'Imports' is None on a cache miss.
+        """
+
+        if (self.ImportCache is None) or (not SourceFiles):
+            return (None, None)
+
+        cache_fingerprint = self.ImportCache.Fingerprint(SourceFiles=SourceFiles)
+
+        if (cache_fingerprint is None):
+            return (None, None)
+
+        # Extraction options are part of the cache key since they change the collected imports
+        cache_options = self.__GetImportCacheOptions(IncludeDynamicImports=IncludeDynamicImports, StrictSearch=StrictSearch, ImportContexts=ImportContexts, Extractor=Extractor)
+        cached_imports = self.ImportCache.Get(PackagePath=PackagePath, Fingerprint=cache_fingerprint, Options=cache_options)
+
+        self.Stats.Increment('CacheMisses' if (cached_imports is None) else 'CacheHits')
+
+        return (cache_fingerprint, cached_imports)
+
+    def __StoreImportCache(self, PackagePath: str, Fingerprint: str | None, IncludeDynamicImports: bool, StrictSearch: bool, Imports: tuple, ImportContexts: tuple | list | None = None, Extractor: str = 'AST') -> None:
+        """
+            ### Stores imports of a package in the persistent import cache.
+
+            #### Args:
+                - PackagePath (str): Analyzed python file path.
+                - Fingerprint (str | None): Fingerprint returned by '__LookupImportCache()' before files were read. Nothing is stored if None.
+                - IncludeDynamicImports (bool): Extraction option the imports depend on.
+                - StrictSearch (bool): Extraction option the imports depend on.
+                - Imports (tuple): Collected imports.
+                - ImportContexts (tuple | list | None, optional): Extraction option the imports depend on. Defaults to None.
+                - Extractor (str, optional): Extraction option the imports depend on. Defaults to 'AST'.
+
+            #### Returns:
+                None
+        """
+
+        if (Fingerprint is not None):
+            cache_options = self.__GetImportCacheOptions(IncludeDynamicImports=IncludeDynamicImports, StrictSearch=StrictSearch, ImportContexts=ImportContexts, Extractor=Extractor)
+            self.ImportCache.Put(PackagePath=PackagePath, Fingerprint=Fingerprint, Options=cache_options, Imports=tuple(Imports))
+
+        return None
+
+    def __GetImportCacheOptions(self, IncludeDynamicImports: bool, StrictSearch: bool, ImportContexts: tuple | list | None = None, Extractor: str = 'AST') -> str:
+        """
+            ### Serializes extraction options the cached imports depend on.
+
+            #### Args:
+                - IncludeDynamicImports (bool): Extraction option.
+                - StrictSearch (bool): Extraction option.
+                - ImportContexts (tuple | list | None, optional): Extraction option. Defaults to None.
+                - Extractor (str, optional): Extraction option. Defaults to 'AST'.
+
+            #### Returns:
+                - str: Options string.
+        """
+
+        cache_options = f'{__version__}|IncludeDynamicImports={bool(IncludeDynamicImports)}|StrictSearch={bool(StrictSearch)}'
+
+        # Default extraction keeps its options string, so existing cache entries stay valid
+        if (ImportContexts is not None):
+            cache_options += f'|ImportContexts={",".join(sorted(ImportContexts))}'
+
+        if (Extractor != 'AST'):
+            cache_options += f'|Extractor={Extractor}'
+
+        return cache_options
+
+    def __IterDeepScan(self, PackageImports: tuple, IncludeDynamicImports: bool = True, ImportContexts: tuple | list | None = None, Extractor: str = 'AST', Jobs: int = 1, ProjectDir: str | None = None, Verbose: bool = False):
+        """
+            ### Walks the import graph breadth-first starting from already collected imports,\
+            yielding imports of every analyzed package as soon as they are collected.\n
+            Packages are analyzed only once per scan (deduplicated by a visited set local to the scan),\
+            and with 'Jobs' > 1 their files are parsed by a pool of worker processes while the frontier keeps being expanded.\
+            Packages out of 'ScanPolicy' scope or over its budgets are not analyzed, they are recorded in the policy report instead.
+
+            #### On platforms spawning worker processes (Windows, macOS), '__main__' script must be guarded by 'if __name__ == "__main__":' when 'Jobs' > 1
+
+            #### Args:
+                - PackageImports (tuple): Imports of the scanned script, used as the initial frontier.
+                - IncludeDynamicImports (bool, optional): If enabled, packages imported dynamically while the code runs will be collected. Defaults to True.
+                - ImportContexts (tuple | list | None, optional): Import contexts to be collected from the whole tree. Defaults to None.
+                - Extractor (str, optional): 'AST' or 'Bytecode' extraction. Defaults to 'AST'.
+                - Jobs (int, optional): Number of worker processes parsing files, the pool of 'Executor' is used if it is set. If 1, files are parsed in the current process. Defaults to 1.
+                - ProjectDir (str | None, optional): Project directory of the scanned script, used by 'ScanPolicy.FirstPartyOnly'. Defaults to None, which uses '__main__' script directory.
+                - Verbose (bool, optional): Prints function progress. Defaults to False.
+
+            #### Yields:
+                - tuple: (PackageName, PackagePath, Imports) of every analyzed package.
+        """
+
+        # Imported on demand, it is only needed by parallel scans and would slow down every startup
+        import concurrent.futures
+
+        # Packages analyzed by this scan only, so results never depend on previous calls of the same instance
+        visited_packages = set()
+        skipped_packages = set()
+        frontier = collections.deque([(pkg, 1) for pkg in PackageImports if pkg not in self.__stdPackagesLookup])
+        pending_scans = dict()
+        scan_policy = self.ScanPolicy
+
+        if (scan_policy is not None):
+            scan_policy.Start(ProjectDir=ProjectDir or os.path.dirname(self.__mainScriptPath))
+
+        # Worker processes are only spawned if more than one job is requested, and only once if the instance shares its pool
+        if (int(Jobs) > 1) and (self.Executor is not None):
+            executor, owned_executor = self.Executor, False
+        elif (int(Jobs) > 1):
+            executor, owned_executor = concurrent.futures.ProcessPoolExecutor(max_workers=int(Jobs)), True
+        else:
+            executor, owned_executor = None, False
+
+        try:
+            while (frontier) or (pending_scans):
+                # Expanding the frontier, each package is located once then parsed (from cache, here, or in a worker)
+                while (frontier):
+                    pkg, pkg_depth = frontier.popleft()
+
+                    if (pkg in visited_packages):
+                        continue
+
+                    visited_packages.add(pkg)
+
+                    # Once budgets are spent, remaining packages are only recorded, without even being located
+                    if (scan_policy is not None) and (scan_policy.IsStopped()):
+                        pkg_path, pkg_files, skip_reason = None, None, scan_policy.StoppedBy
+
+                    else:
+                        # Locating target 'pkg' path, skipping built-ins and packages that do not exist
+                        pkg_path = self.__GetPackagePath(PackageName=pkg, IgnoreBuiltins=True)
+
+                        if (str(pkg_path) == 'None'):
+                            continue
+
+                        # Scope is checked before listing package files, budgets are charged with them
+                        skip_reason = scan_policy.GetSkipReason(PackageName=pkg, PackagePath=pkg_path, Depth=pkg_depth) if (scan_policy is not None) else None
+                        pkg_files = GetPackageFiles(PackagePath=pkg_path) if (skip_reason is None) else None
+
+                        if (scan_policy is not None) and (skip_reason is None):
+                            skip_reason = scan_policy.Charge(SourceFiles=pkg_files)
+
+                    if (skip_reason is not None):
+                        if (bool(Verbose)): PSL(f"Skipping '{pkg}' ({skip_reason})")
+
+                        scan_policy.Skip(PackageName=pkg, Reason=skip_reason, Depth=pkg_depth)
+                        skipped_packages.add(pkg)
+                        self.Stats.Increment('PackagesSkipped')
+                        continue
+
+                    if (bool(Verbose)): PSL(f"Analyzing packages imported by '{pkg}'")
+
+                    self.ScannedFiles.update(pkg_files or [])
+                    self.Stats.Increment('FilesScanned', len(pkg_files or []))
+                    cache_fingerprint, pkg_imports = self.__LookupImportCache(PackagePath=pkg_path, SourceFiles=pkg_files, IncludeDynamicImports=IncludeDynamicImports, StrictSearch=True, ImportContexts=ImportContexts, Extractor=Extractor)
+
+                    if (pkg_imports is None) and (executor is not None):
+                        pending_scans[executor.submit(MeasurePackageImports, pkg_path, pkg_files, IncludeDynamicImports, True, ImportContexts, Extractor)] = (pkg, pkg_depth, pkg_path, cache_fingerprint)
+                        continue
+
+                    elif (pkg_imports is None):
+                        pkg_imports = ReadPackageImports(PackagePath=pkg_path, SourceFiles=pkg_files, IncludeDynamicImports=IncludeDynamicImports, StrictSearch=True, ImportContexts=ImportContexts, Extractor=Extractor, Stats=self.Stats)
+                        self.__StoreImportCache(PackagePath=pkg_path, Fingerprint=cache_fingerprint, IncludeDynamicImports=IncludeDynamicImports, StrictSearch=True, ImportContexts=ImportContexts, Extractor=Extractor, Imports=pkg_imports)
+
+                    frontier.extend([(imp, pkg_depth + 1) for imp in pkg_imports if imp not in self.__stdPackagesLookup])
+                    yield (pkg, pkg_path, tuple(pkg_imports))
+
+                # Collecting parsed packages as soon as any worker finishes, then expanding the frontier again
+                if (pending_scans):
+                    done_scans, _ = concurrent.futures.wait(pending_scans, return_when=concurrent.futures.FIRST_COMPLETED)
+
+                    for scan in done_scans:
+                        pkg, pkg_depth, pkg_path, cache_fingerprint = pending_scans.pop(scan)
+                        pkg_imports, pkg_stats = scan.result()
+                        self.Stats.Merge(Other=pkg_stats)
+                        self.__StoreImportCache(PackagePath=pkg_path, Fingerprint=cache_fingerprint, IncludeDynamicImports=IncludeDynamicImports, StrictSearch=True, ImportContexts=ImportContexts, Extractor=Extractor, Imports=pkg_imports)
+
+                        frontier.extend([(imp, pkg_depth + 1) for imp in pkg_imports if imp not in self.__stdPackagesLookup])
+                        yield (pkg, pkg_path, tuple(pkg_imports))
+
+        finally:
+            if (owned_executor):
+                executor.shutdown(wait=True, cancel_futures=True)
+
+            # A shared pool outlives the scan, scans abandoned by the caller must not leave work behind in it
+            else:
+                for scan in pending_scans:
+                    scan.cancel()
+
+            self.AnalyzedPackages.update(visited_packages - skipped_packages)
+
+    def __GetProjectDistributions(self, ScriptPath: str, ImportContexts: tuple | list | None = None, Extractor: str = 'AST', Jobs: int = 1, PackagesNames: tuple | list | None = None) -> list:
+        """
+            ### Collects installed distributions providing packages required by a script (packages of its own project excluded).
+
+            #### Args:
+                - ScriptPath (str): Entry script of the project.
+                - ImportContexts (tuple | list | None, optional): Import contexts to be collected from the whole tree (see 'ImportCollector.CONTEXTS'). If None, only top-level imports are collected. Defaults to None.
+                - Extractor (str, optional): 'AST' parses source code, 'Bytecode' reads cached bytecode ('__pycache__') if 'ImportContexts' includes 'TopLevel', 'Optional' and 'TypeChecking' (e.g. 'ImportCollector.CONTEXTS'), and parses source code otherwise or if no valid bytecode exists. Defaults to 'AST'.
+                - Jobs (int, optional): Number of worker processes parsing files while scanning the project. Defaults to 1.
+                - PackagesNames (tuple | list | None, optional): Packages required by the script if they were collected already (e.g. by 'GetRequiredPackages()'), the script is not scanned again then and 'ScannedFiles' must hold the files of that scan. Defaults to None, which scans the script.
+
+            #### Returns:
+                - list: Distributions (see 'DistributionIndex.GetDistribution') in the order their packages were detected.
+        """
+
+        project_dir_path = os.path.dirname(ScriptPath)
+        distributions = self.__GetDistributions()
+        project_distributions = []
+
+        if (PackagesNames is None):
+            # Every entry script is scanned completely, packages analyzed for a previous script would be skipped otherwise
+            self.AnalyzedPackages = set()
+            self.ScannedFiles = set()
+
+            PackagesNames = self.__GetRequiredPackages(ScriptPath, DeepScan=True, ImportContexts=ImportContexts, Extractor=Extractor, Jobs=Jobs)
+
+        for pkg in PackagesNames:
+            package_path = self.__GetPackagePath(pkg)
+
+            # Packages of the project itself are not requirements (packages of a virtual environment inside the project are), and this module is always exported first
+            if (IsProjectModule(ModuleName=pkg, ProjectDir=project_dir_path, ModulePath=package_path)) \
+            or (pkg == __name__):
+                continue
+
+            # Versions are read from the distribution index, so the whole export is a single metadata pass
+            distribution = distributions.GetDistribution(ImportName=pkg)
+
+            if (distribution is None):
+                print(f"Package '{pkg}' is not provided by any installed distribution, it will not be exported.")
+                continue
+
+            # Several import names may be provided by the same distribution (e.g. 'google.protobuf' and 'google.api')
+            if (distribution not in project_distributions):
+                project_distributions.append(distribution)
+
+        return project_distributions
+
+    def __GetRequiredPackages(self, PackagePath: str, IncludeDynamicImports: bool = True, IncludePrivatePackages: bool = False, DeepScan: bool = False, ImportContexts: tuple | list | None = None, Extractor: str = 'AST', Jobs: int = 1, Verbose: bool = False, PackageName: str | None = None) -> tuple:
+        """
+            ### Collects all imported packages by a script and (optionally) imports of its imports, \
+            then tests wheather these packages are built-ins and std-lib packages or not.\n
+
+            #### If you are working on a project with many relative imports, it is prefered to Enable 'DeepScan'
+
+            #### Args:
+                - PackagePath (str): Python file path to be analyzed for imports.
+                - IncludeDynamicImports (bool, optional): If enabled, packages imported dynamically while the code runs will be collected. Defaults to True.
+                - IncludePrivatePackages (bool, optional): If enabled, packages names starting with '_' will be collected. PREFERABLY, DON'T CHANGE DEFAULT. Defaults to False.
+                - DeepScan (bool, optional): Scans imported scripts in target script for their own imports. Defaults to False.
+                - Jobs (int, optional): If greater than 1, 'DeepScan' walks the import graph breadth-first and parses files in that many worker processes. Results are identical to the serial scan. Defaults to 1.
+                - Verbose (bool, optional): Prints function progress. Defaults to False.
+                - PackageName (str | None, optional): Name of the scanned package in the import graph, set by the recursion only. Defaults to None, the scanned script (root of a new graph).
+
+            #### Returns:
+                - tuple: Packages imported but not installed or cannot be imported.
+        """
+
+        # The scanned script starts a new import graph, reused as is if it was saved by a previous run and nothing changed since then
+        if (PackageName is None):
+            graph_options = StartupStamp.GetOptions(IncludeDynamicImports=IncludeDynamicImports, DeepScan=DeepScan, ImportContexts=ImportContexts, Extractor=Extractor)
+            # Graphs limited by a scan policy are not complete, neither are graphs of a serial scan skipping packages analyzed by a previous call
+            graph_path = ImportGraph.GetCachePath(CacheDir=self.__cacheDir, ScriptPath=PackagePath, Options=graph_options) \
+                if (self.__cacheDir) and (self.ScanPolicy is None) and ((int(Jobs) > 1) or (len(self.AnalyzedPackages) == 0)) else None
+            saved_graph = ImportGraph.Load(FilePath=graph_path, Options=graph_options) if (graph_path is not None) and (not StartupStamp.IsRescanForced()) else None
+            self.ImportGraph = saved_graph if (saved_graph is not None) else ImportGraph(Root='__main__', RootPath=PackagePath)
+
+        else:
+            saved_graph = None
+
+        if (saved_graph is None):
+            # Collecting imported packages by module given its path 'PackagePath'
+            imported_packages = self.__GetImportedPackages(PackagePath=PackagePath, IncludeDynamicImports=IncludeDynamicImports, StrictSearch=True, ImportContexts=ImportContexts, Extractor=Extractor, Verbose=Verbose)
+            self.ImportGraph.AddImports(Name=(PackageName or '__main__'), Imports=imported_packages, Path=PackagePath)
+            # Getting project packages (packages in 'sys.modules' but not in 'sys.stdlib_module_names' or 'sys.builtin_module_names') or packages that are not installed
+            project_main_imports = [pkg for pkg in imported_packages if pkg not in self.__stdPackagesLookup]
+            # 'required_packes' is used as recursion container
+            required_packages = set(imported_packages)
+
+        # Every package of a saved graph is imported by the script or by its imports
+        if (saved_graph is not None):
+            if (bool(Verbose)): PSL(f"Reusing import graph of '{os.path.basename(PackagePath)}'")
+
+            self.ScannedFiles.update(saved_graph.SourceFiles)
+            required_packages = set(saved_graph.GetImportedNames())
+
+        # Parallel 'DeepScan' walks the import graph breadth-first, parsing files over a pool of worker processes,
+        # so does a scan limited by a policy, closest packages are then scanned first whenever budgets run out
+        elif (bool(DeepScan)) and ((int(Jobs) > 1) or (self.ScanPolicy is not None)):
+            for pkg, pkg_path, pkg_imports in self.__IterDeepScan(PackageImports=imported_packages, IncludeDynamicImports=IncludeDynamicImports, ImportContexts=ImportContexts, Extractor=Extractor, Jobs=Jobs, ProjectDir=os.path.dirname(PackagePath), Verbose=Verbose):
+                self.ImportGraph.AddImports(Name=pkg, Imports=pkg_imports, Path=pkg_path)
+                required_packages.update(pkg_imports)
+
+            # Scope skips are intended, a spent budget is not, so it is always reported
+            if (self.ScanPolicy is not None) and (self.ScanPolicy.StoppedBy is not None):
+                print(f"DeepScan stopped by '{self.ScanPolicy.StoppedBy}' budget, {len([skipped for skipped in self.ScanPolicy.Skipped if (skipped['Reason'] == self.ScanPolicy.StoppedBy)])} packages were not scanned for their own imports.")
+
+            elif (bool(Verbose)) and (self.ScanPolicy is not None):
+                PSL(f"{len(self.ScanPolicy.Skipped)} packages out of scan scope", LastLine=True)
+
+        # Check 'DeepScan' state
+        elif (bool(DeepScan)):
+            # Loop over project packages only.
+            # System packages are not checked since we can check their requirements through pip,
+            # also system packages would take very long time to check, which is unreliable.
+            for pkg in project_main_imports:
+                if (bool(Verbose)): PSL(f"Analyzing packages imported by '{pkg}'")
+                # Check if 'pkg' not in 'self.AnalyzedPackages'
+                # 'self.AnalyzedPackages' work as recursion terminator if all project packages are in it
+                if (pkg not in self.AnalyzedPackages):
+                    # Adding 'pkg' to recursion termination list so it is not processed twice
+                    self.AnalyzedPackages.add(pkg)
+
+                    # Locating target 'pkg' path
+                    pkg_path = self.__GetPackagePath(PackageName=pkg, IgnoreBuiltins=True)
+
+                    # Check if package has a path (not a built-in nor does not exist)
+                    if (str(pkg_path) != 'None'):
+                        # Firing recursion #
+                        # Recursion here works as follow:
+                        # 1. 'pkg_path' which is an imported package from '__main__' is checked for its own imports
+                        # 2. Second time when the function reachs this recursion again, it checks the imported packages
+                        #    in of package imported by '__main__' and so on.
+                        # 3. Recursion is terminated when all sub-packages are checked for imports (when pkg_path is None)
+                        recursion = self.__GetRequiredPackages(PackagePath=pkg_path, IncludeDynamicImports=IncludeDynamicImports, IncludePrivatePackages=IncludePrivatePackages, DeepScan=DeepScan, ImportContexts=ImportContexts, Extractor=Extractor, PackageName=pkg)
+
+                        # Updating 'required_packages' with new imports from recursion to be carried out to next recursion loop
+                        required_packages.update(recursion)
+                    
+                    # If package is None (built-in or does not exist), continue loop
+                    else:
+                        continue
+                
+                # If 'pkg' in 'self.AnalyzedPackages' (else is True),
+                # the loop continues without analyzing current 'pkg' since it must have been analyzed before
+                else:
+                    continue
+        
+        # If 'DeepScan' is False, return only packages required by __main__
+        else:
+            if (bool(Verbose)): PSL(f"Analyzing packages imported by '{os.path.basename(PackagePath)}'")
+            pass
+        
+        # Saving the graph of a complete scan, so the next run with unchanged sources and environment reuses it
+        if (PackageName is None) \
+        and (saved_graph is None) \
+        and (graph_path is not None):
+            self.ImportGraph.Save(FilePath=graph_path, SourceFiles=list(self.ScannedFiles), Options=graph_options)
+
+        if (bool(Verbose)): PSL(f"Sorting required packages...")
+
+        # Selecting only parent packages (by using 'pkg.split('.')[0]')
+        required_packages = [pkg.split('.')[0] for pkg in required_packages]
+
+        # Another filtration of 'requried_packages', removing built-in packages and packages already in 'sys.stdlib_module_names' (a.k.a. 'self.STDPackages')
+        required_packages = sorted(set([pkg for pkg in required_packages if pkg not in self.__stdPackagesLookup]))
+
+        # Selects either to include private modules (modules names starts with '_') in required packages or not
+        if (bool(IncludePrivatePackages)):
+            pass
+        else:
+            # If 'IncludePrivatePackages' is set to 'False', then private packages (packages start with _) will be excluded
+            required_packages = [pkg for pkg in required_packages if (pkg.startswith('_') == False)]
+
+        # Assigning return value to self.Variable
+        self.RequiredPackages = tuple(required_packages)
+
+        return tuple(required_packages)
+
+    def __GetMissingPackages(self, PackagePath: str, IncludeDynamicImports: bool = True, IncludePrivatePackages: bool = False, DeepScan: bool = False, ImportContexts: tuple | list | None = None, Extractor: str = 'AST', Jobs: int = 1, Verbose: bool = False) -> tuple:
+        # Collecting required packages by the project that are neither built-ins nor std_lib
+        required_packages = self.__GetRequiredPackages(PackagePath=PackagePath, IncludeDynamicImports=IncludeDynamicImports, IncludePrivatePackages=IncludePrivatePackages, DeepScan=DeepScan, ImportContexts=ImportContexts, Extractor=Extractor, Jobs=Jobs, Verbose=Verbose)
+        # Getting missing packages (packages not accessible in anyway)
+        missed_main_imports = [pkg for pkg in required_packages if (self.__IsMissingPackage(PackageName=pkg, IncludePrivatePackages=IncludePrivatePackages))]
+
+        return tuple(missed_main_imports)
+
+    def __IsMissingPackage(self, PackageName: str, IncludePrivatePackages: bool = False) -> bool:
+        """
+            ### Classifies a package the same way required packages are filtered: neither built-in, std-lib, private, nor accessible.
+
+            #### Args:
+                - PackageName (str): Imported package name, only its top-level package is classified.
+                - IncludePrivatePackages (bool, optional): If enabled, packages names starting with '_' can be missing. Defaults to False.
+
+            #### Returns:
+                - bool: True if the package must be installed.
+        """
+
+        top_level_package = str(PackageName).split('.')[0]
+
+        return (top_level_package not in self.__stdPackagesLookup) \
+            and ((bool(IncludePrivatePackages)) or (not top_level_package.startswith('_'))) \
+            and (top_level_package not in self.__accessiblePackagesLookup)
+
+    def __InstallMissingPackage(self, PackageName: str, Verbose: bool = False) -> bool:
+        """
+            ### Installs a package if it is classified as missing (see '__IsMissingPackage'), used by 'LazyInstaller' when an import fails.
+
+            #### Args:
+                - PackageName (str): Imported package name.
+                - Verbose (bool, optional): Prints function progress. Defaults to False.
+
+            #### Returns:
+                - bool: True if the package was installed, else, False (not missing, or installation failed).
+        """
+
+        if (not self.__IsMissingPackage(PackageName=PackageName)):
+            return False
+
+        installation_result = self.__InstallPackage(PackageName=str(PackageName).split('.')[0], Verbose=Verbose)
+
+        return installation_result['ExitCode'] == 0
+
+    ### ACTION MAKERS
+
+    def __InstallPackage(self, PackageName: str, PackageVersion: str = "latest", Verbose: bool = False) -> dict:
+        """
+            ### Installs specific package with desired version. If 'PackageVersion' == None -> latest version will be installed.
+
+            #### Args:
+                - PackageName (str): Exact package name to be installed.
+                - PackageVersion (str, optional): Exact package version to be installed. Comparator operators are not allowed! Defaults to "latest".
+                - Verbose (bool, optional): Prints function progress.
+
+            #### Returns:
+                - dict: Return keys = ReturnMessage, ExitCode, ExitMessage
+        """
+
+        # Check package version to be installed
+        if (PackageVersion.replace('.','').isdigit()):
+            target_package = f'{str(PackageName)}=={str(PackageVersion)}'
+        else:
+            target_package = str(PackageName)
+
+        # Print progress to stdout
+        if (bool(Verbose)): PSL(f'Attempting to install "{target_package}"...')
+
+        # pip would only report the requirement as satisfied, installed distributions metadata tells the same without starting an interpreter
+        if (self.__IsInstalled(PackageName=PackageName, PackageVersion=PackageVersion)):
+            installation_result = dict({'ReturnMessage': f'"{target_package}" is already installed!', 'ExitCode': 0, 'ExitMessage': ''})
+
+            # Print progress to stdout
+            if (bool(Verbose)): PSL(installation_result['ReturnMessage'], LastLine=True)
+
+            return installation_result
+
+        with self.Stats.Measure('Install', Package=target_package) as install_labels:
+            # Setup a command to install the package
+            installation_process = subprocess.Popen(self.__GetPipInstallCommand(Targets=[target_package]), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            
+            # Collect return messages from executed command
+            execution_message = str(installation_process.communicate())
+            execution_exit_code = int(installation_process.wait())
+            install_labels['ExitCode'] = execution_exit_code
+
+        self.Stats.Increment('PackagesInstalled' if (execution_exit_code == 0) else 'PackagesFailed')
+
+        installation_result = self.__GetInstallResult(TargetPackage=target_package, ExitCode=execution_exit_code, ExitMessage=execution_message)
+
+        # Print progress to stdout
+        if (bool(Verbose)): PSL(installation_result['ReturnMessage'], LastLine=True)
+        
+        return installation_result
+
+    def __InstallPackages(self, PackagesNames: tuple, Verbose: bool = False) -> dict:
+        """
+            ### Installs multiple packages (latest versions) using a single pip invocation, so they are resolved together.\n
+            If the batch fails, it is bisected and each half is installed separately until failing packages are isolated.
+
+            #### Args:
+                - PackagesNames (tuple): Exact packages names to be installed.
+                - Verbose (bool, optional): Prints function progress.
+
+            #### Returns:
+                - dict: Result of every package, keyed by package name. Each result has the same keys returned by '__InstallPackage' (ReturnMessage, ExitCode, ExitMessage)
+        """
+
+        packages_names = [str(pkg) for pkg in PackagesNames]
+
+        if (len(packages_names) == 0):
+            return dict()
+
+        # A single package is installed exactly the same way as '__InstallPackage' does
+        elif (len(packages_names) == 1):
+            return dict({packages_names[0]: self.__InstallPackage(PackageName=packages_names[0], Verbose=Verbose)})
+
+        # Packages already installed are left out of the batch
+        installed_packages = [pkg for pkg in packages_names if (self.__IsInstalled(PackageName=pkg))]
+
+        if (installed_packages):
+            installation_results = {pkg: self.__InstallPackage(PackageName=pkg, Verbose=Verbose) for pkg in installed_packages}
+            installation_results.update(self.__InstallPackages(PackagesNames=tuple([pkg for pkg in packages_names if (pkg not in installed_packages)]), Verbose=Verbose))
+
+            return installation_results
+
+        # Print progress to stdout
+        if (bool(Verbose)): PSL(f'Attempting to install {len(packages_names)} packages ("{", ".join(packages_names)}")...')
+
+        with self.Stats.Measure('Install', Package=' '.join(packages_names)) as install_labels:
+            # Setup a single command installing the whole batch
+            installation_process = subprocess.Popen(self.__GetPipInstallCommand(Targets=packages_names), stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+            # Collect return messages from executed command
+            execution_message = str(installation_process.communicate())
+            execution_exit_code = int(installation_process.wait())
+            install_labels['ExitCode'] = execution_exit_code
+
+        if (execution_exit_code == 0):
+            # Failed batches are not counted, their halves are
+            self.Stats.Increment('PackagesInstalled', len(packages_names))
+            installation_results = {pkg: self.__GetInstallResult(TargetPackage=pkg, ExitCode=execution_exit_code, ExitMessage=execution_message) for pkg in packages_names}
+
+            # Print progress to stdout
+            if (bool(Verbose)): PSL(f'{len(packages_names)} packages have been installed successfully!', LastLine=True)
+
+        else:
+            # pip installs nothing when any package of the batch fails to resolve,
+            # bisecting the batch isolates failing packages in a logarithmic number of invocations
+            if (bool(Verbose)): PSL(f'Batch installation failed with exit code ({execution_exit_code}), splitting it...', LastLine=True)
+
+            middle = len(packages_names) // 2
+            installation_results = dict()
+            installation_results.update(self.__InstallPackages(PackagesNames=tuple(packages_names[:middle]), Verbose=Verbose))
+            installation_results.update(self.__InstallPackages(PackagesNames=tuple(packages_names[middle:]), Verbose=Verbose))
+
+        return installation_results
+
+    def __IsInstalled(self, PackageName: str, PackageVersion: str = "latest") -> bool:
+        """
+            ### Checks installed distributions metadata for a package, without running pip.
+
+            #### Args:
+                - PackageName (str): Package import name or distribution name.
+                - PackageVersion (str, optional): Exact version required. If it is not a version (e.g. "latest"), any installed version satisfies it. Defaults to "latest".
+
+            #### Returns:
+                - bool: True if an installed distribution provides the package (with the required version).
+        """
+
+        distribution = self.__GetDistributions().GetDistribution(ImportName=str(PackageName))
+
+        if (distribution is None):
+            return False
+
+        # Same rule as '__InstallPackage', which pins only numeric versions
+        if (str(PackageVersion).replace('.', '').isdigit()):
+            return IsVersionSatisfied(Version=distribution['Version'], Specifier=f'=={PackageVersion}')
+
+        return True
+
+    def __GetPipInstallCommand(self, Targets: list) -> list:
+        """
+            ### Builds the command installing the given targets with pip.
+
+            #### Args:
+                - Targets (list): pip requirement specifiers (e.g. 'name' or 'name==version'). Import names are resolved to their distribution names (e.g. 'yaml' -> 'PyYAML').
+
+            #### Returns:
+                - list: Command arguments, to be executed without a shell.
+        """
+
+        distributions = self.__GetDistributions()
+        pip_targets = []
+
+        for target in Targets:
+            target_name, separator, target_version = str(target).partition('==')
+            pip_targets.append(distributions.GetInstallName(ImportName=target_name) + separator + target_version)
+
+        # Using 'sys.executable' to ensure that we install the package for the same version and location of running Python
+        return [sys.executable, '-m', 'pip', 'install'] + self.__GetPipIndexOptions() + pip_targets
+
+    def __GetPipIndexOptions(self) -> list:
+        """
+            ### Builds pip options selecting where packages are downloaded from.
+
+            #### Returns:
+                - list: Options restricting pip to the wheelhouse directory if one is set, else, an empty list (default index).
+        """
+
+        if (self.Wheelhouse is None):
+            return []
+
+        return ['--no-index', '--find-links', self.Wheelhouse]
+
+    def __GetInstallResult(self, TargetPackage: str, ExitCode: int, ExitMessage: str) -> dict:
+        """
+            ### Builds the result of a package installation based on pip exit code.
+
+            #### Args:
+                - TargetPackage (str): Installed pip requirement specifier.
+                - ExitCode (int): pip exit code.
+                - ExitMessage (str): pip collected output.
+
+            #### Returns:
+                - dict: Return keys = ReturnMessage, ExitCode, ExitMessage
+        """
+
+        # Define function return messages based on execution return message
+        if (ExitCode == 0):      # 0 -> Successful Exit Code
+            return_message = f'"{TargetPackage}" has been installed successfully!'
+        elif (ExitCode == 1):    # 1 -> Successful Exit Code
+            return_message = f'"{TargetPackage}" was not recognized, please consider installing it manually!'
+        else:                    # Other -> Unknown Exit Code
+            return_message = f'Unexpected exit code ({ExitCode}) returned while installing "{TargetPackage}"'
+
+        return dict(
+                {
+                "ReturnMessage" : return_message,
+                "ExitCode"      : int(ExitCode),
+                "ExitMessage"   : ExitMessage
+                }
+            )
+
+    # def __RemovePackage(self, PackageName: str, PackageVersion = "latest", Verbose = False):
+    #     pass
+
+    # def __UpgradePackage(self, PackageName: str, PackageVersion = "latest", Verbose = False):
+    #     pass
+
+    def __UpgradePIP(self, Verbose: bool = False, Interval: float = 86400) -> int:
+        """
+            ### Upgrade pip if an upgrade is available.\n
+            Upgrades are attempted at most once per 'Interval' for every interpreter, the time of the last attempt is recorded in the cache directory,
+            or kept in memory by the instance if caching is disabled.
+
+            #### Args:
+                - Verbose (bool, optional): Prints function progress.
+                - Interval (float, optional): Minimum seconds between two upgrade attempts. Defaults to 86400 (a day).
+
+            #### Returns:
+                - int: Exit Code {
+                    * 0 : Successfully upgraded | No new version available | Upgrade attempted recently
+                    * 1 : An error occured
+                    * 2 : Unknown exit code
+                }
+        """
+
+        def __getPIPVersion() -> dict:
+            # Retriving pip version from its metadata, 'pip --version' would start another interpreter
+            importlib.invalidate_caches()
+
+            try:
+                pip_distribution = importlib.metadata.distribution('pip')
+            except importlib.metadata.PackageNotFoundError:
+                return dict({'version': None, 'message': 'pip is not installed'})
+
+            pip_version = pip_distribution.version
+            pip_location = str(pip_distribution.locate_file('pip')).replace('\\', '/')
+
+            return dict({
+                'version': pip_version,
+                'message': f'pip {pip_version} from {pip_location} (python {sys.version_info.major}.{sys.version_info.minor})'
+            })
+
+        # Upgrade attempts are recorded per interpreter, the same cache directory may be shared by several of them
+        attempt_path = f'{self.__cacheDir}/PipUpgrade-{hashlib.blake2b(sys.executable.encode(), digest_size=8).hexdigest()}.json' if (self.__cacheDir) else None
+        last_attempt = self.__pipUpgradeAttemptedAt
+
+        if (attempt_path is not None):
+            try:
+                with open(file=attempt_path, mode='r') as attempt_file:
+                    last_attempt = float(json.load(attempt_file)['AttemptedAt'])
+            except (OSError, ValueError, KeyError):
+                pass
+
+        if (last_attempt is not None) and (0 <= time.time() - last_attempt < float(Interval)):
+            # Print progress to stdout
+            if (bool(Verbose)): PSL(f'pip upgrade was attempted recently, skipping!\n{__getPIPVersion()["message"]}', LastLine=True)
+
+            return 0
+
+        # Print progress to stdout
+        if (bool(Verbose)): PSL(f'Attempting to upgrade pip...')
+
+        current_pip_version = __getPIPVersion()['version']
+
+        # Setup a command to install the package
+        # Using 'sys.executable' to ensure that we install the package for the same version and location of running Python
+        with self.Stats.Measure('PipUpgrade') as upgrade_labels:
+            execution = subprocess.Popen([sys.executable, '-m', 'pip', 'install', '--upgrade'] + self.__GetPipIndexOptions() + ['pip'], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            
+            # Collect return code from executed command
+            execution.communicate()
+            execution_exit_code = int(execution.wait())
+            upgrade_labels['ExitCode'] = execution_exit_code
+
+        self.__pipUpgradeAttemptedAt = time.time()
+
+        if (attempt_path is not None):
+            try:
+                with open(file=attempt_path, mode='w') as attempt_file:
+                    json.dump(dict({'AttemptedAt': self.__pipUpgradeAttemptedAt, 'ExitCode': execution_exit_code}), attempt_file)
+            except OSError as error:
+                print(error)
+
+        new_pip = __getPIPVersion()
+        new_pip_version = new_pip['version']
+        new_pip_message = new_pip['message']
+
+        # Versions are compared by their release ordering ('23.10' < '24.0'), not as numbers
+        current_pip_key = ParseVersion(current_pip_version) if (current_pip_version is not None) else None
+        new_pip_key = ParseVersion(new_pip_version) if (new_pip_version is not None) else None
+        pip_is_new = (new_pip_key is not None) and ((current_pip_key is None) or (new_pip_key > current_pip_key))
+        
+        # Define function return messages based on execution return message
+        if (execution_exit_code == 0) and pip_is_new:           # 0 -> Successful Exit Code
+            return_code = 0
+            return_message = 'pip has been upgraded successfuly!'
+
+        elif (execution_exit_code == 0) and not pip_is_new:     # 0 -> Successful Exit Code
+            return_code = 0
+            return_message = 'pip is already latest!'
+
+        elif (execution_exit_code == 1):  # 1 -> Error Exit Code
+            return_code = 1
+            return_message = 'pip was not upgraded, please consider upgrading pip manually!'
+
+        else:                           # Other -> Unknown Exit Code
+            return_code = 2
+            return_message = 'Unexpected exit code!'
+
+        # Print progress to stdout
+        if (bool(Verbose)): PSL(f'{return_message}\n{new_pip_message}', LastLine=True)
+
+        return int(return_code)
+
+    ### USER ACCESSIBLE
+
+    # UNDER DEV
+    def AutoImportMissings(self, IncludeDynamicImports: bool = True, DeepScan: bool = True, UpgradePIP: bool = False, ImportContexts: tuple | list | None = None, Extractor: str = 'AST', Jobs: int = 1, BatchInstall: bool = False, UseStamp: bool = False, ForceRescan: bool = False, UseLockfile: str | bool = False, SingleFlight: str | bool = False, SingleFlightTimeout: float = 300, Verbose: bool = False) -> bool:
+        """
+            ### Automatically analysis '__main__' script, update PIP, and installs required packages if missing.
+
+            #### Args:
+                - IncludeDynamicImports (bool, optional): If enabled, packages imported dynamically while the code runs will be collected. Defaults to True.
+                - DeepScan (bool, optional): Scans imported scripts in target script for their own imports. Defaults to True.
+                - UpgradePIP (bool, optional): Optionally upgrade PIP before installing required packages. Defaults to False.
+                - ImportContexts (tuple | list | None, optional): Import contexts to be collected from the whole tree (see 'ImportCollector.CONTEXTS'). If None, only top-level imports are collected. Defaults to None.
+                - Extractor (str, optional): 'AST' parses source code, 'Bytecode' reads cached bytecode ('__pycache__') if 'ImportContexts' includes 'TopLevel', 'Optional' and 'TypeChecking' (e.g. 'ImportCollector.CONTEXTS'), and parses source code otherwise or if no valid bytecode exists. Defaults to 'AST'.
+                - Jobs (int, optional): Number of worker processes parsing files during 'DeepScan'. Defaults to 1.
+                - BatchInstall (bool, optional): Installs all missing packages with a single pip invocation (bisecting the batch on failure to isolate failing packages) instead of one invocation per package. Defaults to False.
+                - UseStamp (bool, optional): Skips everything if sources, interpreter and environment did not change since the last successful run, and records this run if successful. Requires a cache directory. Defaults to False.
+                - ForceRescan (bool, optional): Ignores the stamp of the last successful run (same as setting 'PACKAGEMANAGER_FORCE_RESCAN' environment variable). Defaults to False.
+                - UseLockfile (str | bool, optional): Skips analysis if a requirements file exported by 'ExportRequirements()' (or 'ExportLockfile()') was derived from the current sources and is satisfied by installed distributions. True uses 'requirements-by-<script>.txt' next to '__main__' script, a str(path) uses the given file. Defaults to False.
+                - SingleFlight (str | bool, optional): Coordinates concurrent processes running the same script through a file lock, only one of them scans and installs while others wait and reuse its result. True locks in the cache directory, a str(path) locks in the given directory. Defaults to False.
+                - SingleFlightTimeout (float, optional): Maximum seconds to wait for another process holding the single-flight lock. Defaults to 300.
+                - Verbose (bool, optional): Prints function progress. Defaults to False.
+
+            #### Returns:
+                - bool: returns True if all packages were successfully installed, else, False.
+
+            #### Raises:
+                - TimeoutError: If the single-flight lock could not be acquired within 'SingleFlightTimeout'.
+        """
+
+        failed_packages = set()
+
+        # Stamp of the last successful run, sources are not scanned at all if nothing changed since then
+        if (bool(UseStamp)) and (self.__cacheDir):
+            startup_stamp = StartupStamp(CacheDir=self.__cacheDir, ScriptPath=self.__mainScriptPath, Options=StartupStamp.GetOptions(IncludeDynamicImports=IncludeDynamicImports, DeepScan=DeepScan, ImportContexts=ImportContexts, Extractor=Extractor))
+
+            if (not bool(ForceRescan)) \
+            and (not StartupStamp.IsRescanForced()) \
+            and (startup_stamp.IsFresh()):
+                if (bool(Verbose)): PSL('Nothing changed since last successful run, skipping analysis!', LastLine=True)
+                return True
+
+        else:
+            startup_stamp = None
+
+        # Requirements file exported from the same sources, the environment is then checked against it instead of analyzing sources
+        if (bool(UseLockfile)) \
+        and (not bool(ForceRescan)) \
+        and (not StartupStamp.IsRescanForced()):
+            requirements_lock = RequirementsLock(FilePath=UseLockfile if (UseLockfile is not True) else f'{os.path.dirname(self.__mainScriptPath)}/requirements-by-{os.path.basename(self.__mainScriptPath)}.txt', ProjectDir=os.path.dirname(self.__mainScriptPath))
+
+            if (requirements_lock.IsFresh()):
+                unsatisfied_requirements = requirements_lock.GetUnsatisfiedRequirements(Distributions=self.__GetDistributions())
+
+                if (len(unsatisfied_requirements) == 0):
+                    if (bool(Verbose)): PSL(f"Requirements of '{os.path.basename(requirements_lock.FilePath)}' are satisfied, skipping analysis!", LastLine=True)
+
+                    self.ScannedFiles.update([f'{requirements_lock.ProjectDir}/{source_file}' for source_file in requirements_lock.SourceFiles])
+
+                    if (startup_stamp is not None):
+                        startup_stamp.Write(SourceFiles=list(self.ScannedFiles))
+
+                    return True
+
+                elif (bool(Verbose)):
+                    PSL(f"Requirements ({', '.join(unsatisfied_requirements)}) are not satisfied, analyzing sources...", LastLine=True)
+
+        # Single-flight: one process scans and installs, others wait for it and reuse its published result
+        if (bool(SingleFlight)):
+            single_flight = SingleFlightLock(LockDir=GetCacheDir(CacheDir=(self.__cacheDir or True) if (SingleFlight is True) else SingleFlight), ScriptPath=self.__mainScriptPath, Options=StartupStamp.GetOptions(IncludeDynamicImports=IncludeDynamicImports, DeepScan=DeepScan, ImportContexts=ImportContexts, Extractor=Extractor))
+            wait_started = time.time()
+
+            if (bool(Verbose)): PSL('Acquiring single-flight lock...')
+            if (not single_flight.Acquire(Timeout=SingleFlightTimeout)):
+                raise TimeoutError(f'Could not acquire single-flight lock ({single_flight.LockPath}) within {SingleFlightTimeout} seconds!')
+
+            flight_result = single_flight.GetPublishedResult(NotBefore=wait_started, ReuseSuccessful=not (bool(ForceRescan) or StartupStamp.IsRescanForced()))
+
+        else:
+            single_flight = None
+            flight_result = None
+
+        try:
+            if (flight_result is not None):
+                if (bool(Verbose)): PSL('Reusing result published by another process!', LastLine=True)
+
+                # Packages installed by another process must become visible to this one
+                importlib.invalidate_caches()
+
+                missing_packages = tuple(flight_result['MissingPackages'])
+                failed_packages.update(flight_result['FailedPackages'])
+                self.ScannedFiles.update(flight_result['SourceFiles'])
+
+            else:
+                with self.Stats.Measure('Analysis'):
+                    missing_packages = self.__GetMissingPackages(PackagePath=self.__mainScriptPath, IncludeDynamicImports=IncludeDynamicImports, DeepScan=DeepScan, ImportContexts=ImportContexts, Extractor=Extractor, Jobs=Jobs, Verbose=Verbose)
+
+                if (bool(Verbose)) and (self.ImportCache is not None):
+                    cache_stats = self.ImportCache.Stats()
+                    PSL(f"Import cache: {cache_stats['Hits']} hits, {cache_stats['Misses']} misses", LastLine=True)
+
+                if (bool(UpgradePIP)): self.__UpgradePIP(Verbose=Verbose)
+
+                # Batched installation resolves all missing packages together in a single pip invocation
+                if (bool(BatchInstall)):
+                    if (bool(Verbose)) and (missing_packages): print(f"\nInstalling Packages 1-{len(missing_packages)}/{len(missing_packages)}")
+
+                    batch_installer = self.__InstallPackages(PackagesNames=missing_packages, Verbose=Verbose)
+                    failed_packages.update([pkg for pkg, pkg_installer in batch_installer.items() if (pkg_installer['ExitCode'] != 0)])
+
+                else:
+                    for ind, pkg in enumerate(missing_packages, 1):
+                        if (bool(Verbose)): print(f"\nInstalling Packages {ind}/{len(missing_packages)}")
+                
+                        retry_counter = 1
+                        while (retry_counter > 0):
+                            pkg_installer = self.__InstallPackage(PackageName=pkg, Verbose=Verbose)
+
+                            if (pkg_installer['ExitCode'] == 0):
+                                if (pkg in failed_packages):
+                                    failed_packages.remove(pkg)
+                                else:
+                                    pass
+                        
+                                break
+
+                            else:
+                                retry_counter -= 1
+                                failed_packages.add(pkg)
+
+                # Installed packages must be importable by the running script without re-running it
+                if (missing_packages):
+                    importlib.invalidate_caches()
+
+                if (single_flight is not None):
+                    single_flight.Publish(SourceFiles=list(self.ScannedFiles), MissingPackages=missing_packages, FailedPackages=failed_packages)
+
+        finally:
+            if (single_flight is not None):
+                single_flight.Release()
+
+        if (len(failed_packages) > 0):
+            print(f'\nCOULD NOT INSTALL THESE PACKAGES: ({", ".join(failed_packages)})!\nPLEASE CONSIDER INSTALLING THEM MANUALLY!\n')
+
+            while True:
+                decision = input('Would you like to continue executing your code? *IT WILL PROBABLY RAISE AN ERROR IF YOU CONTINUE..* (Y/n) ')
+
+                if (decision == 'Y'):
+                    print()
+                    return False
+                elif (decision == 'n'):
+                    exit()
+                else:
+                    print('Invalid input!')
+        elif (str(missing_packages) == 'None') \
+        or (len(missing_packages) == 0):
+            print(f'\nNo missing required packages were found!\n')
+        
+        else:
+            print(f'\nRequired missing packages have been installed successfully!\n')
+
+        # Recording this successful run, environment is fingerprinted after installations.
+        # A scan stopped by its budgets did not see every source, it must run again next time
+        if (startup_stamp is not None) \
+        and ((self.ScanPolicy is None) or (self.ScanPolicy.StoppedBy is None)):
+            startup_stamp.Write(SourceFiles=list(self.ScannedFiles))
+
+    async def AutoImportMissingsAsync(self, IncludeDynamicImports: bool = True, DeepScan: bool = True, ImportContexts: tuple | list | None = None, Extractor: str = 'AST', Jobs: int = 1, Workers: int = 4, Verbose: bool = False):
+        """
+            ### Streaming version of 'AutoImportMissings()': '__main__' script is analyzed in a background thread,\
+            and every missing package is queued to a bounded pool of installer workers as soon as it is discovered, while scanning continues.
+
+            #### Usage:
+                >>> async for event in PackageManager().AutoImportMissingsAsync():
+                >>>     print(event['Package'], event['Event'])
+
+            #### Args:
+                - IncludeDynamicImports (bool, optional): If enabled, packages imported dynamically while the code runs will be collected. Defaults to True.
+                - DeepScan (bool, optional): Scans imported scripts in target script for their own imports. Defaults to True.
+                - Jobs (int, optional): Number of worker processes parsing files during 'DeepScan'. Defaults to 1.
+                - Workers (int, optional): Number of concurrent pip installations. Defaults to 4.
+                - Verbose (bool, optional): Prints function progress. Defaults to False.
+
+            #### Yields:
+                - dict: Progress events. Keys = Package, Event ('Missing' once discovered, then 'Installed' or 'Failed'). 'Installed' and 'Failed' events also hold the keys returned by '__InstallPackage' (ReturnMessage, ExitCode, ExitMessage)
+        """
+
+        # Imported on demand, it is only needed by the streaming pipeline and would slow down every startup
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        workers_count = max(1, int(Workers))
+
+        # Bounded queue applies backpressure on the scanner when installers are busy
+        install_queue = asyncio.Queue(maxsize=(workers_count * 2))
+        events_queue = asyncio.Queue()
+        stop_scan = threading.Event()
+
+        def __queueMissingPackages(PackagesNames: tuple, QueuedPackages: set) -> None:
+            """
+                Queues packages not queued before that are missing (see '__IsMissingPackage')
+
+                #### Args:
+                    - PackagesNames (tuple): Collected imports
+                    - QueuedPackages (set): Packages already queued by the scan
+
+                #### Returns:
+                    None
+            """
+
+            for imp in PackagesNames:
+                pkg = str(imp).split('.')[0]
+
+                if (pkg in QueuedPackages) \
+                or (not self.__IsMissingPackage(PackageName=pkg)) \
+                or (stop_scan.is_set()):
+                    continue
+
+                QueuedPackages.add(pkg)
+                loop.call_soon_threadsafe(events_queue.put_nowait, dict({"Package": pkg, "Event": "Missing"}))
+                # Blocks the scanning thread until an installer worker has room for the package
+                asyncio.run_coroutine_threadsafe(install_queue.put(pkg), loop).result()
+
+            return None
+
+        def __scanMissingPackages() -> None:
+            """
+                Scans '__main__' script (and its imports if 'DeepScan' is enabled), queuing missing packages as soon as they are found
+
+                #### Returns:
+                    None
+            """
+
+            queued_packages = set()
+            main_imports = self.__GetImportedPackages(PackagePath=self.__mainScriptPath, IncludeDynamicImports=IncludeDynamicImports, StrictSearch=True, ImportContexts=ImportContexts, Extractor=Extractor, Verbose=Verbose)
+            __queueMissingPackages(PackagesNames=main_imports, QueuedPackages=queued_packages)
+
+            if (bool(DeepScan)):
+                for _, _, pkg_imports in self.__IterDeepScan(PackageImports=main_imports, IncludeDynamicImports=IncludeDynamicImports, ImportContexts=ImportContexts, Extractor=Extractor, Jobs=Jobs, Verbose=Verbose):
+                    if (stop_scan.is_set()):
+                        break
+
+                    __queueMissingPackages(PackagesNames=pkg_imports, QueuedPackages=queued_packages)
+
+            return None
+
+        async def __installQueuedPackages() -> None:
+            """
+                Installer worker, installs queued packages until it receives None
+
+                #### Returns:
+                    None
+            """
+
+            while True:
+                pkg = await install_queue.get()
+
+                if (pkg is None):
+                    return None
+
+                if (bool(Verbose)): PSL(f'Attempting to install "{pkg}"...')
+
+                # Same short-circuit as '__InstallPackage', pip is not started for packages installed distributions metadata already provides
+                if (self.__IsInstalled(PackageName=pkg)):
+                    installation_result = dict({'ReturnMessage': f'"{pkg}" is already installed!', 'ExitCode': 0, 'ExitMessage': ''})
+
+                    if (bool(Verbose)): PSL(installation_result['ReturnMessage'], LastLine=True)
+
+                    events_queue.put_nowait(dict({"Package": pkg, "Event": "Installed"}, **installation_result))
+                    continue
+
+                with self.Stats.Measure('Install', Package=pkg) as install_labels:
+                    installation_process = await asyncio.create_subprocess_exec(*self.__GetPipInstallCommand(Targets=[pkg]), stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+                    execution_message = str(await installation_process.communicate())
+                    execution_exit_code = int(await installation_process.wait())
+                    install_labels['ExitCode'] = execution_exit_code
+
+                self.Stats.Increment('PackagesInstalled' if (execution_exit_code == 0) else 'PackagesFailed')
+
+                installation_result = self.__GetInstallResult(TargetPackage=pkg, ExitCode=execution_exit_code, ExitMessage=execution_message)
+
+                if (bool(Verbose)): PSL(installation_result['ReturnMessage'], LastLine=True)
+
+                events_queue.put_nowait(dict({"Package": pkg, "Event": "Installed" if (execution_exit_code == 0) else "Failed"}, **installation_result))
+
+        async def __runPipeline() -> None:
+            """
+                Waits for the scan, then stops installer workers once they drained the queue
+
+                #### Returns:
+                    None
+            """
+
+            try:
+                await scanner
+            finally:
+                for _ in installers:
+                    await install_queue.put(None)
+
+                await asyncio.gather(*installers)
+                # Newly installed packages must be visible to the import system of the running interpreter
+                importlib.invalidate_caches()
+                events_queue.put_nowait(None)
+
+        scanner = loop.run_in_executor(None, __scanMissingPackages)
+        installers = [asyncio.create_task(__installQueuedPackages()) for _ in range(workers_count)]
+        pipeline = asyncio.create_task(__runPipeline())
+
+        try:
+            while True:
+                event = await events_queue.get()
+
+                if (event is None):
+                    break
+
+                yield event
+
+            # Propagating scan errors, if any
+            await pipeline
+
+        finally:
+            # If the consumer stopped early, the scanning thread is released and installer workers are cancelled
+            if (not pipeline.done()):
+                stop_scan.set()
+
+                while (not scanner.done()):
+                    while (not install_queue.empty()):
+                        install_queue.get_nowait()
+
+                    await asyncio.wait({scanner}, timeout=0.05)
+
+                pipeline.cancel()
+
+                for installer in installers:
+                    installer.cancel()
+
+    def BuildWheelhouse(self, WheelhouseDir: str | None = None, ImportContexts: tuple | list | None = None, Extractor: str = 'AST', Jobs: int = 1, Verbose: bool = False) -> dict:
+        """
+            ### Builds (or downloads) wheels of every requirement reported by 'ExportRequirements()', and of their dependencies, into a wheelhouse directory.\n
+            Source distributions are compiled once here, machines installing from the wheelhouse ('Wheelhouse' argument of the constructor) then only unpack wheels, without accessing any package index.
+
+            #### Args:
+                - WheelhouseDir (str | None, optional): Directory the wheels are stored in, created if missing. Defaults to None, which uses 'Wheelhouse' of the instance.
+                - ImportContexts (tuple | list | None, optional): Import contexts to be collected from the whole tree (see 'ImportCollector.CONTEXTS'). If None, only top-level imports are collected. Defaults to None.
+                - Extractor (str, optional): 'AST' parses source code, 'Bytecode' reads cached bytecode ('__pycache__') if 'ImportContexts' includes 'TopLevel', 'Optional' and 'TypeChecking' (e.g. 'ImportCollector.CONTEXTS'), and parses source code otherwise or if no valid bytecode exists. Defaults to 'AST'.
+                - Jobs (int, optional): Number of worker processes parsing files while scanning the project. Defaults to 1.
+                - Verbose (bool, optional): Prints function progress. Defaults to False.
+
+            #### Returns:
+                - dict: Return keys = ReturnMessage, ExitCode, ExitMessage, Requirements
+
+            #### Raises:
+                - ValueError: If neither 'WheelhouseDir' nor 'Wheelhouse' of the instance is set.
+        """
+
+        wheelhouse_dir = WheelhouseDir if (WheelhouseDir is not None) else self.Wheelhouse
+
+        if (wheelhouse_dir is None):
+            raise ValueError("No wheelhouse directory! Pass 'WheelhouseDir' or set 'PACKAGEMANAGER_WHEELHOUSE' environment variable.")
+
+        wheelhouse_dir = os.path.abspath(str(wheelhouse_dir)).replace('\\', '/')
+        os.makedirs(wheelhouse_dir, exist_ok=True)
+
+        # This module is never installed through pip, it is left out
+        requirements = [f"{requirement['name']}=={requirement['version']}" for requirement in self.ExportRequirements(ImportContexts=ImportContexts, Extractor=Extractor, Jobs=Jobs).values() if (requirement['name'] != __name__)]
+
+        if (len(requirements) == 0):
+            return dict({'ReturnMessage': 'No requirements to be built!', 'ExitCode': 0, 'ExitMessage': '', 'Requirements': tuple()})
+
+        # Print progress to stdout
+        if (bool(Verbose)): PSL(f'Building wheels of {len(requirements)} requirements into "{wheelhouse_dir}"...')
+
+        # Wheels already in the wheelhouse are reused ('--find-links'), only new requirements are downloaded or compiled
+        wheel_process = subprocess.Popen([sys.executable, '-m', 'pip', 'wheel', '--wheel-dir', wheelhouse_dir, '--find-links', wheelhouse_dir] + requirements, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+        # Collect return messages from executed command
+        execution_message = str(wheel_process.communicate())
+        execution_exit_code = int(wheel_process.wait())
+
+        if (execution_exit_code == 0):
+            return_message = f'Wheels of {len(requirements)} requirements have been built successfully!'
+        else:
+            return_message = f'Unexpected exit code ({execution_exit_code}) returned while building wheels, please check the collected output!'
+
+        # Print progress to stdout
+        if (bool(Verbose)): PSL(return_message, LastLine=True)
+
+        return dict(
+                {
+                "ReturnMessage" : return_message,
+                "ExitCode"      : execution_exit_code,
+                "ExitMessage"   : execution_message,
+                "Requirements"  : tuple(requirements)
+                }
+            )
+
+    def ExportLockfile(self, ScriptPath: str | None = None, ExportTo__main__Dir: str | bool = False, ImportContexts: tuple | list | None = None, Extractor: str = 'AST', Jobs: int = 1, PackagesNames: tuple | list | None = None) -> dict:
+        """
+            ### Exports a fully pinned requirement file: packages required by the project, and every distribution they require transitively.\n
+            Dependencies are read from installed distributions metadata ('Requires-Dist', with environment markers evaluated for the running interpreter),
+            without running pip. The dependency walk is shared by all calls of the same instance, so locking several entry scripts evaluates every distribution once.
+
+            #### Args:
+                - ScriptPath (str | None, optional): Entry script to be locked. Defaults to None, which locks the '__main__' script.
+                - ExportTo__main__Dir (str | bool, optional): This argument has three modes as explained below.\n
+                    * Mode 1: If set to bool(False), will not export to file and will only return a dict of distributions and their versions. (Default)
+                    * Mode 2: If set to bool(True), will export the lock file to parent directory of the entry script.
+                    * Mode 3: If set to a valid directory str(path), will export the lock file to specified directory.
+                - ImportContexts (tuple | list | None, optional): Import contexts to be collected from the whole tree (see 'ImportCollector.CONTEXTS'). If None, only top-level imports are collected. Defaults to None.
+                - Extractor (str, optional): 'AST' parses source code, 'Bytecode' reads cached bytecode ('__pycache__') if 'ImportContexts' includes 'TopLevel', 'Optional' and 'TypeChecking' (e.g. 'ImportCollector.CONTEXTS'), and parses source code otherwise or if no valid bytecode exists. Defaults to 'AST'.
+                - Jobs (int, optional): Number of worker processes parsing files while scanning the project. Defaults to 1.
+                - PackagesNames (tuple | list | None, optional): Packages required by the script if they were collected already (e.g. by 'GetRequiredPackages()'), the script is not scanned again then and 'ScannedFiles' must hold the files of that scan. Defaults to None, which scans the script.
+
+            #### Returns:
+                - dict: Dict of distributions names and versions, sorted by name (possible keys for each value => 'name', 'version')
+        """
+
+        script_path = str(ScriptPath if (ScriptPath is not None) else self.__mainScriptPath).replace('\\', '/')
+        project_dir_path = os.path.dirname(script_path)
+
+        project_distributions = self.__GetProjectDistributions(ScriptPath=script_path, ImportContexts=ImportContexts, Extractor=Extractor, Jobs=Jobs, PackagesNames=PackagesNames)
+        locked_distributions, missing_distributions = self.__GetDistributions().GetDependencyClosure(DistributionNames=[distribution['Name'] for distribution in project_distributions])
+
+        for distribution_name in missing_distributions:
+            print(f"Distribution '{distribution_name}' is required but not installed, it will not be locked.")
+
+        # Sorted by normalized name, so the same environment always produces the same lock file
+        reqs = [distribution['Name'] + '==' + distribution['Version'] for distribution in locked_distributions]
+        reqs.insert(0, __name__ + '==' + __version__)
+
+        reqs_dict = {pkg: {'name': pkg, 'version': ver} for pkg, ver in [req.split('==') for req in reqs]}
+
+        if (bool(os.path.isdir(ExportTo__main__Dir))):
+            project_dir_path = ExportTo__main__Dir.replace('"', '').replace("'", '').replace('\\', '/')
+
+        # Scanned project sources are recorded in the header, so the file can be used by 'AutoImportMissings(UseLockfile=...)'
+        if (bool(os.path.isdir(project_dir_path))) \
+        and (bool(ExportTo__main__Dir)):
+            RequirementsLock(FilePath=f'{project_dir_path}/requirements-lock-by-{os.path.basename(script_path)}.txt', ProjectDir=os.path.dirname(script_path)).Write(Requirements=reqs, SourceFiles=list(self.ScannedFiles))
+
+        return reqs_dict
+
+    # UNDER DEV
+    def ExportRequirements(self, ExportTo__main__Dir: str | bool = False, ImportContexts: tuple | list | None = None, Extractor: str = 'AST', Jobs: int = 1, ScriptPath: str | None = None, PackagesNames: tuple | list | None = None) -> dict:
+        """
+            ### Exports a requirement file contains modules required by the project which this method is called in.
+
+            #### Args:
+                - ExportTo__main__Dir (str | bool, optional): This argument has three modes as explained below.\n
+                    * Mode 1: If set to bool(False), will not export to file and will only return a dict of packages and their versions. (Default)
+                    * Mode 2: If set to bool(True), will export requirements.txt file to parent directory of __main__ file.
+                    * Mode 3: If set to a valid directory str(path), will export requirement.txt to specified directory.
+                - ImportContexts (tuple | list | None, optional): Import contexts to be collected from the whole tree (see 'ImportCollector.CONTEXTS'). If None, only top-level imports are collected. Defaults to None.
+                - Extractor (str, optional): 'AST' parses source code, 'Bytecode' reads cached bytecode ('__pycache__') if 'ImportContexts' includes 'TopLevel', 'Optional' and 'TypeChecking' (e.g. 'ImportCollector.CONTEXTS'), and parses source code otherwise or if no valid bytecode exists. Defaults to 'AST'.
+                - Jobs (int, optional): Number of worker processes parsing files while scanning the project. Defaults to 1.
+                - ScriptPath (str | None, optional): Entry script to be exported. Defaults to None, which exports the '__main__' script.
+                - PackagesNames (tuple | list | None, optional): Packages required by the script if they were collected already (e.g. by 'GetRequiredPackages()'), the script is not scanned again then and 'ScannedFiles' must hold the files of that scan. Defaults to None, which scans the script.
+
+            #### Returns:
+                - dict: Dict of distributions names and versions (possible keys for each value => 'name', 'version')
+        """
+
+        script_path = str(ScriptPath if (ScriptPath is not None) else self.__mainScriptPath).replace('\\', '/')
+        project_dir_path = os.path.dirname(script_path)
+        reqs = [distribution['Name'] + '==' + distribution['Version'] for distribution in self.__GetProjectDistributions(ScriptPath=script_path, ImportContexts=ImportContexts, Extractor=Extractor, Jobs=Jobs, PackagesNames=PackagesNames)]
+        
+        reqs.insert(0, __name__ + '==' + __version__)
+        
+        reqs_dict = {pkg: {'name': pkg, 'version': ver} for pkg, ver in [req.split('==') for req in reqs]}
+
+        if (bool(os.path.isdir(ExportTo__main__Dir))):
+            project_dir_path = ExportTo__main__Dir.replace('"', '').replace("'", '').replace('\\', '/')
+        else:
+            pass
+            
+        
+        # Scanned project sources are recorded in the header, so the file can be used by 'AutoImportMissings(UseLockfile=...)'
+        if (bool(os.path.isdir(project_dir_path))) \
+        and (bool(ExportTo__main__Dir)):
+            RequirementsLock(FilePath=f'{project_dir_path}/requirements-by-{os.path.basename(script_path)}.txt', ProjectDir=os.path.dirname(script_path)).Write(Requirements=reqs, SourceFiles=list(self.ScannedFiles))
+        else:
+            pass
+            
+        return reqs_dict
+
+    def IterImportedPackages(self, PackagePath: str, IncludeDynamicImports: bool = True, StrictSearch: bool = True, ImportContexts: tuple | list | None = None, Extractor: str = 'AST', Verbose: bool = False):
+        """
+            ### Walks a package tree recursively (subpackages included), yielding imports of every file as soon as it is analyzed.\n
+            Files are parsed independently and cached individually, so a file that cannot be analyzed is reported without aborting the scan,
+            and only changed files are parsed again on later scans.
+
+            #### Args:
+                - PackagePath (str): Python module file, package '__init__.py' file, or package directory path.
+                - IncludeDynamicImports (bool, optional): If enabled, packages imported dynamically while the code runs will be collected. Defaults to True.
+                - StrictSearch (bool, optional): If enabled, only nodes containing the word 'import' in their source code will be processed. Defaults to True.
+                - ImportContexts (tuple | list | None, optional): Import contexts to be collected from the whole tree (see 'ImportCollector.CONTEXTS'). If None, only top-level imports are collected. Defaults to None.
+                - Extractor (str, optional): 'AST' parses source code, 'Bytecode' reads cached bytecode ('__pycache__') if 'ImportContexts' includes 'TopLevel', 'Optional' and 'TypeChecking' (e.g. 'ImportCollector.CONTEXTS'), and parses source code otherwise or if no valid bytecode exists. Defaults to 'AST'.
+                - Verbose (bool, optional): Prints function progress. Defaults to False.
+
+            #### Yields:
+                - tuple: (FilePath, Imports, Error) of every file. 'Error' is None if the file was analyzed, else, 'Imports' is empty.
+        """
+
+        for source_file in IterPackageFiles(PackagePath=str(PackagePath).replace('\\', '/')):
+            if (bool(Verbose)): PSL(f"Collecting packages imported by '{source_file}'")
+
+            self.ScannedFiles.add(source_file)
+            self.Stats.Increment('FilesScanned')
+
+            cache_fingerprint, file_imports = self.__LookupImportCache(PackagePath=source_file, SourceFiles=[source_file], IncludeDynamicImports=IncludeDynamicImports, StrictSearch=StrictSearch, ImportContexts=ImportContexts, Extractor=Extractor)
+
+            if (file_imports is not None):
+                yield (source_file, tuple(file_imports), None)
+                continue
+
+            for file_result in IterPackageImports(PackagePath=source_file, SourceFiles=[source_file], IncludeDynamicImports=IncludeDynamicImports, StrictSearch=StrictSearch, ImportContexts=ImportContexts, Extractor=Extractor, Stats=self.Stats):
+                # Errors are not cached, failed files are analyzed again by every scan
+                if (file_result[2] is None):
+                    self.__StoreImportCache(PackagePath=source_file, Fingerprint=cache_fingerprint, IncludeDynamicImports=IncludeDynamicImports, StrictSearch=StrictSearch, ImportContexts=ImportContexts, Extractor=Extractor, Imports=file_result[1])
+
+                yield file_result
+
+        if (bool(Verbose)): PSL(f"Analyzed package tree of '{PackagePath}'", LastLine=True)
+
+    def ProfileImports(self, ScriptPath: str | None = None, PackagesNames: tuple | list | None = None, Repeat: int = 1, LazyThreshold: float = 0.1, Timeout: float = 120, ImportContexts: tuple | list | None = None, Extractor: str = 'AST', Jobs: int = 1, Verbose: bool = False) -> list:
+        """
+            ### Measures the startup cost of every third-party package imported by the project, ranked from the most expensive.\n
+            Every package is imported alone in a fresh interpreter (see 'MeasureImportCost()'), so its cost includes everything it imports,
+            no matter whether the project imports it first or not. Packages above 'LazyThreshold' are flagged as candidates for lazy import.
+
+            #### Args:
+                - ScriptPath (str | None, optional): Entry script to be profiled. Defaults to None, which profiles the '__main__' script.
+                - PackagesNames (tuple | list | None, optional): Packages to be profiled instead of those imported by the project. Defaults to None.
+                - Repeat (int, optional): Number of times every package is imported, the fastest run is kept. Defaults to 1.
+                - LazyThreshold (float, optional): Cumulative import time (in seconds) flagging a package as lazy import candidate. Defaults to 0.1.
+                - Timeout (float, optional): Maximum seconds a single import may take. Defaults to 120.
+                - ImportContexts (tuple | list | None, optional): Import contexts to be collected from the whole tree (see 'ImportCollector.CONTEXTS'). If None, only top-level imports are collected. Defaults to None.
+                - Extractor (str, optional): 'AST' parses source code, 'Bytecode' reads cached bytecode ('__pycache__') if 'ImportContexts' includes 'TopLevel', 'Optional' and 'TypeChecking' (e.g. 'ImportCollector.CONTEXTS'), and parses source code otherwise or if no valid bytecode exists. Defaults to 'AST'.
+                - Jobs (int, optional): Number of worker processes parsing files while scanning the project. Defaults to 1.
+                - Verbose (bool, optional): Prints function progress and the ranked report. Defaults to False.
+
+            #### Returns:
+                - list: Dicts of 'MeasureImportCost()' sorted by cumulative time, with two more keys = LazyCandidate, ImportedBy (project modules importing the package). Packages that could not be imported are reported on stdout and left out.
+        """
+
+        script_path = str(ScriptPath if (ScriptPath is not None) else self.__mainScriptPath).replace('\\', '/')
+        project_dir_path = os.path.dirname(script_path)
+        imported_by = dict()
+
+        if (PackagesNames is not None):
+            imported_by = {str(pkg): [] for pkg in PackagesNames}
+
+        else:
+            # Every entry script is scanned completely, packages analyzed for a previous script would be skipped otherwise
+            self.AnalyzedPackages = set()
+            self.ScannedFiles = set()
+
+            required_packages = self.__GetRequiredPackages(script_path, DeepScan=True, ImportContexts=ImportContexts, Extractor=Extractor, Jobs=Jobs)
+            nodes_paths = dict(zip(self.ImportGraph.Nodes, self.ImportGraph.Paths))
+
+            for pkg in required_packages:
+                package_path = self.__GetPackagePath(pkg)
+
+                # Packages of the project itself and missing packages cannot be measured, neither is this module
+                if (IsProjectModule(ModuleName=pkg, ProjectDir=project_dir_path, ModulePath=package_path)) \
+                or (pkg == __name__) \
+                or (self.__IsMissingPackage(pkg)):
+                    continue
+
+                # Only packages imported by the project itself are paid for at startup, the others are measured with their importers
+                importers = [name for name in self.ImportGraph.GetDependents(Name=pkg) if (name == self.ImportGraph.Root) or (IsProjectModule(ModuleName=name, ProjectDir=project_dir_path, ModulePath=nodes_paths.get(name)))]
+
+                if (len(importers) > 0):
+                    imported_by[pkg] = importers
+
+        import_costs = []
+
+        for pkg in sorted(imported_by):
+            if (bool(Verbose)): PSL(f"Measuring import cost of '{pkg}'")
+
+            # Timings vary from run to run, the fastest one is the closest to the real cost
+            measurements = [MeasureImportCost(PackageName=pkg, Timeout=Timeout) for _ in range(max(1, int(Repeat)))]
+            successful_measurements = [measurement for measurement in measurements if (measurement['Error'] is None)]
+
+            # A failed import has no cost to be ranked
+            if (len(successful_measurements) == 0):
+                print(f"Package '{pkg}' could not be imported, its import cost is not measured ({measurements[-1]['Error']}).")
+                continue
+
+            import_cost = min(successful_measurements, key=lambda measurement: measurement['Cumulative'])
+            import_cost['LazyCandidate'] = (import_cost['Cumulative'] >= float(LazyThreshold))
+            import_cost['ImportedBy'] = imported_by[pkg]
+            import_costs.append(import_cost)
+
+        import_costs.sort(key=lambda import_cost: -import_cost['Cumulative'])
+
+        if (bool(Verbose)):
+            PSL(f'Measured import cost of {len(import_costs)} packages', LastLine=True)
+            print(f"{'Package':<30} {'Cumulative':>12} {'Self':>10} {'Modules':>8} {'RSS':>10}  Lazy")
+
+            for import_cost in import_costs:
+                rss = f"{import_cost['RSS'] / 1048576:.1f} MiB" if (import_cost['RSS'] is not None) else '-'
+                print(f"{import_cost['Package']:<30} {import_cost['Cumulative'] * 1000:>9.1f} ms {import_cost['Self'] * 1000:>7.1f} ms {import_cost['Modules']:>8} {rss:>10}  {'yes' if (import_cost['LazyCandidate']) else ''}")
+
+        return import_costs
+
+    def Watch(self, Interval: float = 1.0, DeepScan: bool = True, ProjectOnly: bool = True, OnMissing=None, Install: bool = False, IncludeDynamicImports: bool = True, ImportContexts: tuple | list | None = None, Extractor: str = 'AST', Verbose: bool = False):
+        """
+            ### Keeps missing packages of '__main__' script current while it runs, polling its sources in a background thread (see 'ImportWatcher').
+
+            #### Usage:
+                >>> watcher = PackageManager().Watch(Interval=2, OnMissing=print)
+                >>> watcher.MissingPackages
+                >>> watcher.Stop()
+
+            #### Args:
+                - Interval (float, optional): Seconds between polls. Defaults to 1.0.
+                - DeepScan (bool, optional): Scans and watches imported packages for their own imports. Defaults to True.
+                - ProjectOnly (bool, optional): If enabled, only packages under '__main__' script directory are scanned and watched. Defaults to True.
+                - OnMissing (callable | None, optional): Called with a tuple of packages names every time new missing packages appear. Defaults to None.
+                - Install (bool, optional): Installs new missing packages as soon as they appear. Defaults to False.
+                - IncludeDynamicImports (bool, optional): If enabled, packages imported dynamically while the code runs will be collected. Defaults to True.
+                - ImportContexts (tuple | list | None, optional): Import contexts to be collected from the whole tree (see 'ImportCollector.CONTEXTS'). Defaults to None.
+                - Extractor (str, optional): 'AST' or 'Bytecode' extraction. Defaults to 'AST'.
+                - Verbose (bool, optional): Prints watch progress. Defaults to False.
+
+            #### Returns:
+                - ImportWatcher: Started watcher.
+        """
+
+        return ImportWatcher(Manager=self, Interval=Interval, DeepScan=DeepScan, ProjectOnly=ProjectOnly, OnMissing=OnMissing, Install=Install, IncludeDynamicImports=IncludeDynamicImports, ImportContexts=ImportContexts, Extractor=Extractor, Verbose=Verbose).Start()
+
+class LazyInstaller:
+    """
+        ## 'sys.meta_path' finder installing missing packages on demand.\n
+        Nothing is analyzed on startup: the finder is consulted only after every other finder failed to locate a top-level package,
+        it then installs the package (if classified as missing by 'PackageManager') and retries the import transparently.
+
+        ### Variables:\n
+            >>> AttemptedPackages
+            >>> Manager
+            >>> ProjectOnly
+            >>> Verbose
+
+        ### Public Methods:\n
+            >>> find_spec(self)
+            >>> GetMode()
+            >>> Register()
+            >>> Unregister(self)
+    """
+
+    def __init__(self, Manager: PackageManager | None = None, ProjectOnly: bool = True, Verbose: bool = False) -> None:
+        """
+            ### Constructor stores the finder options, 'PackageManager' is only constructed when a package is missing.
+
+            #### Args:
+                - Manager (PackageManager | None, optional): Instance classifying and installing missing packages. Defaults to None, which constructs one on first use.
+                - ProjectOnly (bool, optional): If enabled, only imports made by project code are handled, failing imports of installed packages and std-lib (usually optional dependencies guarded by 'except ImportError') are left as they are. Defaults to True.
+                - Verbose (bool, optional): Prints installations progress. Defaults to False.
+        """
+
+        self.Manager = Manager
+        self.ProjectOnly = bool(ProjectOnly)
+        self.Verbose = bool(Verbose)
+        self.AttemptedPackages = set()
+
+        self.__lock = threading.RLock()
+        self.__installing = threading.local()
+        self.__libraryPaths = None
+
+    @staticmethod
+    def GetMode() -> str:
+        """
+            ### Reads 'PACKAGEMANAGER_MODE' environment variable, which selects how 'AutoImporter' installs missing packages.
+
+            #### Returns:
+                - str: 'eager' (default) scans sources on startup, 'lazy' installs packages when importing them fails, 'off' does nothing.
+        """
+
+        mode = os.environ.get('PACKAGEMANAGER_MODE', '').strip().lower()
+
+        return mode if (mode in ('lazy', 'off')) else 'eager'
+
+    @classmethod
+    def Register(cls, Manager: PackageManager | None = None, ProjectOnly: bool = True, Verbose: bool = False):
+        """
+            ### Appends a finder to 'sys.meta_path', unless one is already registered.
+
+            #### Args:
+                - Manager (PackageManager | None, optional): Instance classifying and installing missing packages. Defaults to None, which constructs one on first use.
+                - ProjectOnly (bool, optional): If enabled, only imports made by project code are handled. Defaults to True.
+                - Verbose (bool, optional): Prints installations progress. Defaults to False.
+
+            #### Returns:
+                - LazyInstaller: Registered finder.
+        """
+
+        for finder in sys.meta_path:
+            if (isinstance(finder, cls)):
+                return finder
+
+        # Appended, so regular finders always come first and installed packages never reach it
+        finder = cls(Manager=Manager, ProjectOnly=ProjectOnly, Verbose=Verbose)
+        sys.meta_path.append(finder)
+
+        return finder
+
+    def Unregister(self) -> None:
+        """
+            ### Removes the finder from 'sys.meta_path'.
+
+            #### Returns:
+                None
+        """
+
+        if (self in sys.meta_path):
+            sys.meta_path.remove(self)
+
+        return None
+
+    def find_spec(self, fullname: str, path=None, target=None):
+        """
+            ### Finder protocol ('importlib.abc.MetaPathFinder'), called by the import system for modules no other finder located.
+
+            #### Args:
+                - fullname (str): Imported module name.
+                - path (optional): Parent package search locations, None for top-level modules.
+                - target (optional): Module object when reloading.
+
+            #### Returns:
+                - ModuleSpec | None: Spec of the installed package, else, None (the import raises 'ModuleNotFoundError' as usual).
+        """
+
+        # Only top-level packages are installable, submodules of installed packages are found by regular finders
+        if (path is not None) or ('.' in fullname) \
+        or (getattr(self.__installing, 'Active', False)):
+            return None
+
+        with self.__lock:
+            if (fullname in self.AttemptedPackages):
+                return None
+
+            if (self.ProjectOnly) and (not self.__IsImportedByProject()):
+                return None
+
+            self.AttemptedPackages.add(fullname)
+            self.__installing.Active = True
+
+            try:
+                if (self.Manager is None):
+                    self.Manager = PackageManager()
+
+                if (not self.Manager.InstallMissingPackage(fullname, self.Verbose)):
+                    return None
+
+            # A failing installer must not turn the import into another error than 'ModuleNotFoundError'
+            except Exception as error:
+                print(error)
+                return None
+
+            finally:
+                self.__installing.Active = False
+
+            # Newly installed files must be visible to path finders caching directories listings
+            importlib.invalidate_caches()
+
+            for finder in list(sys.meta_path):
+                if (finder is self) or (not hasattr(finder, 'find_spec')):
+                    continue
+
+                module_spec = finder.find_spec(fullname, path, target)
+
+                if (module_spec is not None):
+                    return module_spec
+
+        return None
+
+    def __IsImportedByProject(self) -> bool:
+        """
+            ### Checks whether the failing import statement belongs to project code (neither std-lib nor installed packages).
+
+            #### Returns:
+                - bool: True if the importing file is outside std-lib and site-packages directories.
+        """
+
+        if (self.__libraryPaths is None):
+            import sysconfig
+
+            library_paths = set([os.path.abspath(sysconfig.get_paths()[library_key]).replace('\\', '/') + '/' for library_key in ('stdlib', 'platstdlib', 'purelib', 'platlib') if (sysconfig.get_paths().get(library_key))])
+            library_paths.update([os.path.abspath(site_path).replace('\\', '/') + '/' for site_path in sys.path if (site_path) and ('-packages' in site_path)])
+            self.__libraryPaths = tuple(library_paths)
+
+        # Skipping frames of this finder and of the import system itself
+        frame = sys._getframe(1)
+        while (frame is not None) \
+        and ((frame.f_code.co_filename.startswith('<frozen')) or (os.path.abspath(frame.f_code.co_filename) == os.path.abspath(__file__))):
+            frame = frame.f_back
+
+        if (frame is None):
+            return True
+
+        importer_path = os.path.abspath(frame.f_code.co_filename).replace('\\', '/')
+
+        return not importer_path.startswith(self.__libraryPaths)
+
+class ImportWatcher:
+    """
+        ## Incremental watch mode for long-running processes (dev servers, workers).\n
+        Imports of every scanned file are kept in memory, and source files are polled for changes (modification time and size, no OS notification needed).\
+        Only changed, added or removed files are parsed again, then the missing packages set is updated from the in-memory import graph,\
+        so the cost of a poll is proportional to the change, not to the project size.
+
+        ### Variables:\n
+            >>> DeepScan
+            >>> Install
+            >>> Interval
+            >>> Manager
+            >>> MissingPackages
+            >>> OnMissing
+            >>> ProjectOnly
+            >>> RequiredPackages
+            >>> ScriptPath
+            >>> Verbose
+
+        ### Public Methods:\n
+            >>> Poll(self)
+            >>> Start(self)
+            >>> Stop(self)
+
+        ### Private Methods:\n
+            >>> __IsInProject(self)
+            >>> __PollForever(self)
+            >>> __ReadFiles(self)
+            >>> __ScanPackage(self)
+            >>> __Update(self)
+    """
+
+    def __init__(self, Manager: PackageManager | None = None, ScriptPath: str | None = None, Interval: float = 1.0, DeepScan: bool = True, ProjectOnly: bool = True, OnMissing=None, Install: bool = False, IncludeDynamicImports: bool = True, ImportContexts: tuple | list | None = None, Extractor: str = 'AST', Verbose: bool = False) -> None:
+        """
+            ### Constructor scans the script once, later changes are picked up by 'Poll()' (or by the polling thread, see 'Start()').
+
+            #### Args:
+                - Manager (PackageManager | None, optional): Instance locating and classifying packages, and installing them if 'Install' is enabled. Defaults to None, which constructs one.
+                - ScriptPath (str | None, optional): Watched script. Defaults to None, which uses '__main__' script.
+                - Interval (float, optional): Seconds between polls of the polling thread. Defaults to 1.0.
+                - DeepScan (bool, optional): Scans and watches imported packages for their own imports. Defaults to True.
+                - ProjectOnly (bool, optional): If enabled, only packages under the script directory are scanned and watched, installed packages are not (pip already knows their dependencies). Defaults to True.
+                - OnMissing (callable | None, optional): Called with a tuple of packages names every time new missing packages appear. Defaults to None.
+                - Install (bool, optional): Installs new missing packages as soon as they appear. Defaults to False.
+                - IncludeDynamicImports (bool, optional): If enabled, packages imported dynamically while the code runs will be collected. Defaults to True.
+                - ImportContexts (tuple | list | None, optional): Import contexts to be collected from the whole tree (see 'ImportCollector.CONTEXTS'). Defaults to None.
+                - Extractor (str, optional): 'AST' or 'Bytecode' extraction. Defaults to 'AST'.
+                - Verbose (bool, optional): Prints watch progress. Defaults to False.
+        """
+
+        self.Manager = Manager if (Manager is not None) else PackageManager()
+        self.ScriptPath = os.path.abspath(ScriptPath if (ScriptPath is not None) else sys.modules['__main__'].__file__).replace('\\', '/')
+        self.Interval = float(Interval)
+        self.DeepScan = bool(DeepScan)
+        self.ProjectOnly = bool(ProjectOnly)
+        self.OnMissing = OnMissing
+        self.Install = bool(Install)
+        self.Verbose = bool(Verbose)
+        self.RequiredPackages = tuple()
+        self.MissingPackages = tuple()
+
+        self.__extractionOptions = dict({'IncludeDynamicImports': bool(IncludeDynamicImports), 'StrictSearch': True, 'ImportContexts': ImportContexts, 'Extractor': Extractor})
+        self.__projectDir = os.path.dirname(self.ScriptPath)
+        self.__stdPackagesLookup = frozenset(self.Manager.STDPackages)
+
+        # In-memory import graph: package -> files, file -> (stat, imports), and packages that could not be located
+        self.__packagesFiles = dict()
+        self.__packagesPaths = dict()
+        self.__filesStats = dict()
+        self.__filesImports = dict()
+        self.__unresolvedPackages = set()
+        self.__dirsStats = dict()
+        self.__reportedPackages = set()
+
+        self.__lock = threading.Lock()
+        self.__stopEvent = threading.Event()
+        self.__thread = None
+
+        self.__ScanPackage(PackageName='__main__', PackagePath=self.ScriptPath)
+        self.__Update()
+
+    def Start(self):
+        """
+            ### Starts polling in a daemon thread, every 'Interval' seconds.
+
+            #### Returns:
+                - ImportWatcher: The watcher itself.
+        """
+
+        if (self.__thread is None) or (not self.__thread.is_alive()):
+            self.__stopEvent.clear()
+            self.__thread = threading.Thread(target=self.__PollForever, name='ImportWatcher', daemon=True)
+            self.__thread.start()
+
+        return self
+
+    def Stop(self) -> None:
+        """
+            ### Stops the polling thread, waiting for a running poll to finish.
+
+            #### Returns:
+                None
+        """
+
+        self.__stopEvent.set()
+
+        if (self.__thread is not None) and (self.__thread is not threading.current_thread()):
+            self.__thread.join()
+
+        self.__thread = None
+
+        return None
+
+    def Poll(self) -> dict:
+        """
+            ### Checks watched files once, parses changed and added files again, then updates required and missing packages.
+
+            #### Returns:
+                - dict: Return keys = Changed, Added, Removed (files), NewMissing (packages)
+        """
+
+        with self.__lock:
+            changed_files, removed_files = [], []
+
+            for source_file, file_stat in list(self.__filesStats.items()):
+                try:
+                    current_stat = os.stat(source_file)
+                except OSError:
+                    removed_files.append(source_file)
+                    continue
+
+                if ((current_stat.st_mtime_ns, current_stat.st_size) != file_stat):
+                    changed_files.append(source_file)
+
+            for source_file in removed_files:
+                self.__filesStats.pop(source_file, None)
+                self.__filesImports.pop(source_file, None)
+
+            for pkg, pkg_files in list(self.__packagesFiles.items()):
+                if (pkg != '__main__') and (any([source_file in removed_files for source_file in pkg_files])):
+                    # The package may have moved (e.g. a module turned into a package), it is located again on next update
+                    del self.__packagesFiles[pkg]
+                    del self.__packagesPaths[pkg]
+
+            # Added files only matter to packages listed from a directory, or to imports which could not be located before
+            changed_dirs = []
+
+            for dir_path, dir_mtime in list(self.__dirsStats.items()):
+                try:
+                    current_mtime = os.stat(dir_path).st_mtime_ns
+                except OSError:
+                    current_mtime = None
+
+                if (current_mtime != dir_mtime):
+                    self.__dirsStats[dir_path] = current_mtime
+                    changed_dirs.append(dir_path)
+
+            added_files = []
+
+            if (changed_dirs):
+                importlib.invalidate_caches()
+
+                # Namespace packages are listed from their directory, modules and regular packages are single files
+                for pkg, pkg_path in list(self.__packagesPaths.items()):
+                    if (os.path.dirname(pkg_path) in changed_dirs) and (not os.path.isfile(pkg_path)) and (pkg in self.__packagesFiles):
+                        listed_files = GetPackageFiles(PackagePath=pkg_path) or []
+                        added_files.extend([source_file for source_file in listed_files if (source_file not in self.__filesStats)])
+                        self.__packagesFiles[pkg] = tuple(listed_files)
 
-        def __handleAssign(Node: ast.Assign) -> tuple:
-            """
-                Collects packages names imported dynamically by assignment 'e.g. variable = __import__(module)'
+                # Imports that could not be located may be provided by new files
+                self.__unresolvedPackages.clear()
 
-                #### Args:
-                    - Node (ast.Assign): AST Assign type node object
+            self.__ReadFiles(SourceFiles=changed_files + added_files)
 
-                #### Returns:
-                    - tuple: Imported packages names
-            """
+            new_missing = self.__Update() if (changed_files or added_files or removed_files or changed_dirs) else tuple()
 
-            # Assure 'Node' type to process it
-            if (type(Node) == ast.Assign):
-                # Creating empty set to collect packages throughout the process
-                pkgs = set()
-                # Picking only functions assigned to a variable
-                if (hasattr(Node.value, 'func')):
-                    # Shorthanding 'Node.value.func'
-                    Node_func = Node.value.func
-                    
-                    # First if statement select directly called dynamic imports (e.g. import_module(module) or __import__(module))
-                    # Second if statement select class.method called dynamic imports (e.g. importlib.import_module(module))
-                    if ((hasattr(Node_func, 'id')) and (Node_func.id in ['__import__', 'import_module'])) \
-                    or ((hasattr(Node_func, 'value')) and (Node_func.value.id in ['importlib'])):
-                        
-                        # Looping over import function arguments to collect modules passed as arguments
-                        # This loop applies to positined argument assignment (e.g. __import__(module))
-                        for arg in Node.value.args:
-                            # Collecting argument value in the packages container
-                            pkgs.add(getPkgName(arg.value))
-                        
-                        # This loop applies to referenced argument assignment (e.g. __import__(name=module))
-                        for keyword in Node.value.keywords:
-                            # Check if reference argument name == name (applies to '__import__' and 'importlib.import_module')
-                            if (keyword.arg == 'name'):
-                                # Collecting argument value in the packages container
-                                pkgs.add(getPkgName(keyword.value.value))
-                    
-                    else:
-                        pass
-                
-                else:
-                    pass
-            
-            else:
-                # Return (None) if this is not an Assign Node
-                pkgs = [None]
+        if (bool(self.Verbose)) and (changed_files or added_files or removed_files):
+            PSL(f"Watch: {len(changed_files)} changed, {len(added_files)} added, {len(removed_files)} removed files", LastLine=True)
 
-            return tuple(pkgs)
-                
-        def __handleExpr(Node: ast.Expr) -> tuple:
-            """
-                Collects packages names imported dynamically by direct expression 'e.g. __import__(module)'
+        return dict({'Changed': changed_files, 'Added': added_files, 'Removed': removed_files, 'NewMissing': new_missing})
 
-                #### Args:
-                    - Node (ast.Expr): AST Expr type node object
+    def __PollForever(self) -> None:
+        """
+            ### Polling thread body, a failing poll is reported and polling continues.
 
-                #### Returns:
-                    - tuple: Imported packages names
-            """
-            
-            # Assure 'Node' type to process it
-            # The second part of the if statment is used to ensure it catches only called functions not comments
-            # The third part of the if statment ensures that the called import has valid argument value
-            if (type(Node) == ast.Expr) \
-            and (type(Node.value) == ast.Call) \
-            and ((Node.value.args) or (Node.value.keywords)):
-                # Creating empty set to collect packages throughout the process
-                pkgs = set()
-
-                # This loop applies to positined argument assignment (e.g. __import__(module))
-                for arg in Node.value.args:
-                    # Picking only directly called functions (|__import__) not functions assigned to variables
-                    if (type(arg) == ast.Constant) \
-                    and (hasattr(arg, 'value')):
-                        # Adding module name to set container
-                        pkgs.add(arg.value)
-                
-                # Applies to referenced argument assignment (e.g. __import__(name=module))
-                for keyword in Node.value.keywords:
-                    # Ensuring types appropriate for desired import calls (__import__(), importlib.import_module())
-                    if (type(keyword.value) == ast.Constant) \
-                    and (hasattr(keyword, 'value')):
-                        # Adding module name to set container
-                        pkgs.add(keyword.value.value)
+            #### Returns:
+                None
+        """
 
-            else:
-                # Return (None) if this is not an Expr Node or the expression is not a function
-                pkgs = [None]
+        while (not self.__stopEvent.wait(self.Interval)):
+            try:
+                self.Poll()
+            except Exception as error:
+                print(error)
 
-            return tuple(pkgs)
+        return None
 
-        #region FuncBody
+    def __ScanPackage(self, PackageName: str, PackagePath: str) -> None:
+        """
+            ### Lists and reads files of a package never scanned before.
 
-        # Extracting source code from target package file
-        source_code = str(__getPackageSource(FilePath=PackagePath))
+            #### Args:
+                - PackageName (str): Package name ('__main__' for the watched script).
+                - PackagePath (str): Package file path.
 
-        # Parsed code into ast nodes
-        parsed_code = ast.parse(source_code)
+            #### Returns:
+                None
+        """
 
-        # Shorthanding slicing dot-separated imports (e.g. import os.path)
-        # and if pkg is somehow pass as None, return it as it is.
-        # To be used in above functions
-        getPkgName = lambda pkg: pkg.split('.')[0]
+        pkg_files = GetPackageFiles(PackagePath=PackagePath) or []
+        self.__packagesFiles[PackageName] = tuple(pkg_files)
+        self.__packagesPaths[PackageName] = PackagePath
 
-        # Two empty containers to collect initial and dynamic imports
-        initial_imports = set()
-        dynamic_imports = set()
+        pkg_dir = os.path.dirname(PackagePath)
 
-        # If 'StrictSearch' is enabled, only nodes containing the word 'import' in their source code will be processed
-        if (bool(StrictSearch)):
-            code_nodes = [node for node in parsed_code.body if 'import' in ast.get_source_segment(source=source_code, node=node)]
-        else:
-            code_nodes = parsed_code.body
+        if (pkg_dir not in self.__dirsStats):
+            try:
+                self.__dirsStats[pkg_dir] = os.stat(pkg_dir).st_mtime_ns
+            except OSError:
+                self.__dirsStats[pkg_dir] = None
 
-        # Looping over code nodes
-        for node in code_nodes:
-            # The following if statments selects only Import, ImportFrom, Assign, and Expression nodes
-            # from the provided code and process each node speacially.
-            if   (type(node) == ast.Import):      initial_imports.update(__handleImport(Node=node))
-            elif (type(node) == ast.ImportFrom):  initial_imports.update(__handleImportFrom(Node=node))
-            elif (type(node) == ast.Assign):      dynamic_imports.update(__handleAssign(Node=node))
-            elif (type(node) == ast.Expr):        dynamic_imports.update(__handleExpr(Node=node))
-            # 'else' here is set to pass to ignore every other node type
-            else: pass
-        
-        # If 'IncludeDynamicImports' is enabled, packages imported dynamically while the code runs will be collected.
-        # This includes packages imported by '__import__()' and 'importlib.import_module()'.
-        # IMPORTS STATEMENTS INSIDE LOOPS WILL NOT BE PROCESSED
-        if (bool(IncludeDynamicImports)):
-            imports = set().union(initial_imports, dynamic_imports)
-        else:
-            imports = initial_imports
+        self.__ReadFiles(SourceFiles=[source_file for source_file in pkg_files if (source_file not in self.__filesImports)])
 
-        # Check if imports has content. if yes, sort them, if no, set imports to None to indicate No Imports
-        if (imports):
-            # Neglecting every 'None' element
-            imports = [pkg for pkg in imports if str(pkg) != 'None']
-            # Sorting the imports list
-            imports = list(sorted(imports))
-        else:
-            imports = tuple()
+        return None
 
-        #endregion
+    def __ReadFiles(self, SourceFiles: list) -> None:
+        """
+            ### Reads imports of files, recording their modification time and size before reading them.
 
-        return tuple(imports)
+            #### Args:
+                - SourceFiles (list): Files to be read.
 
-    def __GetRequiredPackages(self, PackagePath: str, IncludeDynamicImports: bool = True, IncludePrivatePackages: bool = False, DeepScan: bool = False, Verbose: bool = False) -> tuple:
+            #### Returns:
+                None
         """
-            ### Collects all imported packages by a script and (optionally) imports of its imports, \
-            then tests wheather these packages are built-ins and std-lib packages or not.\n
 
-            #### If you are working on a project with many relative imports, it is prefered to Enable 'DeepScan'
+        for source_file in SourceFiles:
+            try:
+                file_stat = os.stat(source_file)
+                self.__filesStats[source_file] = (file_stat.st_mtime_ns, file_stat.st_size)
+            except OSError:
+                self.__filesStats[source_file] = None
 
-            #### Args:
-                - PackagePath (str): Python file path to be analyzed for imports.
-                - IncludeDynamicImports (bool, optional): If enabled, packages imported dynamically while the code runs will be collected. Defaults to True.
-                - IncludePrivatePackages (bool, optional): If enabled, packages names starting with '_' will be collected. PREFERABLY, DON'T CHANGE DEFAULT. Defaults to False.
-                - DeepScan (bool, optional): Scans imported scripts in target script for their own imports. Defaults to False.
-                - Verbose (bool, optional): Prints function progress. Defaults to False.
+        for source_file, file_imports, error in IterPackageImports(PackagePath=self.ScriptPath, SourceFiles=list(SourceFiles), Stats=self.Manager.Stats, **self.__extractionOptions):
+            if (error is not None):
+                print(f"Could not analyze '{source_file}': {error}")
+
+            self.__filesImports[source_file] = tuple(file_imports)
+
+        return None
+
+    def __Update(self) -> tuple:
+        """
+            ### Walks the in-memory import graph from the watched script, scanning packages reached for the first time only,\
+            then updates required and missing packages, reporting (and installing) new missing packages.
 
             #### Returns:
-                - tuple: Packages imported but not installed or cannot be imported.
+                - tuple: New missing packages.
         """
 
-        # Collecting imported packages by module given its path 'PackagePath'
-        imported_packages = self.__GetImportedPackages(PackagePath=PackagePath, IncludeDynamicImports=IncludeDynamicImports, StrictSearch=True, Verbose=Verbose)
-        # Getting project packages (packages in 'sys.modules' but not in 'sys.stdlib_module_names' or 'sys.builtin_module_names') or packages that are not installed
-        project_main_imports = [pkg for pkg in imported_packages if pkg not in self.STDPackages]
-        # 'required_packes' is used as recursion container
-        required_packages = set(imported_packages)
+        required_packages = set()
+        visited_packages = set()
+        frontier = collections.deque(['__main__'])
 
-        # Check 'DeepScan' state
-        if (bool(DeepScan)):
-            # Loop over project packages only.
-            # System packages are not checked since we can check their requirements through pip,
-            # also system packages would take very long time to check, which is unreliable.
-            for pkg in project_main_imports:
-                if (bool(Verbose)): PSL(f"Analyzing packages imported by '{pkg}'")
-                # Check if 'pkg' not in 'self.AnalyzedPackages'
-                # 'self.AnalyzedPackages' work as recursion terminator if all project packages are in it
-                if (pkg not in self.AnalyzedPackages):
-                    # Adding 'pkg' to recursion termination list so it is not processed twice
-                    self.AnalyzedPackages.add(pkg)
+        while (frontier):
+            pkg = frontier.popleft()
 
-                    # Locating target 'pkg' path
-                    pkg_path = self.__GetPackagePath(PackageName=pkg, IgnoreBuiltins=True)
+            if (pkg in visited_packages):
+                continue
 
-                    # Check if package has a path (not a built-in nor does not exist)
-                    if (str(pkg_path) != 'None'):
-                        # Firing recursion #
-                        # Recursion here works as follow:
-                        # 1. 'pkg_path' which is an imported package from '__main__' is checked for its own imports
-                        # 2. Second time when the function reachs this recursion again, it checks the imported packages
-                        #    in of package imported by '__main__' and so on.
-                        # 3. Recursion is terminated when all sub-packages are checked for imports (when pkg_path is None)
-                        recursion = self.__GetRequiredPackages(PackagePath=pkg_path, IncludeDynamicImports=IncludeDynamicImports, IncludePrivatePackages=IncludePrivatePackages, DeepScan=DeepScan)
+            visited_packages.add(pkg)
 
-                        # Updating 'required_packages' with new imports from recursion to be carried out to next recursion loop
-                        required_packages.update(recursion)
-                    
-                    # If package is None (built-in or does not exist), continue loop
-                    else:
-                        continue
-                
-                # If 'pkg' in 'self.AnalyzedPackages' (else is True),
-                # the loop continues without analyzing current 'pkg' since it must have been analyzed before
-                else:
+            if (pkg not in self.__packagesFiles):
+                if (pkg in self.__unresolvedPackages):
                     continue
-        
-        # If 'DeepScan' is False, return only packages required by __main__
-        else:
-            if (bool(Verbose)): PSL(f"Analyzing packages imported by '{os.path.basename(PackagePath)}'")
-            pass
-        
-        if (bool(Verbose)): PSL(f"Sorting required packages...")
 
-        # Selecting only parent packages (by using 'pkg.split('.')[0]')
-        required_packages = [pkg.split('.')[0] for pkg in required_packages]
+                pkg_path = self.Manager.GetPackagePath(PackageName=pkg, IgnoreBuiltins=True)
 
-        # Another filtration of 'requried_packages', removing built-in packages and packages already in 'sys.stdlib_module_names' (a.k.a. 'self.STDPackages')
-        required_packages = sorted(set([pkg for pkg in required_packages if pkg not in self.STDPackages]))
+                # Built-ins and packages that cannot be located (or were removed) are not scanned,
+                # namespace packages are located as '<package dir>/<name>.py' which does not exist
+                if (str(pkg_path) == 'None') \
+                or ((not os.path.isfile(pkg_path)) and (os.path.basename(os.path.dirname(pkg_path)) != pkg.split('.')[-1])):
+                    self.__unresolvedPackages.add(pkg)
+                    continue
 
-        # Selects either to include private modules (modules names starts with '_') in required packages or not
-        if (bool(IncludePrivatePackages)):
-            pass
-        else:
-            # If 'IncludePrivatePackages' is set to 'False', then private packages (packages start with _) will be excluded
-            required_packages = [pkg for pkg in required_packages if (pkg.startswith('_') == False)]
+                if (self.ProjectOnly) and (not self.__IsInProject(FilePath=pkg_path)):
+                    self.__unresolvedPackages.add(pkg)
+                    continue
 
-        # Assigning return value to self.Variable
-        self.RequiredPackages = tuple(required_packages)
+                self.__ScanPackage(PackageName=pkg, PackagePath=pkg_path)
 
-        return tuple(required_packages)
+            pkg_imports = set([imp for source_file in self.__packagesFiles[pkg] for imp in self.__filesImports.get(source_file, ())])
+            pkg_imports = set([imp for imp in pkg_imports if (imp.split('.')[0] not in self.__stdPackagesLookup)])
+            required_packages.update(pkg_imports)
 
-    def __GetMissingPackages(self, PackagePath: str, IncludeDynamicImports: bool = True, IncludePrivatePackages: bool = False, DeepScan: bool = False, Verbose: bool = False) -> tuple:
-        # Collecting required packages by the project that are neither built-ins nor std_lib
-        required_packages = self.__GetRequiredPackages(PackagePath=PackagePath, IncludeDynamicImports=IncludeDynamicImports, IncludePrivatePackages=IncludePrivatePackages, DeepScan=DeepScan, Verbose=Verbose)
-        # Getting missing packages (packages not accessible in anyway)
-        missed_main_imports = [pkg for pkg in required_packages if pkg not in self.AccessiblePackages]
+            if (bool(self.DeepScan)):
+                frontier.extend(sorted(pkg_imports))
 
-        return tuple(missed_main_imports)
+        self.RequiredPackages = tuple(sorted(set([pkg.split('.')[0] for pkg in required_packages if (not pkg.startswith('_'))])))
 
-    ### ACTION MAKERS
+        # Packages classified as missing are confirmed by the import system, they may have been installed since the manager was constructed
+        self.MissingPackages = tuple([pkg for pkg in self.RequiredPackages if (self.Manager.IsMissingPackage(PackageName=pkg)) and (importlib.util.find_spec(pkg) is None)])
+        new_missing = tuple([pkg for pkg in self.MissingPackages if (pkg not in self.__reportedPackages)])
+        self.__reportedPackages.update(new_missing)
 
-    def __InstallPackage(self, PackageName: str, PackageVersion: str = "latest", Verbose: bool = False) -> dict:
+        if (new_missing):
+            if (bool(self.Verbose)): PSL(f"Watch: new missing packages ({', '.join(new_missing)})", LastLine=True)
+
+            if (self.OnMissing is not None):
+                # A failing callback must never stop watching
+                try:
+                    self.OnMissing(new_missing)
+                except Exception as error:
+                    print(error)
+
+            if (bool(self.Install)):
+                for pkg in new_missing:
+                    self.Manager.InstallMissingPackage(PackageName=pkg, Verbose=self.Verbose)
+
+                importlib.invalidate_caches()
+
+        return new_missing
+
+    def __IsInProject(self, FilePath: str) -> bool:
         """
-            ### Installs specific package with desired version. If 'PackageVersion' == None -> latest version will be installed.
+            ### Checks whether a file lies under the watched script directory.
 
             #### Args:
-                - PackageName (str): Exact package name to be installed.
-                - PackageVersion (str, optional): Exact package version to be installed. Comparator operators are not allowed! Defaults to "latest".
-                - Verbose (bool, optional): Prints function progress.
+                - FilePath (str): File path.
 
             #### Returns:
-                - dict: Return keys = ReturnMessage, ExitCode, ExitMessage
+                - bool: True if the file is part of the project.
         """
 
-        # Check package version to be installed
-        if (PackageVersion.replace('.','').isdigit()):
-            target_package = f'{str(PackageName)}=={str(PackageVersion)}'
-        else:
-            target_package = str(PackageName)
-
-        # Print progress to stdout
-        if (bool(Verbose)): PSL(f'Attempting to install "{target_package}"...')
-
-        # Setup a command to install the package
-        # Using 'sys.executable' to ensure that we install the package for the same version and location of running Python
-        installation_command = f'"{sys.executable}" -m pip install {str(target_package)}'
-        installation_process = subprocess.Popen(str(installation_command), shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        
-        # Collect return messages from executed command
-        execution_message = str(installation_process.communicate())
-        execution_exit_code = int(installation_process.wait())
+        try:
+            return os.path.commonpath([self.__projectDir, os.path.abspath(FilePath)]) == os.path.abspath(self.__projectDir)
+        except ValueError:
+            return False
 
-        # Define function return messages based on execution return message
-        if (execution_exit_code == 0):      # 0 -> Successful Exit Code
-            return_message = f'"{target_package}" has been installed successfully!'
-        elif (execution_exit_code == 1):    # 1 -> Successful Exit Code
-            return_message = f'"{target_package}" was not recognized, please consider installing it manually!'
-        else:                               # Other -> Unknown Exit Code
-            return_message = f'Unexpected exit code ({execution_exit_code}) returned while installing "{target_package}"'
+def Main(Arguments: list | None = None) -> int:
+    """
+        Command line interface ('python -m PackageManager'): scans many entry scripts (or directories of entry scripts) in a single process,
+        sharing the environment snapshot, the import cache and the distribution index between them,
+        then reports required and missing packages of every entry and of all entries combined.
 
-        # Print progress to stdout
-        if (bool(Verbose)): PSL(return_message, LastLine=True)
-        
-        return dict(
-                {
-                "ReturnMessage" : return_message,
-                "ExitCode"      : execution_exit_code,
-                "ExitMessage"   : execution_message
-                }
-            )
+        #### Usage:
+            >>> python -m PackageManager services/* --jobs 4 --json report.json
+            >>> python -m PackageManager app.py worker.py --export --install
+            >>> python -m PackageManager app.py --profile
 
-    # def __RemovePackage(self, PackageName: str, PackageVersion = "latest", Verbose = False):
-    #     pass
+        #### Args:
+            - Arguments (list | None, optional): Command line arguments. Defaults to None, which reads 'sys.argv'.
 
-    # def __UpgradePackage(self, PackageName: str, PackageVersion = "latest", Verbose = False):
-    #     pass
+        #### Returns:
+            - int: Exit code, 0 if no required package is missing (or all missing packages were installed), else, 1.
+    """
 
-    def __UpgradePIP(self, Verbose: bool = False) -> int:
+    # Imported on demand, it is only needed by the command line and would slow down every startup
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='python -m PackageManager', description='Scans entry scripts for required and missing packages, in one process sharing caches between them.')
+    parser.add_argument('entries', nargs='+', help='Entry scripts, or directories of entry scripts (see --glob).')
+    parser.add_argument('--glob', default='*.py', help="Pattern of entry scripts inside directory entries, '**' matches subdirectories. Default: *.py")
+    parser.add_argument('--jobs', type=int, default=1, help='Worker processes parsing files during deep scans, started once and shared by all entries. Entries are scanned one after another, so with --no-deep-scan (entry scripts only) it has no effect. Default: 1')
+    parser.add_argument('--no-deep-scan', action='store_true', help='Scans entry scripts only, not the packages they import.')
+    parser.add_argument('--no-dynamic-imports', action='store_true', help="Ignores dynamic imports ('__import__()', 'importlib.import_module()').")
+    parser.add_argument('--contexts', default=None, help=f"Comma separated import contexts ({', '.join(ImportCollector.CONTEXTS)}). Default: top-level imports only")
+    parser.add_argument('--extractor', choices=('AST', 'Bytecode'), default='AST', help='Import extractor. Default: AST')
+    parser.add_argument('--cache-dir', default=None, help='Directory of the persistent caches. Default: user cache directory')
+    parser.add_argument('--no-cache', action='store_true', help='Disables persistent caches.')
+    parser.add_argument('--export', action='store_true', help='Exports requirements-by-<script>.txt next to every entry script.')
+    parser.add_argument('--lock', action='store_true', help='Exports requirements-lock-by-<script>.txt next to every entry script.')
+    parser.add_argument('--install', action='store_true', help='Installs missing packages of all entries, with a single pip invocation.')
+    parser.add_argument('--profile', action='store_true', help='Measures import time and memory of every required package, each in a fresh interpreter, ranked from the most expensive.')
+    parser.add_argument('--lazy-threshold', type=float, default=0.1, help='Cumulative import seconds flagging a profiled package as lazy import candidate. Default: 0.1')
+    parser.add_argument('--json', default=None, help="File the report is written to as JSON ('-' for stdout).")
+    parser.add_argument('--stats', default=None, help="File metrics are written to ('.prom' for Prometheus text format, else, JSON).")
+    parser.add_argument('--verbose', action='store_true', help='Prints progress.')
+    arguments = parser.parse_args(Arguments)
+
+    import_contexts = tuple([context.strip() for context in arguments.contexts.split(',') if (context.strip())]) if (arguments.contexts) else None
+    scan_options = dict({'IncludeDynamicImports': not arguments.no_dynamic_imports, 'DeepScan': not arguments.no_deep_scan, 'ImportContexts': import_contexts, 'Extractor': arguments.extractor, 'Jobs': max(1, arguments.jobs)})
+
+    # A single instance for all entries: environment is listed once, and parsed files are shared through the import cache
+    manager = PackageManager(CacheDir=False if (arguments.no_cache) else (arguments.cache_dir or True), ScanPolicy=ScanPolicy.FromEnvironment())
+
+    # Worker processes are started once for all entries, instead of once per deep scan
+    if (scan_options['Jobs'] > 1) and (scan_options['DeepScan']):
+        # Imported on demand, it is only needed by parallel scans and would slow down every startup
+        import concurrent.futures
+        manager.Executor = concurrent.futures.ProcessPoolExecutor(max_workers=scan_options['Jobs'])
+
+    def __scanEntryScript(ScriptPath: str) -> dict:
         """
-            ### Upgrade pip if an upgrade is available.
-
-            #### Args:
-                - Verbose (bool, optional): Prints function progress.
+            Scans an entry script as if it was run: its directory comes first in 'sys.path' while it is scanned
 
             #### Returns:
-                - int: Exit Code {
-                    * 0 : Successfully upgraded | No new version available
-                    * 1 : An error occured
-                    * 2 : Unknown exit code
-                }
+                - dict: Return keys = Required, Missing, Seconds
         """
 
-        def __getPIPVersion() -> dict:
-            # Retriving pip version
-            execution = subprocess.Popen(f'"{sys.executable}" -m pip --version', shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            pip_version_msg = execution.communicate()[0].decode('UTF-8')
-            pip_version = pip_version_msg.split(' ')[1]
+        script_dir = os.path.dirname(ScriptPath)
+        sys.path.insert(0, script_dir)
+        importlib.invalidate_caches()
 
-            return dict({
-                'version': pip_version,
-                'message': pip_version_msg
-            })
+        try:
+            scan_started = time.perf_counter()
 
-        # Print progress to stdout
-        if (bool(Verbose)): PSL(f'Attempting to upgrade pip...')
+            # Packages analyzed for a previous entry must be analyzed again for this one, and files scanned for it are recorded by its exports
+            manager.AnalyzedPackages = set()
+            manager.ScannedFiles = set()
+            required_packages = manager.GetRequiredPackages(PackagePath=ScriptPath, **scan_options)
 
-        current_pip_version = __getPIPVersion()['version']
+            # Modules of the entry's own project are neither requirements nor missing
+            package_paths = {pkg: manager.GetPackagePath(PackageName=pkg, IgnoreBuiltins=True) for pkg in required_packages}
+            required_packages = [pkg for pkg in required_packages if (not IsProjectModule(ModuleName=pkg, ProjectDir=script_dir, ModulePath=package_paths[pkg]))]
+            missing_packages = [pkg for pkg in required_packages if (package_paths[pkg] is None) and (manager.IsMissingPackage(PackageName=pkg))]
 
-        # Setup a command to install the package
-        # Using 'sys.executable' to ensure that we install the package for the same version and location of running Python
-        execution = subprocess.Popen(f'"{sys.executable}" -m pip install --upgrade pip', shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        
-        # Collect return code from executed command
-        execution_exit_code = int(execution.wait())
+            # Exports reuse the packages collected above, the entry is only scanned again if it was not deep scanned (exports always are)
+            exported_packages = required_packages if (scan_options['DeepScan']) else None
 
-        new_pip = __getPIPVersion()
-        new_pip_version = new_pip['version']
-        new_pip_message = new_pip['message'].rstrip('\n')
+            if (arguments.export):
+                manager.ExportRequirements(ExportTo__main__Dir=True, ImportContexts=import_contexts, Extractor=arguments.extractor, Jobs=scan_options['Jobs'], ScriptPath=ScriptPath, PackagesNames=exported_packages)
 
-        pip_is_new = int(new_pip_version.replace('.','')) > int(current_pip_version.replace('.',''))
-        
-        # Define function return messages based on execution return message
-        if (execution_exit_code == 0) and pip_is_new:           # 0 -> Successful Exit Code
-            return_code = 0
-            return_message = 'pip has been upgraded successfuly!'
+            if (arguments.lock):
+                manager.ExportLockfile(ScriptPath=ScriptPath, ExportTo__main__Dir=True, ImportContexts=import_contexts, Extractor=arguments.extractor, Jobs=scan_options['Jobs'], PackagesNames=exported_packages)
 
-        elif (execution_exit_code == 0) and not pip_is_new:     # 0 -> Successful Exit Code
-            return_code = 0
-            return_message = 'pip is already latest!'
+            return dict({'Required': required_packages, 'Missing': missing_packages, 'Seconds': time.perf_counter() - scan_started})
 
-        elif (execution_exit_code == 1):  # 1 -> Error Exit Code
-            return_code = 1
-            return_message = 'pip was not upgraded, please consider upgrading pip manually!'
+        finally:
+            sys.path.remove(script_dir)
 
-        else:                           # Other -> Unknown Exit Code
-            return_code = 2
-            return_message = 'Unexpected exit code!'
+    report = dict({'Entries': dict(), 'Required': [], 'Missing': [], 'Failed': []})
+    exit_code = 0
 
-        # Print progress to stdout
-        if (bool(Verbose)): PSL(f'{return_message}\n{new_pip_message}', LastLine=True)
+    try:
+        for entry in arguments.entries:
+            entry_path = os.path.abspath(entry).replace('\\', '/')
 
-        return int(return_code)
+            if (os.path.isdir(entry_path)):
+                entry_scripts = sorted([script.replace('\\', '/') for script in glob.glob(f'{entry_path}/{arguments.glob}', recursive=True) if (os.path.isfile(script))])
+            elif (os.path.isfile(entry_path)):
+                entry_scripts = [entry_path]
+            else:
+                print(FileNotFoundError(f'{entry} could not be found!'))
+                report['Entries'][entry] = dict({'Scripts': [], 'Required': [], 'Missing': [], 'Seconds': 0.0, 'Error': 'NotFound'})
+                exit_code = 1
+                continue
 
-    ### USER ACCESSIBLE
+            entry_report = dict({'Scripts': dict(), 'Required': set(), 'Missing': set(), 'Seconds': 0.0})
 
-    # UNDER DEV
-    def AutoImportMissings(self, IncludeDynamicImports: bool = True, DeepScan: bool = True, UpgradePIP: bool = False, Verbose: bool = False) -> bool:
-        """
-            ### Automatically analysis '__main__' script, update PIP, and installs required packages if missing.
+            for script_path in entry_scripts:
+                if (arguments.verbose): PSL(f"Scanning '{script_path}'")
 
-            #### Args:
-                - IncludeDynamicImports (bool, optional): If enabled, packages imported dynamically while the code runs will be collected. Defaults to True.
-                - DeepScan (bool, optional): Scans imported scripts in target script for their own imports. Defaults to True.
-                - UpgradePIP (bool, optional): Optionally upgrade PIP before installing required packages. Defaults to False.
-                - Verbose (bool, optional): Prints function progress. Defaults to False.
+                script_report = __scanEntryScript(ScriptPath=script_path)
+                entry_report['Scripts'][script_path] = script_report
+                entry_report['Required'].update(script_report['Required'])
+                entry_report['Missing'].update(script_report['Missing'])
+                entry_report['Seconds'] += script_report['Seconds']
 
-            #### Returns:
-                - bool: returns True if all packages were successfully installed, else, False.
-        """
+            entry_report['Required'], entry_report['Missing'] = sorted(entry_report['Required']), sorted(entry_report['Missing'])
+            report['Entries'][entry] = entry_report
 
-        failed_packages = set()
+    finally:
+        if (manager.Executor is not None):
+            manager.Executor.shutdown(wait=True, cancel_futures=True)
+            manager.Executor = None
 
-        missing_packages = self.__GetMissingPackages(PackagePath=self.__mainScriptPath, IncludeDynamicImports=IncludeDynamicImports, DeepScan=DeepScan, Verbose=Verbose)
+    report['Required'] = sorted(set([pkg for entry_report in report['Entries'].values() for pkg in entry_report['Required']]))
+    report['Missing'] = sorted(set([pkg for entry_report in report['Entries'].values() for pkg in entry_report['Missing']]))
 
-        if (bool(UpgradePIP)): self.__UpgradePIP(Verbose=Verbose)
+    if (arguments.verbose): PSL(f"Scanned {len(arguments.entries)} entries", LastLine=True)
 
-        for ind, pkg in enumerate(missing_packages, 1):
-            if (bool(Verbose)): print(f"\nInstalling Packages {ind}/{len(missing_packages)}")
-            
-            retry_counter = 1
-            while (retry_counter > 0):
-                pkg_installer = self.__InstallPackage(PackageName=pkg, Verbose=Verbose)
+    if (arguments.install) and (report['Missing']):
+        installations = manager.InstallPackages(PackagesNames=tuple(report['Missing']), Verbose=arguments.verbose)
+        report['Failed'] = sorted([pkg for pkg, installation in installations.items() if (installation['ExitCode'] != 0)])
 
-                if (pkg_installer['ExitCode'] == 0):
-                    if (pkg in failed_packages):
-                        failed_packages.remove(pkg)
-                    else:
-                        pass
-                    
-                    break
+    if (report['Failed']) \
+    or ((report['Missing']) and (not arguments.install)):
+        exit_code = 1
 
-                else:
-                    retry_counter -= 1
-                    failed_packages.add(pkg)
-        
-        if (len(failed_packages) > 0):
-            print(f'\nCOULD NOT INSTALL THESE PACKAGES: ({", ".join(failed_packages)})!\nPLEASE CONSIDER INSTALLING THEM MANUALLY!\n')
+    # Profiled packages must be importable, missing packages are left out unless they were installed above
+    if (arguments.profile):
+        profiled_packages = [pkg for pkg in report['Required'] if (pkg not in report['Failed']) and ((pkg not in report['Missing']) or (arguments.install)) and (pkg != __name__)]
+        report['Profile'] = manager.ProfileImports(PackagesNames=profiled_packages, LazyThreshold=arguments.lazy_threshold, Verbose=(arguments.json != '-'))
 
-            while True:
-                decision = input('Would you like to continue executing your code? *IT WILL PROBABLY RAISE AN ERROR IF YOU CONTINUE..* (Y/n) ')
+    if (arguments.json == '-'):
+        print(json.dumps(report, indent=4))
 
-                if (decision == 'Y'):
-                    print()
-                    return False
-                elif (decision == 'n'):
-                    exit()
-                else:
-                    print('Invalid input!')
-        elif (str(missing_packages) == 'None') \
-        or (len(missing_packages) == 0):
-            print(f'\nNo missing required packages were found!\n')
-        
-        else:
-            print(f'\nRequired missing packages have been installed successfully!\n')
+    else:
+        entry_width = max([len('TOTAL')] + [len(entry) for entry in report['Entries']])
+        print(f"{'ENTRY':<{entry_width}}  {'SCRIPTS':>7}  {'REQUIRED':>8}  {'MISSING':>7}  {'SECONDS':>8}")
 
-    # UNDER DEV
-    def ExportRequirements(self, ExportTo__main__Dir: str | bool = False) -> dict:
-        """
-            ### Exports a requirement file contains modules required by the project which this method is called in.
+        for entry, entry_report in report['Entries'].items():
+            print(f"{entry:<{entry_width}}  {len(entry_report['Scripts']):>7}  {len(entry_report['Required']):>8}  {len(entry_report['Missing']):>7}  {entry_report['Seconds']:>8.2f}")
 
-            #### Args:
-                - ExportTo__main__Dir (str | bool, optional): This argument has three modes as explained below.\n
-                    * Mode 1: If set to bool(False), will not export to file and will only return a dict of packages and their versions. (Default)
-                    * Mode 2: If set to bool(True), will export requirements.txt file to parent directory of __main__ file.
-                    * Mode 3: If set to a valid directory str(path), will export requirement.txt to specified directory.
+        print(f"{'TOTAL':<{entry_width}}  {sum([len(entry_report['Scripts']) for entry_report in report['Entries'].values()]):>7}  {len(report['Required']):>8}  {len(report['Missing']):>7}  {sum([entry_report['Seconds'] for entry_report in report['Entries'].values()]):>8.2f}")
 
-            #### Returns:
-                - dict: Dict of packages names and versions (possible keys for each value => 'name', 'version')
-        """
+        if (report['Missing']): print(f"\nMissing packages: {', '.join(report['Missing'])}")
+        if (report['Failed']): print(f"COULD NOT INSTALL THESE PACKAGES: ({', '.join(report['Failed'])})!")
 
-        project_dir_path = os.path.dirname(self.__mainScriptPath)
-        pkgs = self.__GetRequiredPackages(self.__mainScriptPath, DeepScan=True)
-        reqs = []
+        if (arguments.json):
+            with open(file=arguments.json, mode='w') as report_file:
+                json.dump(report, report_file, indent=4)
 
-        for pkg in pkgs:
-            if project_dir_path not in self.__GetPackagePath(pkg):
-                reqs.append(pkg + "==" + importlib.metadata.version(pkg))
-            else:
-                pass
-        
-        reqs.insert(0, __name__ + '==' + __version__)
-        
-        reqs_dict = {pkg: {'name': pkg, 'version': ver} for pkg, ver in [req.split('==') for req in reqs]}
+    if (arguments.stats):
+        manager.Stats.Export(FilePath=arguments.stats)
 
-        if (bool(os.path.isdir(ExportTo__main__Dir))):
-            project_dir_path = ExportTo__main__Dir.replace('"', '').replace("'", '').replace('\\', '/')
-        else:
-            pass
-            
-        
-        if (bool(os.path.isdir(project_dir_path))) \
-        and (bool(ExportTo__main__Dir)):
-            with open(f'{project_dir_path}/requirements-by-{os.path.basename(self.__mainScript.__file__)}.txt', 'w') as req_file:
-                for pkg in reqs:
-                    req_file.write(pkg + '\n')
-        else:
-            pass
-            
-        return reqs_dict
+    return exit_code
 
 # UNDER DEVELOPMENT
 class AutoImporter:
@@ -785,6 +5928,45 @@ class AutoImporter:
         This class is riggered by importing it.
     """
     # Call AutoImportMissings as a variable value so that it is triggered as soon as the class AutoImporter is imported
-    if __name__ != '__main__':
-        PackageManager().AutoImportMissings(IncludeDynamicImports=True, DeepScan=True, UpgradePIP=False, Verbose=True)
-        
+    # Worker processes (e.g. spawned by parallel deep scans) re-import this module, they must never scan nor install again
+    IsImportedByMainProcess = (__name__ != '__main__') \
+        and not ((sys.modules.get('multiprocessing') is not None) and (sys.modules['multiprocessing'].current_process().name != 'MainProcess'))
+
+    if (IsImportedByMainProcess) \
+    and (LazyInstaller.GetMode() == 'lazy'):
+        # Lazy mode: nothing is analyzed on startup, packages are installed when importing them fails
+        LazyInstaller.Register(Verbose=True)
+
+    elif (IsImportedByMainProcess) \
+    and (LazyInstaller.GetMode() == 'eager') \
+    and not (StartupStamp.IsMainScriptFresh(IncludeDynamicImports=True, DeepScan=True)):
+        # Startup fast path: if the stamp of the last successful run is fresh, 'PackageManager' is not even constructed.
+        # Boot-time scanning can be capped through 'PACKAGEMANAGER_SCAN_POLICY' (see 'ScanPolicy.FromEnvironment()')
+        Manager = PackageManager(CacheDir=StartupStamp.GetCacheSetting(), ScanPolicy=ScanPolicy.FromEnvironment())
+        Manager.AutoImportMissings(IncludeDynamicImports=True, DeepScan=True, UpgradePIP=False, UseStamp=True, UseLockfile=True, SingleFlight=SingleFlightLock.GetSetting(), Verbose=True)
+
+        # Phases timings of this run, written to 'PACKAGEMANAGER_STATS' file ('.prom' for Prometheus text format, else, JSON)
+        if (os.environ.get('PACKAGEMANAGER_STATS')):
+            Manager.Stats.Export(FilePath=os.environ['PACKAGEMANAGER_STATS'])
+
+if (__name__ == '__main__'):
+    # Command line: the module is imported again under its own name, which is the name requirements are exported with and worker processes import.
+    # 'python -m PackageManager' run from the parent directory imports that directory as a namespace package first, which must not shadow the module
+    if (hasattr(sys.modules.get('PackageManager'), '__path__')):
+        del sys.modules['PackageManager']
+
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+    # 'AutoImporter' must not scan the command line itself while the module is imported
+    previous_mode = os.environ.get('PACKAGEMANAGER_MODE')
+    os.environ['PACKAGEMANAGER_MODE'] = 'off'
+
+    try:
+        command_line_module = importlib.import_module('PackageManager')
+    finally:
+        if (previous_mode is None):
+            del os.environ['PACKAGEMANAGER_MODE']
+        else:
+            os.environ['PACKAGEMANAGER_MODE'] = previous_mode
+
+    sys.exit(command_line_module.Main())
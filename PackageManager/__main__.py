@@ -0,0 +1,11 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+    Command line entry point: "python -m PackageManager" (from the directory holding this one) runs the module next to this file.
+    Run "python -m PackageManager --help" for options.
+"""
+
+import os, runpy
+
+runpy.run_path(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'PackageManager.py'), run_name='__main__')
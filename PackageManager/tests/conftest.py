@@ -0,0 +1,5 @@
+import os, sys
+
+# Tests import the module directly, it must never scan nor install anything while being imported
+os.environ['PACKAGEMANAGER_MODE'] = 'off'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,34 @@
+import pytest
+
+import PackageManager
+
+
+@pytest.mark.parametrize('setting', ['0', 'false', 'No'])
+def test_disabled_cache_setting(setting, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('PACKAGEMANAGER_CACHE_DIR', setting)
+
+    manager = PackageManager.PackageManager()
+
+    assert manager.ImportCache is None
+    assert list(tmp_path.iterdir()) == []
+    assert PackageManager.StartupStamp.GetCacheSetting() is False
+
+
+def test_unset_cache_setting(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv('PACKAGEMANAGER_CACHE_DIR', raising=False)
+
+    # Caching is opt-in for the library, and on by default for 'AutoImporter'
+    assert PackageManager.PackageManager().ImportCache is None
+    assert PackageManager.StartupStamp.GetCacheSetting() is True
+    assert PackageManager.StartupStamp.GetCacheSetting(Default=False) is False
+
+
+def test_cache_directory_setting(tmp_path, monkeypatch):
+    monkeypatch.setenv('PACKAGEMANAGER_CACHE_DIR', str(tmp_path / 'cache'))
+
+    manager = PackageManager.PackageManager()
+
+    assert manager.ImportCache is not None
+    assert (tmp_path / 'cache').is_dir()
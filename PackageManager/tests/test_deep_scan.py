@@ -0,0 +1,18 @@
+import Benchmark
+import PackageManager
+
+
+def test_parallel_deep_scan_matches_serial(tmp_path, monkeypatch):
+    site_dir = str(tmp_path / 'site-packages')
+    third_party = Benchmark.GenerateSitePackages(SiteDir=site_dir, Packages=12, FilesPerPackage=4, LinesPerFile=20, Seed=3)
+    main_script = Benchmark.GenerateProject(ProjectDir=str(tmp_path / 'project'), Files=60, LinesPerFile=20, FanOut=3, Depth=4, Cycles=0.5, DynamicImports=0.2, ThirdParty=third_party, Seed=3)
+
+    # Project modules and generated packages are importable, as if the project was run from its directory
+    monkeypatch.syspath_prepend(site_dir)
+    monkeypatch.syspath_prepend(str(tmp_path / 'project'))
+
+    serial_packages = PackageManager.PackageManager(CacheDir=False).GetRequiredPackages(main_script, DeepScan=True, Jobs=1)
+    parallel_packages = PackageManager.PackageManager(CacheDir=False).GetRequiredPackages(main_script, DeepScan=True, Jobs=4)
+
+    assert any([package.startswith('thirdparty_') for package in serial_packages])
+    assert parallel_packages == serial_packages
@@ -0,0 +1,89 @@
+import py_compile, textwrap
+
+import PackageManager
+
+
+SOURCE = textwrap.dedent('''
+    import os
+
+    try:
+        import yaml
+    except ImportError:
+        yaml = None
+
+    if os.name == 'nt':
+        import winreg
+
+    class A:
+        import json
+''')
+
+
+def write_compiled_module(tmp_path):
+    module_path = tmp_path / 'module.py'
+    module_path.write_text(SOURCE)
+    py_compile.compile(str(module_path), invalidation_mode=py_compile.PycInvalidationMode.TIMESTAMP, doraise=True)
+
+    return str(module_path).replace('\\', '/')
+
+
+def test_bytecode_is_not_read_for_top_level_imports(tmp_path):
+    module_path = write_compiled_module(tmp_path)
+
+    assert PackageManager.ReadBytecodeImports(FilePath=module_path) is None
+
+
+def test_extractors_agree_by_default(tmp_path):
+    module_path = write_compiled_module(tmp_path)
+
+    ast_imports = PackageManager.ReadPackageImports(module_path, [module_path], True, True, None, 'AST')
+    bytecode_imports = PackageManager.ReadPackageImports(module_path, [module_path], True, True, None, 'Bytecode')
+
+    assert tuple(sorted(ast_imports)) == ('os',)
+    assert tuple(sorted(bytecode_imports)) == tuple(sorted(ast_imports))
+
+
+def test_extractors_agree_on_all_contexts(tmp_path):
+    module_path = write_compiled_module(tmp_path)
+    contexts = PackageManager.ImportCollector.CONTEXTS
+
+    assert PackageManager.ReadBytecodeImports(FilePath=module_path, ImportContexts=contexts) is not None
+
+    ast_imports = PackageManager.ReadPackageImports(module_path, [module_path], True, True, contexts, 'AST')
+    bytecode_imports = PackageManager.ReadPackageImports(module_path, [module_path], True, True, contexts, 'Bytecode')
+
+    assert tuple(sorted(bytecode_imports)) == tuple(sorted(ast_imports)) == ('json', 'os', 'winreg', 'yaml')
+
+
+def test_bytecode_path_is_taken_on_all_contexts(tmp_path, monkeypatch):
+    module_path = write_compiled_module(tmp_path)
+
+    def fail_source_extraction(*args, **kwargs):
+        raise AssertionError('source code was parsed')
+
+    monkeypatch.setattr(PackageManager, 'ReadSourceImports', fail_source_extraction)
+
+    results = list(PackageManager.IterPackageImports(module_path, [module_path], True, True, PackageManager.ImportCollector.CONTEXTS, 'Bytecode'))
+
+    assert [(file_path, tuple(sorted(imports)), error) for file_path, imports, error in results] == [(module_path, ('json', 'os', 'winreg', 'yaml'), None)]
+
+
+def test_source_is_parsed_when_bytecode_cannot_be_used(tmp_path, monkeypatch):
+    module_path = write_compiled_module(tmp_path)
+    bytecode_results = []
+    read_bytecode_imports = PackageManager.ReadBytecodeImports
+
+    def spy_bytecode_extraction(*args, **kwargs):
+        bytecode_results.append(read_bytecode_imports(*args, **kwargs))
+        return bytecode_results[-1]
+
+    monkeypatch.setattr(PackageManager, 'ReadBytecodeImports', spy_bytecode_extraction)
+
+    # Default contexts, then stale bytecode
+    assert tuple(PackageManager.ReadPackageImports(module_path, [module_path], True, True, None, 'Bytecode')) == ('os',)
+
+    with open(module_path, 'a') as module_file:
+        module_file.write('import csv\n')
+
+    assert 'csv' in PackageManager.ReadPackageImports(module_path, [module_path], True, True, PackageManager.ImportCollector.CONTEXTS, 'Bytecode')
+    assert bytecode_results == [None, None]
@@ -0,0 +1,137 @@
+import os
+
+import PackageManager
+
+
+def make_file(tmp_path, name='module.py', content='import os\n'):
+    file_path = tmp_path / name
+    file_path.write_text(content)
+
+    return str(file_path).replace('\\', '/')
+
+
+def test_hits_and_misses_are_counted(tmp_path):
+    file_path = make_file(tmp_path)
+    cache = PackageManager.ImportCache(CacheDir=str(tmp_path))
+    fingerprint = cache.Fingerprint(SourceFiles=[file_path])
+
+    assert cache.Get(PackagePath=file_path, Fingerprint=fingerprint, Options='') is None
+    cache.Put(PackagePath=file_path, Fingerprint=fingerprint, Options='', Imports=('os',))
+    assert cache.Get(PackagePath=file_path, Fingerprint=fingerprint, Options='') == ('os',)
+    assert cache.Get(PackagePath=file_path, Fingerprint=fingerprint, Options='') == ('os',)
+
+    assert cache.Stats() == {'Hits': 2, 'Misses': 1, 'HitRatio': 2 / 3}
+
+
+def test_entries_persist_across_instances(tmp_path):
+    file_path = make_file(tmp_path)
+    cache = PackageManager.ImportCache(CacheDir=str(tmp_path))
+    cache.Put(PackagePath=file_path, Fingerprint=cache.Fingerprint(SourceFiles=[file_path]), Options='', Imports=('os',))
+
+    reopened_cache = PackageManager.ImportCache(CacheDir=str(tmp_path))
+
+    assert reopened_cache.Get(PackagePath=file_path, Fingerprint=reopened_cache.Fingerprint(SourceFiles=[file_path]), Options='') == ('os',)
+
+
+def test_size_change_invalidates(tmp_path):
+    file_path = make_file(tmp_path)
+    cache = PackageManager.ImportCache(CacheDir=str(tmp_path))
+    fingerprint = cache.Fingerprint(SourceFiles=[file_path])
+    file_stat = os.stat(file_path)
+
+    # Same modification time, different size
+    make_file(tmp_path, content='import os, sys\n')
+    os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+
+    assert cache.Fingerprint(SourceFiles=[file_path]) != fingerprint
+
+
+def test_mtime_change_invalidates(tmp_path):
+    file_path = make_file(tmp_path)
+    cache = PackageManager.ImportCache(CacheDir=str(tmp_path))
+    fingerprint = cache.Fingerprint(SourceFiles=[file_path])
+    cache.Put(PackagePath=file_path, Fingerprint=fingerprint, Options='', Imports=('os',))
+
+    # Same size, different modification time
+    make_file(tmp_path, content='import re\n')
+    file_stat = os.stat(file_path)
+    os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 10**9))
+
+    assert cache.Get(PackagePath=file_path, Fingerprint=cache.Fingerprint(SourceFiles=[file_path]), Options='') is None
+
+
+def test_unreachable_file_has_no_fingerprint(tmp_path):
+    cache = PackageManager.ImportCache(CacheDir=str(tmp_path))
+
+    assert cache.Fingerprint(SourceFiles=[make_file(tmp_path), str(tmp_path / 'missing.py')]) is None
+
+
+def test_hash_content(tmp_path):
+    file_path = make_file(tmp_path)
+    cache, hash_cache = PackageManager.ImportCache(CacheDir=str(tmp_path)), PackageManager.ImportCache(CacheDir=str(tmp_path), HashContent=True)
+    fingerprint, hash_fingerprint = cache.Fingerprint(SourceFiles=[file_path]), hash_cache.Fingerprint(SourceFiles=[file_path])
+
+    # Touched without changes: only content hashing still matches
+    file_stat = os.stat(file_path)
+    os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 10**9))
+
+    assert cache.Fingerprint(SourceFiles=[file_path]) != fingerprint
+    assert hash_cache.Fingerprint(SourceFiles=[file_path]) == hash_fingerprint
+
+    # Changed with the same size and modification time: only content hashing tells
+    make_file(tmp_path, content='import re\n')
+    os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+
+    assert cache.Fingerprint(SourceFiles=[file_path]) == fingerprint
+    assert hash_cache.Fingerprint(SourceFiles=[file_path]) != hash_fingerprint
+
+
+def test_entries_are_keyed_by_options(tmp_path):
+    file_path = make_file(tmp_path)
+    cache = PackageManager.ImportCache(CacheDir=str(tmp_path))
+    fingerprint = cache.Fingerprint(SourceFiles=[file_path])
+
+    cache.Put(PackagePath=file_path, Fingerprint=fingerprint, Options='IncludeDynamicImports=True', Imports=('os', 'yaml'))
+    cache.Put(PackagePath=file_path, Fingerprint=fingerprint, Options='IncludeDynamicImports=False', Imports=('os',))
+
+    assert cache.Get(PackagePath=file_path, Fingerprint=fingerprint, Options='IncludeDynamicImports=True') == ('os', 'yaml')
+    assert cache.Get(PackagePath=file_path, Fingerprint=fingerprint, Options='IncludeDynamicImports=False') == ('os',)
+    assert cache.Get(PackagePath=file_path, Fingerprint=fingerprint, Options='StrictSearch=True') is None
+
+
+def test_manager_reuses_imports_per_options(tmp_path):
+    cache_dir, script_path = tmp_path / 'cache', make_file(tmp_path, content='import os\n\ndef load():\n    import json\n')
+    cache_dir.mkdir()
+
+    manager = PackageManager.PackageManager(CacheDir=str(cache_dir))
+    top_level_imports = manager.GetImportedPackages(script_path, True, True, False)
+    lazy_imports = manager.GetImportedPackages(script_path, True, True, False, ImportContexts=('TopLevel', 'Lazy'))
+
+    reopened_manager = PackageManager.PackageManager(CacheDir=str(cache_dir))
+
+    assert reopened_manager.GetImportedPackages(script_path, True, True, False) == top_level_imports
+    assert reopened_manager.GetImportedPackages(script_path, True, True, False, ImportContexts=('TopLevel', 'Lazy')) == lazy_imports
+    assert 'json' in lazy_imports and 'json' not in top_level_imports
+    assert (manager.ImportCache.Stats()['Misses'], reopened_manager.ImportCache.Stats()['Hits']) == (2, 2)
+
+
+def test_corrupted_database_is_rebuilt(tmp_path):
+    file_path = make_file(tmp_path)
+    (tmp_path / 'ImportCache.sqlite3').write_bytes(b'not a database' * 100)
+
+    cache = PackageManager.ImportCache(CacheDir=str(tmp_path))
+    fingerprint = cache.Fingerprint(SourceFiles=[file_path])
+    cache.Put(PackagePath=file_path, Fingerprint=fingerprint, Options='', Imports=('os',))
+
+    assert cache.Get(PackagePath=file_path, Fingerprint=fingerprint, Options='') == ('os',)
+
+
+def test_unreadable_database_disables_caching(tmp_path):
+    # A directory cannot be opened as a database, nor be replaced
+    (tmp_path / 'ImportCache.sqlite3').mkdir()
+    script_path = make_file(tmp_path)
+
+    manager = PackageManager.PackageManager(CacheDir=str(tmp_path))
+
+    assert manager.ImportCache is None
+    assert manager.GetImportedPackages(script_path, True, True, False) == ('os',)
@@ -0,0 +1,27 @@
+import PackageManager
+
+
+def test_measures_importable_package():
+    import_cost = PackageManager.MeasureImportCost(PackageName='json')
+
+    assert import_cost['Error'] is None
+    assert 0 < import_cost['Self'] <= import_cost['Cumulative']
+    assert import_cost['Modules'] > 1
+    assert 'json.decoder' in [module_name for module_name, _ in import_cost['Heaviest']]
+
+
+def test_failed_import_has_no_metrics():
+    import_cost = PackageManager.MeasureImportCost(PackageName='pm_package_that_does_not_exist')
+
+    assert import_cost['Error'].startswith('ModuleNotFoundError')
+    assert (import_cost['Self'], import_cost['Cumulative'], import_cost['RSS']) == (None, None, None)
+    assert (import_cost['Modules'], import_cost['Heaviest']) == (0, [])
+
+
+def test_failed_imports_are_not_ranked(capsys):
+    manager = PackageManager.PackageManager(CacheDir=False)
+    import_costs = manager.ProfileImports(PackagesNames=['pm_package_that_does_not_exist', 'json'], LazyThreshold=1000)
+
+    assert [import_cost['Package'] for import_cost in import_costs] == ['json']
+    assert import_costs[0]['LazyCandidate'] is False
+    assert 'pm_package_that_does_not_exist' in capsys.readouterr().out
@@ -0,0 +1,79 @@
+import PackageManager
+
+
+def make_cyclic_graph():
+    # __main__ -> app -> core -> utils -> core (cycle), utils -> yaml.loader, tools -> tools (self import)
+    graph = PackageManager.ImportGraph(Root='__main__', RootPath='/project/main.py')
+    graph.AddImports(Name='__main__', Imports=['app', 'tools'])
+    graph.AddImports(Name='app', Imports=['core'], Path='/project/app.py')
+    graph.AddImports(Name='core', Imports=['utils'], Path='/project/core.py')
+    graph.AddImports(Name='utils', Imports=['core', 'yaml.loader'], Path='/project/utils.py')
+    graph.AddImports(Name='tools', Imports=['tools', 'app'], Path='/project/tools.py')
+
+    return graph
+
+
+def test_strongly_connected_components():
+    graph = make_cyclic_graph()
+
+    assert graph.GetStronglyConnectedComponents() == [('core', 'utils'), ('tools',)]
+
+
+def test_why_path_is_the_shortest_chain():
+    graph = make_cyclic_graph()
+
+    assert [link['Package'] for link in graph.GetWhyPath(Name='yaml')] == ['__main__', 'app', 'core', 'utils', 'yaml.loader']
+    assert graph.GetWhyPath(Name='utils')[-1] == {'Package': 'utils', 'Path': '/project/utils.py'}
+    assert graph.GetWhyPath(Name='missing') == []
+
+
+def test_dependencies_and_dependents_through_cycles():
+    graph = make_cyclic_graph()
+
+    assert graph.GetDependencies(Name='core') == ('utils',)
+    assert graph.GetDependencies(Name='core', Transitive=True) == ('utils', 'yaml.loader')
+    assert graph.GetDependents(Name='core') == ('app', 'utils')
+    assert graph.GetDependents(Name='yaml', Transitive=True) == ('__main__', 'app', 'core', 'tools', 'utils')
+    assert graph.GetDependents(Name='tools', Transitive=True) == ('__main__',)
+
+
+def test_save_and_load(tmp_path):
+    source_path = tmp_path / 'main.py'
+    source_path.write_text('import app\n')
+    graph_path = str(tmp_path / 'graph.json')
+
+    graph = make_cyclic_graph()
+    graph.Save(FilePath=graph_path, SourceFiles=[str(source_path)], Options='DeepScan=True')
+    loaded_graph = PackageManager.ImportGraph.Load(FilePath=graph_path, Options='DeepScan=True')
+
+    assert (loaded_graph.Root, loaded_graph.Nodes, loaded_graph.Paths, loaded_graph.SourceFiles) == (graph.Root, graph.Nodes, graph.Paths, [str(source_path)])
+    assert loaded_graph.GetStronglyConnectedComponents() == graph.GetStronglyConnectedComponents()
+    assert loaded_graph.GetDependents(Name='yaml', Transitive=True) == graph.GetDependents(Name='yaml', Transitive=True)
+
+    # Different options, then changed sources
+    assert PackageManager.ImportGraph.Load(FilePath=graph_path, Options='DeepScan=False') is None
+
+    source_path.write_text('import app, tools\n')
+
+    assert PackageManager.ImportGraph.Load(FilePath=graph_path, Options='DeepScan=True') is None
+    assert PackageManager.ImportGraph.Load(FilePath=graph_path, Options='DeepScan=True', Validate=False) is not None
+    assert PackageManager.ImportGraph.Load(FilePath=str(tmp_path / 'missing.json')) is None
+
+
+def test_long_chain_does_not_recurse():
+    # Deeper than the recursion limit: a recursive search would fail
+    nodes = 20000
+    graph = PackageManager.ImportGraph()
+    graph.AddImports(Name='__main__', Imports=['node_0'])
+
+    for index in range(nodes - 1):
+        graph.AddImports(Name=f'node_{index}', Imports=[f'node_{index + 1}'])
+
+    assert graph.GetStronglyConnectedComponents() == []
+
+    # Closing the chain makes it a single component
+    graph.AddImports(Name=f'node_{nodes - 1}', Imports=['node_0'])
+    components = graph.GetStronglyConnectedComponents()
+
+    assert len(components) == 1 and len(components[0]) == nodes
+    assert len(graph.GetWhyPath(Name=f'node_{nodes - 1}')) == nodes + 1
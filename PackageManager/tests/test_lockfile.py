@@ -0,0 +1,69 @@
+import importlib.metadata, sys
+
+import pytest
+
+import PackageManager
+
+
+PYTEST_REQUIREMENT = f"pytest=={importlib.metadata.version('pytest')}"
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    script_path = tmp_path / 'main.py'
+    script_path.write_text('import os\n')
+
+    # The manager analyzes the '__main__' script
+    monkeypatch.setattr(sys.modules['__main__'], '__file__', str(script_path), raising=False)
+    monkeypatch.delenv('PACKAGEMANAGER_FORCE_RESCAN', raising=False)
+
+    return script_path
+
+
+def write_lockfile(script_path, requirements):
+    lockfile_path = f'{script_path.parent}/requirements-by-main.py.txt'
+    PackageManager.RequirementsLock(FilePath=lockfile_path, ProjectDir=str(script_path.parent)).Write(Requirements=requirements, SourceFiles=[str(script_path)])
+
+    return lockfile_path
+
+
+def is_scanned(**kwargs):
+    manager = PackageManager.PackageManager(CacheDir=False)
+    manager.AutoImportMissings(DeepScan=False, UseLockfile=True, **kwargs)
+
+    return manager.Stats.ToDict()['Phases']['Analysis']['Count'] > 0
+
+
+def test_fresh_and_satisfied_lockfile_skips_analysis(project):
+    lockfile_path = write_lockfile(project, [PYTEST_REQUIREMENT])
+
+    assert PackageManager.RequirementsLock(FilePath=lockfile_path, ProjectDir=str(project.parent)).IsFresh()
+    assert not is_scanned()
+
+
+def test_stale_lockfile_is_not_used(project):
+    write_lockfile(project, [PYTEST_REQUIREMENT])
+    project.write_text('import os, sys\n')
+
+    assert is_scanned()
+
+
+@pytest.mark.parametrize('requirement', ['pmlockfile-missing==1.0', 'pytest==0.0.1', 'pytest<1'])
+def test_unsatisfied_lockfile_is_not_used(project, requirement):
+    write_lockfile(project, [PYTEST_REQUIREMENT, requirement])
+
+    assert is_scanned()
+
+
+def test_missing_lockfile_is_not_used(project):
+    assert is_scanned()
+
+
+def test_force_rescan_ignores_lockfile(project, monkeypatch):
+    write_lockfile(project, [PYTEST_REQUIREMENT])
+
+    assert is_scanned(ForceRescan=True)
+
+    monkeypatch.setenv('PACKAGEMANAGER_FORCE_RESCAN', '1')
+
+    assert is_scanned()
@@ -0,0 +1,38 @@
+import sys
+
+import PackageManager
+
+
+def make_project(tmp_path):
+    project_dir = tmp_path / 'svc'
+    site_dir = project_dir / '.venv' / 'lib' / 'python3' / 'site-packages'
+
+    for package_dir in (site_dir / 'fancylib', project_dir / 'helpers', project_dir / 'src' / 'inner'):
+        package_dir.mkdir(parents=True)
+        (package_dir / '__init__.py').write_text('')
+
+    (project_dir / 'localmod.py').write_text('')
+    (project_dir / 'data').mkdir()
+
+    return project_dir, site_dir
+
+
+def test_modules_resolved_from_project_dir(tmp_path):
+    project_dir, _ = make_project(tmp_path)
+
+    assert PackageManager.IsProjectModule(ModuleName='helpers', ProjectDir=str(project_dir))
+    assert PackageManager.IsProjectModule(ModuleName='localmod.sub', ProjectDir=str(project_dir))
+    assert PackageManager.IsProjectModule(ModuleName='data', ProjectDir=str(project_dir))
+
+
+def test_src_layout_belongs_to_project(tmp_path):
+    project_dir, _ = make_project(tmp_path)
+
+    assert PackageManager.IsProjectModule(ModuleName='inner', ProjectDir=str(project_dir), ModulePath=str(project_dir / 'src' / 'inner' / '__init__.py'))
+
+
+def test_virtual_environment_inside_project_is_installed(tmp_path):
+    project_dir, site_dir = make_project(tmp_path)
+
+    assert not PackageManager.IsProjectModule(ModuleName='fancylib', ProjectDir=str(project_dir), ModulePath=str(site_dir / 'fancylib' / '__init__.py'))
+    assert not PackageManager.IsProjectModule(ModuleName='yaml', ProjectDir=str(project_dir), ModulePath=sys.modules['os'].__file__)
@@ -0,0 +1,253 @@
+import pytest
+
+import PackageManager
+
+try:
+    from packaging.markers import Marker
+    from packaging.requirements import Requirement
+    from packaging.specifiers import SpecifierSet
+    from packaging.version import Version
+except ImportError:
+    Marker = Requirement = SpecifierSet = Version = None
+
+
+# (lower, higher): every pair is strictly ordered
+VERSION_ORDER = [
+    ('1.0.dev1', '1.0a1'),
+    ('1.0a1', '1.0a2.dev1'),
+    ('1.0a2', '1.0b1'),
+    ('1.0b2', '1.0rc1'),
+    ('1.0c2', '1.0rc3'),
+    ('1.0rc1', '1.0'),
+    ('1.0', '1.0.post1.dev1'),
+    ('1.0.post1.dev1', '1.0.post1'),
+    ('1.0.post1', '1.0.1'),
+    ('1.0-1', '1.0.post2'),
+    ('1.9', '1.10'),
+    ('2.0', '1!0.1'),
+    ('1!1.0', '1!1.0.post1'),
+]
+
+# (version, equivalent version)
+VERSION_EQUALITY = [
+    ('1.0', '1'),
+    ('1.0.0', '1'),
+    ('1.0alpha1', '1.0a1'),
+    ('1.0-beta.2', '1.0b2'),
+    ('1.0pre1', '1.0rc1'),
+    ('1.0preview1', '1.0rc1'),
+    ('1.0-rev3', '1.0.post3'),
+    ('1.0r', '1.0.post0'),
+    ('1.0-dev', '1.0.dev0'),
+    ('v1.0', '1.0'),
+    ('0!1.0', '1.0'),
+    ('1.0+local.7', '1.0'),
+    ('1.0+ubuntu-1', '1.0'),
+]
+
+INVALID_VERSIONS = ['', 'latest', '1.0-', '1..0', '1.0+', 'one', '1.0a1a2']
+
+# (version, specifier, expected)
+SPECIFIERS = [
+    ('2.31.0', '', True),
+    ('2.31.0', '>=2.0,<3', True),
+    ('3.0', '>=2.0,<3', False),
+    ('1.0', '==1', True),
+    ('1.0.post1', '==1.0', False),
+    ('1.0+local', '==1.0', True),
+    ('1.0', '!=1.0', False),
+    ('1.0.1', '!=1.0', True),
+    ('1.0', '===1.0', True),
+    ('1.0.0', '===1.0', False),
+    ('2.2', '~=2.2', True),
+    ('2.9', '~=2.2', True),
+    ('3.0', '~=2.2', False),
+    ('2.1', '~=2.2', False),
+    ('1.4.9', '~=1.4.5', True),
+    ('1.5.0', '~=1.4.5', False),
+    ('2.2.post1', '~=2.2', True),
+    ('1!2.3', '~=1!2.2', True),
+    ('2.3', '~=1!2.2', False),
+    ('2.0', '==2.*', True),
+    ('2.5.1', '==2.*', True),
+    ('2.0rc1', '==2.*', True),
+    ('3.0', '==2.*', False),
+    ('20.0', '==2.*', False),
+    ('1.4.5', '==1.4.*', True),
+    ('1.40', '==1.4.*', False),
+    ('2.5', '!=2.*', False),
+    ('3.0', '!=2.*', True),
+    ('1!2.0', '==2.*', False),
+    ('1.1', '<=1.1', True),
+    ('1.1.post1', '<=1.1', False),
+    ('1.1', '>=1.1', True),
+    ('1.1rc1', '>=1.1', False),
+    # '<V' does not match pre-releases of V, unless V is itself a pre-release
+    ('1.0', '<2.0', True),
+    ('2.0rc1', '<2.0', False),
+    ('2.0.dev1', '<2.0', False),
+    ('1.9.post1', '<2.0', True),
+    ('2.0a1', '<2.0rc1', True),
+    ('2.0.dev1', '<2.0a1', True),
+    # '>V' does not match post-releases of V, unless V is itself a post-release
+    ('2.0.1', '>2.0', True),
+    ('2.0.post1', '>2.0', False),
+    ('2.0.post2', '>2.0.post1', True),
+    ('2.0.1rc1', '>2.0', True),
+    ('2.0', '>2.0rc1', True),
+    ('2.0', '>1!0.5', False),
+    ('1!2.0', '>1.0', True),
+]
+
+INVALID_SPECIFIERS = ['=>1.0', '1.0', '==', '>=1.0,,<2 x']
+
+MARKER_ENVIRONMENT = {
+    'implementation_name': 'cpython',
+    'implementation_version': '3.11.7',
+    'os_name': 'posix',
+    'platform_machine': 'x86_64',
+    'platform_python_implementation': 'CPython',
+    'platform_release': '6.8.0',
+    'platform_system': 'Linux',
+    'platform_version': '#1 SMP',
+    'python_full_version': '3.11.7',
+    'python_version': '3.11',
+    'sys_platform': 'linux',
+}
+
+# (marker, extras, expected)
+MARKERS = [
+    ('python_version >= "3.8"', (), True),
+    ('python_version < "3.11"', (), False),
+    ('python_version > "3.9"', (), True),
+    ("python_version == '3.11'", (), True),
+    ('python_version != "3.11"', (), False),
+    ('python_version ~= "3.8"', (), True),
+    ('python_full_version === "3.11.7"', (), True),
+    ('"3.8" <= python_version', (), True),
+    ('sys_platform == "win32"', (), False),
+    ('sys_platform == "linux" and python_version >= "3.8"', (), True),
+    ('sys_platform == "win32" or python_version >= "3.8"', (), True),
+    ('sys_platform == "win32" or os_name == "nt" and python_version >= "3.8"', (), False),
+    ('sys_platform == "linux" or os_name == "nt" and python_version < "3"', (), True),
+    ('(sys_platform == "linux" or os_name == "nt") and python_version < "3"', (), False),
+    ('((sys_platform == "linux"))', (), True),
+    ('"linux" in sys_platform', (), True),
+    ('"lin" in sys_platform', (), True),
+    ('"win" not in sys_platform', (), True),
+    ('platform_machine not in "x86_64 AMD64"', (), False),
+    ('platform_python_implementation != "PyPy"', (), True),
+    ('extra == "socks"', (), False),
+    ('extra == "socks"', ('socks',), True),
+    ('extra == "Socks"', ('socks',), True),
+    ('extra == "dev-tools"', ('Dev_Tools',), True),
+    ('extra == "socks"', ('http2', 'socks'), True),
+    ('extra != "socks"', ('http2',), True),
+    ('"socks" == extra', ('socks',), True),
+    ('python_version >= "3" and extra == "socks"', ('socks',), True),
+    ('python_version < "3" and extra == "socks"', ('socks',), False),
+]
+
+INVALID_MARKERS = ['python_version >=', 'python_version >= "3.8" and', '(python_version >= "3.8"', 'unknown_variable == "1"', 'python_version = "3.8"', 'python_version >= "3.8")']
+
+# (requirement, name, extras, specifier, URL, marker)
+REQUIREMENTS = [
+    ('requests', 'requests', (), '', None, None),
+    ('requests>=2.0', 'requests', (), '>=2.0', None, None),
+    ('requests >= 2.0, < 3', 'requests', (), '>= 2.0, < 3', None, None),
+    ('urllib3[socks] (<3,>=1.21.1) ; extra == "socks"', 'urllib3', ('socks',), '<3,>=1.21.1', None, 'extra == "socks"'),
+    ('Foo.Bar_baz[a, b]==1.0;python_version<"3.12"', 'Foo.Bar_baz', ('a', 'b'), '==1.0', None, 'python_version<"3.12"'),
+    ('pkg @ https://example.com/pkg-1.0.tar.gz', 'pkg', (), '', 'https://example.com/pkg-1.0.tar.gz', None),
+    ('pkg[extra]@file:///tmp/pkg-1.0-py3-none-any.whl', 'pkg', ('extra',), '', 'file:///tmp/pkg-1.0-py3-none-any.whl', None),
+    ('pkg @ https://example.com/pkg.zip ; python_version >= "3.8"', 'pkg', (), '', 'https://example.com/pkg.zip', 'python_version >= "3.8"'),
+    ('pkg @ https://example.com/pkg.zip;sha256=0 ; os_name == "posix"', 'pkg', (), '', 'https://example.com/pkg.zip;sha256=0', 'os_name == "posix"'),
+    ('pkg @ git+https://example.com/pkg.git@v1.0#egg=pkg', 'pkg', (), '', 'git+https://example.com/pkg.git@v1.0#egg=pkg', None),
+]
+
+INVALID_REQUIREMENTS = ['', '>=1.0', '[extra] pkg', 'pkg @', 'pkg @ ; os_name == "posix"']
+
+
+@pytest.mark.parametrize('lower, higher', VERSION_ORDER)
+def test_parse_version_order(lower, higher):
+    assert PackageManager.ParseVersion(lower) < PackageManager.ParseVersion(higher)
+
+    if Version is not None:
+        assert Version(lower) < Version(higher)
+
+
+@pytest.mark.parametrize('version, equivalent', VERSION_EQUALITY)
+def test_parse_version_equality(version, equivalent):
+    assert PackageManager.ParseVersion(version) == PackageManager.ParseVersion(equivalent)
+
+    # Local labels are ignored by 'ParseVersion', not by 'packaging'
+    if Version is not None and '+' not in version:
+        assert Version(version) == Version(equivalent)
+
+
+@pytest.mark.parametrize('version', INVALID_VERSIONS)
+def test_parse_version_invalid(version):
+    assert PackageManager.ParseVersion(version) is None
+
+
+@pytest.mark.parametrize('version, specifier, expected', SPECIFIERS)
+def test_is_version_satisfied(version, specifier, expected):
+    assert PackageManager.IsVersionSatisfied(Version=version, Specifier=specifier) is expected
+
+    if SpecifierSet is not None:
+        assert SpecifierSet(specifier).contains(version, prereleases=True) is expected
+
+
+@pytest.mark.parametrize('specifier', INVALID_SPECIFIERS)
+def test_is_version_satisfied_invalid(specifier):
+    with pytest.raises(ValueError):
+        PackageManager.IsVersionSatisfied(Version='1.0', Specifier=specifier)
+
+
+@pytest.mark.parametrize('marker, extras, expected', MARKERS)
+def test_evaluate_marker(marker, extras, expected):
+    assert PackageManager.EvaluateMarker(Marker=marker, Environment=MARKER_ENVIRONMENT, Extras=extras) is expected
+
+    if Marker is not None:
+        assert any([Marker(marker).evaluate(dict(MARKER_ENVIRONMENT, extra=extra)) for extra in (extras or ('',))]) is expected
+
+
+@pytest.mark.parametrize('marker', INVALID_MARKERS)
+def test_evaluate_marker_invalid(marker):
+    with pytest.raises(ValueError):
+        PackageManager.EvaluateMarker(Marker=marker, Environment=MARKER_ENVIRONMENT)
+
+
+@pytest.mark.parametrize('requirement, name, extras, specifier, url, marker', REQUIREMENTS)
+def test_parse_requirement(requirement, name, extras, specifier, url, marker):
+    assert PackageManager.ParseRequirement(Requirement=requirement) == {'Name': name, 'Extras': extras, 'Specifier': specifier, 'URL': url, 'Marker': marker}
+
+    if Requirement is not None:
+        parsed_requirement = Requirement(requirement)
+
+        assert (parsed_requirement.name, parsed_requirement.url) == (name, url)
+        assert sorted(parsed_requirement.extras) == sorted(extras)
+        assert parsed_requirement.specifier == SpecifierSet(specifier)
+        assert parsed_requirement.marker == (Marker(marker) if marker is not None else None)
+
+
+@pytest.mark.parametrize('requirement', INVALID_REQUIREMENTS)
+def test_parse_requirement_invalid(requirement):
+    with pytest.raises(ValueError):
+        PackageManager.ParseRequirement(Requirement=requirement)
+
+
+def test_direct_references_are_satisfied_by_name(tmp_path):
+    distributions = PackageManager.DistributionIndex()
+    installed_name = next(iter(distributions.Distributions))
+
+    requirements_lock = PackageManager.RequirementsLock(FilePath=str(tmp_path / 'requirements.txt'), ProjectDir=str(tmp_path))
+    requirements_lock.Requirements = [f'{installed_name} @ https://example.com/{installed_name}.zip', 'pmrequirements-missing @ https://example.com/missing.zip']
+
+    assert requirements_lock.GetUnsatisfiedRequirements(Distributions=distributions) == ('pmrequirements-missing @ https://example.com/missing.zip',)
+
+
+def test_requirements_file_keeps_url_fragments(tmp_path):
+    requirements_path = tmp_path / 'requirements.txt'
+    requirements_path.write_text('# Sources: 0\npkg @ git+https://example.com/pkg.git#egg=pkg  # pinned\nrequests>=2.0\n')
+
+    assert PackageManager.RequirementsLock(FilePath=str(requirements_path), ProjectDir=str(tmp_path)).Requirements == ['pkg @ git+https://example.com/pkg.git#egg=pkg', 'requests>=2.0']
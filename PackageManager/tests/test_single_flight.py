@@ -0,0 +1,114 @@
+import multiprocessing, os, subprocess, sys, textwrap, time
+
+import PackageManager
+
+
+PROCESSES = 6
+
+
+def run_flight(LockDir, ScriptPath, FailedPackages, Timeout, Barrier, Results):
+    # Same protocol as 'AutoImportMissings(SingleFlight=...)': acquire, reuse a published result, or run and publish
+    Barrier.wait()
+
+    single_flight = PackageManager.SingleFlightLock(LockDir=LockDir, ScriptPath=ScriptPath)
+    wait_started = time.time()
+
+    if not single_flight.Acquire(Timeout=Timeout):
+        Results.put('Timeout')
+        return
+
+    try:
+        if single_flight.GetPublishedResult(NotBefore=wait_started) is not None:
+            Results.put('Follower')
+            return
+
+        # Scanning and installing, long enough for every other process to wait for the lock
+        time.sleep(0.5)
+        single_flight.Publish(SourceFiles=[ScriptPath], MissingPackages=('yaml',), FailedPackages=set(FailedPackages))
+        Results.put('Leader')
+
+    finally:
+        single_flight.Release()
+
+
+def fly(lock_dir, script_path, processes=PROCESSES, failed_packages=(), timeout=30):
+    context = multiprocessing.get_context('spawn')
+    barrier, results = context.Barrier(processes), context.Queue()
+    flights = [context.Process(target=run_flight, args=(lock_dir, script_path, tuple(failed_packages), timeout, barrier, results)) for _ in range(processes)]
+
+    for flight in flights:
+        flight.start()
+
+    roles = sorted([results.get(timeout=60) for _ in flights])
+
+    for flight in flights:
+        flight.join(timeout=60)
+
+    return roles
+
+
+def make_script(tmp_path):
+    script_path = tmp_path / 'main.py'
+    script_path.write_text('import os\n')
+
+    return str(script_path).replace('\\', '/')
+
+
+def test_single_leader_is_elected(tmp_path):
+    script_path = make_script(tmp_path)
+
+    assert fly(str(tmp_path), script_path) == ['Follower'] * (PROCESSES - 1) + ['Leader']
+
+
+def test_successful_result_is_reused_by_later_flights(tmp_path):
+    script_path = make_script(tmp_path)
+    fly(str(tmp_path), script_path, processes=1)
+
+    assert fly(str(tmp_path), script_path, processes=2) == ['Follower', 'Follower']
+
+
+def test_failed_result_is_only_reused_by_waiting_processes(tmp_path):
+    script_path = make_script(tmp_path)
+
+    # Processes waiting for the failed run reuse it, the next flight installs again
+    assert fly(str(tmp_path), script_path, failed_packages=('yaml',)) == ['Follower'] * (PROCESSES - 1) + ['Leader']
+    assert fly(str(tmp_path), script_path, processes=1, failed_packages=('yaml',)) == ['Leader']
+
+
+def test_waiting_times_out(tmp_path):
+    script_path = make_script(tmp_path)
+    holder = PackageManager.SingleFlightLock(LockDir=str(tmp_path), ScriptPath=script_path)
+
+    assert holder.Acquire(Timeout=1)
+
+    try:
+        assert fly(str(tmp_path), script_path, processes=2, timeout=0.5) == ['Timeout', 'Timeout']
+    finally:
+        holder.Release()
+
+    assert fly(str(tmp_path), script_path, processes=1) == ['Leader']
+
+
+def test_auto_import_missings_runs_once(tmp_path):
+    lock_dir = tmp_path / 'locks'
+    lock_dir.mkdir()
+    script_path = tmp_path / 'main.py'
+    script_path.write_text(textwrap.dedent(f'''
+        import os, sys, time
+        sys.path.insert(0, {os.path.dirname(os.path.dirname(os.path.abspath(__file__)))!r})
+        import PackageManager
+
+        manager = PackageManager.PackageManager(CacheDir=False)
+
+        # Every process starts waiting before the leader publishes
+        time.sleep(max(0.0, float(sys.argv[1]) - time.time()))
+        manager.AutoImportMissings(DeepScan=False, SingleFlight={str(lock_dir)!r}, SingleFlightTimeout=60)
+        print('Leader' if (manager.Stats.ToDict()['Phases']['Analysis']['Count'] > 0) else 'Follower')
+    '''))
+
+    start_at = str(time.time() + 2)
+    runs = [subprocess.Popen([sys.executable, str(script_path), start_at], env=dict(os.environ, PACKAGEMANAGER_MODE='off'), stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, text=True) for _ in range(PROCESSES)]
+    roles = sorted([run.communicate(timeout=120)[0].strip().splitlines()[-1] for run in runs])
+
+    assert roles.count('Leader') == 1
+    assert roles.count('Follower') == PROCESSES - 1
@@ -0,0 +1,49 @@
+import PackageManager
+
+
+class FinishedProcess:
+    def communicate(self):
+        return (b'', b'')
+
+    def wait(self):
+        return 0
+
+
+def record_upgrades(monkeypatch):
+    commands = []
+
+    def fake_popen(command, *args, **kwargs):
+        commands.append(list(command))
+        return FinishedProcess()
+
+    monkeypatch.setattr(PackageManager.subprocess, 'Popen', fake_popen)
+
+    return commands
+
+
+def test_attempts_are_kept_in_memory_without_cache(tmp_path, monkeypatch):
+    home_dir = tmp_path / 'home'
+    home_dir.mkdir()
+    monkeypatch.setenv('HOME', str(home_dir))
+    monkeypatch.setenv('XDG_CACHE_HOME', str(home_dir / '.cache'))
+    commands = record_upgrades(monkeypatch)
+
+    manager = PackageManager.PackageManager(CacheDir=False)
+
+    assert manager.UpgradePIP(False) == 0
+    assert manager.UpgradePIP(False) == 0
+    assert len(commands) == 1
+    assert list(home_dir.iterdir()) == []
+
+    # Another instance does not know about the attempt
+    assert PackageManager.PackageManager(CacheDir=False).UpgradePIP(False) == 0
+    assert len(commands) == 2
+
+
+def test_attempts_are_recorded_in_cache_directory(tmp_path, monkeypatch):
+    commands = record_upgrades(monkeypatch)
+
+    assert PackageManager.PackageManager(CacheDir=str(tmp_path)).UpgradePIP(False) == 0
+    assert PackageManager.PackageManager(CacheDir=str(tmp_path)).UpgradePIP(False) == 0
+    assert len(commands) == 1
+    assert len(list(tmp_path.glob('PipUpgrade-*.json'))) == 1
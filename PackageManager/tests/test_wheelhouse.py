@@ -0,0 +1,61 @@
+import base64, hashlib, zipfile
+
+import PackageManager
+
+
+NAME, VERSION = 'pmwheelhouse_probe', '1.0'
+
+
+def build_wheel(wheelhouse_dir):
+    dist_info = f'{NAME}-{VERSION}.dist-info'
+    files = {
+        f'{NAME}/__init__.py': 'VALUE = 1\n',
+        f'{dist_info}/METADATA': f'Metadata-Version: 2.1\nName: {NAME}\nVersion: {VERSION}\n',
+        f'{dist_info}/WHEEL': 'Wheel-Version: 1.0\nGenerator: tests\nRoot-Is-Purelib: true\nTag: py3-none-any\n',
+    }
+
+    record = []
+
+    for file_name, content in files.items():
+        digest = base64.urlsafe_b64encode(hashlib.sha256(content.encode()).digest()).rstrip(b'=').decode()
+        record.append(f'{file_name},sha256={digest},{len(content.encode())}')
+
+    record.append(f'{dist_info}/RECORD,,')
+    files[f'{dist_info}/RECORD'] = '\n'.join(record) + '\n'
+
+    wheel_path = wheelhouse_dir / f'{NAME}-{VERSION}-py3-none-any.whl'
+
+    with zipfile.ZipFile(wheel_path, 'w') as wheel:
+        for file_name, content in files.items():
+            wheel.writestr(file_name, content)
+
+    return wheel_path
+
+
+def test_install_from_wheelhouse_offline(tmp_path, monkeypatch):
+    wheelhouse_dir, target_dir = tmp_path / 'wheelhouse', tmp_path / 'target'
+    wheelhouse_dir.mkdir()
+    build_wheel(wheelhouse_dir)
+
+    # Installed into a target directory, any attempt to reach an index fails
+    monkeypatch.setenv('PIP_TARGET', str(target_dir))
+    monkeypatch.setenv('PIP_INDEX_URL', 'http://127.0.0.1:9/simple')
+    monkeypatch.setenv('PIP_DISABLE_PIP_VERSION_CHECK', '1')
+
+    commands = []
+    popen = PackageManager.subprocess.Popen
+
+    def record_popen(command, *args, **kwargs):
+        commands.append(list(command))
+        return popen(command, *args, **kwargs)
+
+    monkeypatch.setattr(PackageManager.subprocess, 'Popen', record_popen)
+
+    manager = PackageManager.PackageManager(CacheDir=False, Wheelhouse=str(wheelhouse_dir))
+    installation = manager.InstallPackage(NAME, 'latest', False)
+
+    assert len(commands) == 1
+    assert commands[0][commands[0].index('--no-index') + 1] == '--find-links'
+    assert commands[0][commands[0].index('--find-links') + 1] == manager.Wheelhouse
+    assert installation['ExitCode'] == 0, installation['ExitMessage']
+    assert (target_dir / NAME / '__init__.py').is_file()